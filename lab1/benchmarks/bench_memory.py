@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import argparse
+import gc
+import sys
+import tracemalloc
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from application import SessionService
+
+
+def measure(count: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    sessions = [
+        SessionService.create_process(
+            student_name=f"Student {seed}",
+            student_intelligence=seed % 3 + 1,
+            seed=seed,
+        )
+        for seed in range(count)
+    ]
+    for process in sessions:
+        process.perform_action(process.get_available_actions()[0])
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (after - before) / count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Per-session memory footprint of DefenseProcess")
+    parser.add_argument("--sessions", type=int, default=100_000)
+    args = parser.parse_args()
+
+    per_session = measure(args.sessions)
+    print(f"sessions:         {args.sessions}")
+    print(f"bytes per session: {per_session:.0f}")
+    print(f"total:            {per_session * args.sessions / 2 ** 20:.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
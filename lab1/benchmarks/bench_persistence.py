@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from application import SessionService
+
+
+def run(journal: bool, sessions: int) -> tuple[int, float]:
+    actions = 0
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        service = SessionService(tmp_dir, journal=journal)
+        start = time.perf_counter()
+        for seed in range(sessions):
+            rng = random.Random(seed)
+            service.start_new(slot=1, student_name="Bench", student_intelligence=2, seed=seed)
+            while not service.is_finished():
+                service.perform_action(rng.choice(service.get_available_actions()))
+                actions += 1
+        service.close()
+        elapsed = time.perf_counter() - start
+    return actions, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Per-action persistence cost of SessionService")
+    parser.add_argument("--sessions", type=int, default=2_000)
+    args = parser.parse_args()
+
+    for label, journal in (("snapshot", False), ("journal", True)):
+        actions, elapsed = run(journal, args.sessions)
+        print(f"{label:<9} actions={actions} total={elapsed:.2f}s "
+              f"per_action={elapsed / actions * 1e6:.1f}us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import argparse
+import io
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from application import SessionService
+from interfaces.cli import render_ui
+from interfaces.timeline import Timeline
+
+from rich.console import Console
+
+
+def run(frames: int, cached: bool, width: int) -> float:
+    console = Console(file=io.StringIO(), force_terminal=True, width=width)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        service = SessionService(tmp_dir, autosave=False)
+        service.start_new(slot=1, student_name="Bench", student_intelligence=2, seed=1)
+        Timeline.clear_cache()
+        start = time.perf_counter()
+        for frame in range(frames):
+            # Step through the session so every day of the timeline is drawn.
+            if service.is_finished():
+                service.start_new(slot=1, student_name="Bench", student_intelligence=2, seed=frame)
+            else:
+                service.perform_action(service.get_available_actions()[0])
+            if not cached:
+                Timeline.clear_cache()
+            console.print(render_ui(service))
+            console.file.seek(0)
+            console.file.truncate()
+        return (time.perf_counter() - start) / frames
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="render_ui frame time with and without the timeline cache")
+    parser.add_argument("--frames", type=int, default=500)
+    parser.add_argument("--width", type=int, default=120)
+    args = parser.parse_args()
+
+    uncached = run(args.frames, cached=False, width=args.width)
+    cached = run(args.frames, cached=True, width=args.width)
+    print(f"uncached timeline: {uncached * 1e3:6.2f}ms/frame")
+    print(f"cached timeline:   {cached * 1e3:6.2f}ms/frame ({uncached / cached:.2f}x)")
+    print(Timeline.cache_info())
+
+
+if __name__ == "__main__":
+    main()
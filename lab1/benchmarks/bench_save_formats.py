@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from application import SAVE_CODECS, SessionService
+
+
+def run(save_format: str, slots: int) -> tuple[float, float, int]:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        service = SessionService(tmp_dir, save_format=save_format)
+        start = time.perf_counter()
+        for slot in range(1, slots + 1):
+            service.start_new(slot=slot, student_name=f"Student {slot}",
+                              student_intelligence=slot % 3 + 1, seed=slot)
+        save_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for slot in range(1, slots + 1):
+            service.load(slot)
+        load_time = time.perf_counter() - start
+
+        size = sum(path.stat().st_size for path in Path(tmp_dir).iterdir())
+    return save_time, load_time, size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Save/load latency and size per save format")
+    parser.add_argument("--slots", type=int, default=100_000)
+    args = parser.parse_args()
+
+    for save_format in SAVE_CODECS:
+        save_time, load_time, size = run(save_format, args.slots)
+        print(f"{save_format:<7} save={save_time / args.slots * 1e6:7.1f}us "
+              f"load={load_time / args.slots * 1e6:7.1f}us "
+              f"size={size / args.slots:6.0f}B/slot total={size / 2 ** 20:.1f}MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+
+
+async def client(unix_path: Path, slot: int, latencies: list[float]) -> None:
+    reader, writer = await asyncio.open_unix_connection(str(unix_path))
+    rng = random.Random(slot)
+
+    async def call(**payload: object) -> dict[str, object]:
+        start = time.perf_counter()
+        writer.write(json.dumps(payload).encode("utf-8") + b"\n")
+        await writer.drain()
+        response = json.loads(await reader.readline())
+        latencies.append(time.perf_counter() - start)
+        if not response["ok"]:
+            raise RuntimeError(response["error"])
+        return response
+
+    await call(cmd="start", slot=slot, name=f"Client {slot}", intelligence=2, seed=slot)
+    while True:
+        actions = (await call(cmd="actions", slot=slot))["actions"]
+        if not actions:
+            break
+        await call(cmd="perform", slot=slot, action=rng.choice(actions))
+    writer.close()
+    await writer.wait_closed()
+
+
+async def run(unix_path: Path, clients: int) -> tuple[list[float], float]:
+    latencies: list[float] = []
+    start = time.perf_counter()
+    await asyncio.gather(*(client(unix_path, slot, latencies) for slot in range(1, clients + 1)))
+    return latencies, time.perf_counter() - start
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Request latency of the session server")
+    parser.add_argument("--clients", type=int, default=1_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        unix_path = Path(tmp_dir) / "server.sock"
+        server = subprocess.Popen(
+            [sys.executable, str(ROOT_DIR / "server.py"), "--unix", str(unix_path),
+             "--saves-dir", str(Path(tmp_dir) / "saves")],
+            stdout=subprocess.DEVNULL,
+        )
+        try:
+            while not unix_path.exists():
+                if server.poll() is not None:
+                    raise RuntimeError("Server exited before it started listening.")
+                time.sleep(0.01)
+            latencies, elapsed = asyncio.run(run(unix_path, args.clients))
+        finally:
+            server.terminate()
+            server.wait()
+
+    print(f"clients:  {args.clients}")
+    print(f"requests: {len(latencies)} in {elapsed:.2f}s ({len(latencies) / elapsed:.0f}/s)")
+    print(f"p50:      {percentile(latencies, 0.50) * 1e3:.2f} ms")
+    print(f"p99:      {percentile(latencies, 0.99) * 1e3:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
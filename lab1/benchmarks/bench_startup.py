@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+SCENARIO = b'{"seed": 1, "actions": ["work_thesis", "rest"]}\n'
+
+
+def import_time_ms(stderr: str) -> float:
+    # -X importtime lines: "import time: self | cumulative | name", with
+    # nested imports indented under their parent; only top-level rows are summed.
+    total = 0
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit() and not name.startswith("  "):
+            total += int(cumulative)
+    return total / 1000
+
+
+def imported_modules(stderr: str) -> set[str]:
+    return {
+        line.rsplit("|", 1)[1].strip()
+        for line in stderr.splitlines()
+        if line.startswith("import time:") and "|" in line
+    }
+
+
+def measure(entry_point: str, saves_dir: str) -> tuple[float, float, set[str]]:
+    command = [sys.executable, "-X", "importtime", str(ROOT_DIR / entry_point),
+               "--saves-dir", saves_dir, "--emit", "final"]
+    if entry_point == "main.py":
+        command += ["--script", "-"]
+    start = time.perf_counter()
+    result = subprocess.run(command, input=SCENARIO, capture_output=True, check=True)
+    wall = time.perf_counter() - start
+    stderr = result.stderr.decode("utf-8")
+    return import_time_ms(stderr), wall * 1000, imported_modules(stderr)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Startup import time of the headless entry points")
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as saves_dir:
+        for entry_point in ("headless.py", "main.py"):
+            runs = [measure(entry_point, saves_dir) for _ in range(args.runs)]
+            rich_loaded = any(module.startswith("rich") for *_, modules in runs for module in modules)
+            print(f"{entry_point:<12} imports={statistics.median(run[0] for run in runs):6.1f}ms "
+                  f"wall={statistics.median(run[1] for run in runs):6.1f}ms rich={rich_loaded}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from application import FileSlotStorage, SessionService, SlotStorage, SqliteSlotStorage
+
+
+def run_threads(threads: int, target) -> float:
+    workers = [threading.Thread(target=target, args=(index,)) for index in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return time.perf_counter() - start
+
+
+def measure(storage: SlotStorage, saves_dir: Path, threads: int, slots: int) -> tuple[float, float]:
+    per_thread = slots // threads
+
+    def save(index: int) -> None:
+        service = SessionService(saves_dir, storage=storage)
+        for slot in range(index * per_thread + 1, (index + 1) * per_thread + 1):
+            service.start_new(slot=slot, student_name="Bench", student_intelligence=2, seed=slot)
+            service.perform_action("rest")
+        service.close()
+
+    def load(index: int) -> None:
+        service = SessionService(saves_dir, storage=storage)
+        for slot in range(index * per_thread + 1, (index + 1) * per_thread + 1):
+            service.load(slot)
+
+    total = per_thread * threads
+    save_time = run_threads(threads, save)
+    storage.flush()
+    load_time = run_threads(threads, load)
+    # Each session is saved twice: by start_new and after the action.
+    return total * 2 / save_time, total / load_time
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Save/load throughput per storage backend")
+    parser.add_argument("--slots", type=int, default=3_200)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 8, 32])
+    args = parser.parse_args()
+
+    for threads in args.threads:
+        for name in ("file", "sqlite"):
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                saves_dir = Path(tmp_dir)
+                storage = (FileSlotStorage(saves_dir) if name == "file"
+                           else SqliteSlotStorage(saves_dir / "slots.db"))
+                saves, loads = measure(storage, saves_dir, threads, args.slots)
+                storage.close()
+            print(f"threads={threads:<3} {name:<7} save={saves:9.0f}/s load={loads:9.0f}/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import platform
+import sys
+import tempfile
+import timeit
+from collections.abc import Callable
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from application import SessionService
+from domain import DefenseProcess
+
+BENCH_DIR = Path(__file__).resolve().parent
+DEFAULT_BASELINE = BENCH_DIR / "baseline.json"
+DEFAULT_OUTPUT = BENCH_DIR / "results.json"
+DEFAULT_THRESHOLD = 0.25
+SEED = 20240601
+
+
+def make_process(seed: int = SEED) -> DefenseProcess:
+    return SessionService.create_process(student_name="Bench Student", student_intelligence=2, seed=seed)
+
+
+def mid_game_process() -> DefenseProcess:
+    # Deterministic mid-game state: a few days in, with non-trivial counters.
+    process = make_process()
+    for action in ("work_thesis", "rest", "work_thesis", "send_review"):
+        if action in process.get_available_actions():
+            process.perform_action(action)
+    return process
+
+
+def case_perform_action(tmp_dir: Path) -> Callable[[], object]:
+    process = make_process()
+    start = process.snapshot()
+
+    def run() -> None:
+        if process.is_finished():
+            process.restore(start)
+        process.perform_action(process.get_available_actions()[0])
+    return run
+
+
+def case_create_process(tmp_dir: Path) -> Callable[[], object]:
+    seeds = iter(range(SEED, SEED + 10**9))
+    return lambda: SessionService.create_process(
+        student_name="Bench Student", student_intelligence=2, seed=next(seeds))
+
+
+def case_change_day(tmp_dir: Path) -> Callable[[], object]:
+    process = make_process()
+    start = process.snapshot()
+
+    def run() -> None:
+        if process.get_today() >= DefenseProcess.MAX_DAY:
+            process.restore(start)
+        process.change_day()
+    return run
+
+
+def case_get_status(tmp_dir: Path) -> Callable[[], object]:
+    return mid_game_process().get_status
+
+
+def case_to_dict(tmp_dir: Path) -> Callable[[], object]:
+    return mid_game_process().to_dict
+
+
+def case_from_dict(tmp_dir: Path) -> Callable[[], object]:
+    payload = mid_game_process().to_dict()
+    return lambda: DefenseProcess.from_dict(payload)
+
+
+def case_save(tmp_dir: Path) -> Callable[[], object]:
+    service = SessionService(tmp_dir / "save")
+    service.start_new(slot=1, student_name="Bench Student", student_intelligence=2, seed=SEED)
+    service.perform_action("work_thesis")
+    return service.save
+
+
+def case_load(tmp_dir: Path) -> Callable[[], object]:
+    service = SessionService(tmp_dir / "load")
+    service.start_new(slot=1, student_name="Bench Student", student_intelligence=2, seed=SEED)
+    service.perform_action("work_thesis")
+    return lambda: service.load(1)
+
+
+def case_render_ui(tmp_dir: Path) -> Callable[[], object]:
+    from interfaces.cli import render_ui
+    from rich.console import Console
+
+    service = SessionService(tmp_dir / "render", autosave=False)
+    service.start_new(slot=1, student_name="Bench Student", student_intelligence=2, seed=SEED)
+    service.perform_action("work_thesis")
+    console = Console(file=io.StringIO(), force_terminal=True, width=120)
+
+    def run() -> None:
+        console.print(render_ui(service))
+        console.file.seek(0)
+        console.file.truncate()
+    return run
+
+
+CASES: dict[str, Callable[[Path], Callable[[], object]]] = {
+    "perform_action": case_perform_action,
+    "change_day": case_change_day,
+    "create_process": case_create_process,
+    "get_status": case_get_status,
+    "to_dict": case_to_dict,
+    "from_dict": case_from_dict,
+    "save": case_save,
+    "load": case_load,
+    "render_ui": case_render_ui,
+}
+
+
+def measure(name: str, repeat: int, min_time: float) -> dict[str, float | int]:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        timer = timeit.Timer(CASES[name](Path(tmp_dir)))
+        number, elapsed = timer.autorange()
+        # autorange stops at 0.2 s; scale up to the requested time per repeat.
+        if elapsed < min_time:
+            number = max(number, int(number * min_time / max(elapsed, 1e-9)))
+        totals = timer.repeat(repeat=repeat, number=number)
+    per_op = sorted(total / number * 1e9 for total in totals)
+    return {
+        "number": number,
+        "repeat": repeat,
+        "min_ns": round(per_op[0], 1),
+        "median_ns": round(per_op[len(per_op) // 2], 1),
+    }
+
+
+def compare(
+    results: dict[str, dict[str, float | int]],
+    baseline: dict[str, dict[str, float | int]],
+    threshold: float,
+) -> list[str]:
+    regressions = []
+    for name, result in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            continue
+        ratio = result["min_ns"] / reference["min_ns"]
+        if ratio > 1 + threshold:
+            regressions.append(
+                f"{name}: {result['min_ns']:.0f}ns vs baseline {reference['min_ns']:.0f}ns "
+                f"(+{(ratio - 1) * 100:.0f}%)"
+            )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Hot path benchmark suite with a regression check")
+    parser.add_argument("cases", nargs="*", help=f"Cases to run (default: all of {', '.join(CASES)})")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.2, help="Seconds per repeat")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Allowed slowdown over the baseline, e.g. 0.25 for 25%%")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="Write the results to the baseline file instead of comparing")
+    args = parser.parse_args()
+    unknown = [name for name in args.cases if name not in CASES]
+    if unknown:
+        parser.error(f"unknown cases: {', '.join(unknown)}")
+
+    results = {}
+    for name in args.cases or CASES:
+        results[name] = measure(name, args.repeat, args.min_time)
+        print(f"{name:<15} min={results[name]['min_ns']:>12.0f}ns "
+              f"median={results[name]['median_ns']:>12.0f}ns n={results[name]['number']}")
+
+    report = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "seed": SEED,
+        "results": results,
+    }
+    target = args.baseline if args.update_baseline else args.output
+    target.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    print(f"Results written to {target}")
+    if args.update_baseline or not args.baseline.exists():
+        return
+
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))["results"]
+    regressions = compare(results, baseline, args.threshold)
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    if regressions:
+        sys.exit(1)
+    print(f"No regressions over {args.threshold:.0%} against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from application import SessionService
+from domain.vectorized import VectorizedDefense
+
+DEFAULT_STEPS = 32
+
+
+def make_processes(count: int) -> list:
+    return [
+        SessionService.create_process(
+            student_name="Bench Student",
+            student_intelligence=seed % 3 + 1,
+            seed=seed,
+        )
+        for seed in range(count)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Vectorized vs scalar DefenseProcess benchmark")
+    parser.add_argument("--sessions", type=int, default=10_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    draws = rng.random((DEFAULT_STEPS, args.sessions))
+
+    processes = make_processes(args.sessions)
+    engine = VectorizedDefense(processes)
+
+    started = time.perf_counter()
+    step = 0
+    while not engine.all_finished():
+        engine.step(engine.pick_actions(draws[step]))
+        step += 1
+    vector_time = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for idx, process in enumerate(processes):
+        step = 0
+        while not process.is_finished():
+            actions = process.get_available_actions()
+            process.perform_action(actions[int(draws[step, idx] * len(actions))])
+            step += 1
+    scalar_time = time.perf_counter() - started
+
+    mismatches = sum(
+        engine.to_dict(idx) != process.to_dict()
+        for idx, process in enumerate(processes)
+    )
+
+    print(f"sessions:   {args.sessions}")
+    print(f"scalar:     {scalar_time:.3f} s")
+    print(f"vectorized: {vector_time:.3f} s")
+    print(f"speedup:    {scalar_time / vector_time:.1f}x")
+    print(f"mismatches: {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+import sys
+
+from main import parse_args, run_headless
+
+
+def main() -> None:
+    args = parse_args(description="Diploma defense headless runner (JSON lines, no UI)")
+    if args.script is None and args.actions_file is None:
+        args.script = sys.stdin
+    sys.exit(run_headless(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -3,33 +3,180 @@ from __future__ import annotations
 import argparse
 import sys
 from pathlib import Path
-import random
+from typing import TYPE_CHECKING
 
 SRC_DIR = Path(__file__).resolve().parent / "src"
 if str(SRC_DIR) not in sys.path:
     sys.path.insert(0, str(SRC_DIR))
 
-from src.application import SessionService
-from src.interfaces import run_cli
+if TYPE_CHECKING:
+    from application import SessionService
 
+# Only the standard library is imported up front: the application layer is
+# loaded when a session starts and rich only when the interactive UI runs.
 
-def parse_args() -> argparse.Namespace:
-    parser = argparse.ArgumentParser(description="Diploma defense CLI simulator")
+
+def parse_args(
+    argv: list[str] | None = None,
+    description: str = "Diploma defense CLI simulator",
+) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=description)
     parser.add_argument("--slot", type=int, default=1, help="Save slot number (>= 1)")
     parser.add_argument(
         "--new",
         action="store_true",
         help="Start a new session in selected slot",
     )
-    parser.add_argument("--seed", type=int, default=random.randint(-10000, 10000), help="Optional random seed")
-    return parser.parse_args()
+    parser.add_argument(
+        "--journal",
+        action="store_true",
+        help="Append actions to a journal and write full snapshots periodically",
+    )
+    parser.add_argument(
+        "--save-format",
+        choices=["json", "binary", "replay"],
+        default="json",
+        help="Format used when writing the save slot",
+    )
+    parser.add_argument(
+        "--frame-stats",
+        action="store_true",
+        help="Print dashboard frame times on exit",
+    )
+    script_group = parser.add_mutually_exclusive_group()
+    script_group.add_argument(
+        "--script",
+        type=argparse.FileType("r", encoding="utf-8"),
+        default=None,
+        help="Run JSON-lines scenarios from a file ('-' for stdin) without the UI",
+    )
+    script_group.add_argument(
+        "--actions-file",
+        type=argparse.FileType("r", encoding="utf-8"),
+        default=None,
+        help="Apply action codes, one per line, to the selected slot without the UI",
+    )
+    parser.add_argument(
+        "--emit",
+        choices=["steps", "final"],
+        default="steps",
+        help="Print a JSON line per step or only the final status in script modes",
+    )
+    parser.add_argument("--name", default="Anonymous Student", help="Student name for --actions-file")
+    parser.add_argument(
+        "--intelligence",
+        type=int,
+        default=2,
+        help="Student intelligence (1..3) for --actions-file",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="Random seed for a new session (drawn at random when omitted)",
+    )
+    parser.add_argument(
+        "--metrics",
+        action="store_true",
+        help="Collect action and I/O timings and print them to stderr on exit",
+    )
+    parser.add_argument(
+        "--no-estimate",
+        action="store_true",
+        help="Do not run background rollouts for the defense chance shown in the UI",
+    )
+    parser.add_argument(
+        "--scenario",
+        type=Path,
+        default=None,
+        help="Scenario file (.toml or .json) with themes, supervisors and balancing constants",
+    )
+    parser.add_argument(
+        "--saves-dir",
+        type=Path,
+        default=Path(__file__).resolve().parent / "saves",
+        help="Directory for save slots",
+    )
+    return parser.parse_args(argv)
+
+
+def create_service(args: argparse.Namespace, autosave: bool = True, estimate: bool = False) -> SessionService:
+    from application import SessionService
+
+    scenario = None
+    if args.scenario is not None:
+        from application import load_scenario
+
+        try:
+            scenario = load_scenario(args.scenario)
+        except (ValueError, FileNotFoundError) as error:
+            sys.exit(f"Cannot load scenario: {error}")
+
+    try:
+        return SessionService(
+            saves_dir=args.saves_dir,
+            journal=args.journal,
+            save_format=args.save_format,
+            autosave=autosave,
+            metrics=args.metrics,
+            scenario=scenario,
+            estimate=estimate,
+        )
+    except ValueError as error:
+        sys.exit(f"Cannot start: {error}")
+
+
+def session_seed(args: argparse.Namespace) -> int:
+    if args.seed is not None:
+        return args.seed
+    import random
+
+    return random.randint(-10000, 10000)
+
+
+def run_headless(args: argparse.Namespace) -> int:
+    from interfaces.script import run_actions, run_script
+
+    # Scripted runs write the slot once per scenario instead of after every action.
+    service = create_service(args, autosave=False)
+    if args.script is not None:
+        failed = run_script(service, args.script, sys.stdout, emit=args.emit, slot=args.slot)
+        print_metrics(service)
+        return 1 if failed else 0
+
+    if args.new or not service.has_save(args.slot):
+        service.start_new(
+            slot=args.slot,
+            student_name=args.name,
+            student_intelligence=args.intelligence,
+            seed=session_seed(args),
+        )
+    else:
+        service.load(args.slot)
+    ok = run_actions(service, args.actions_file, sys.stdout, emit=args.emit)
+    service.close()
+    print_metrics(service)
+    return 0 if ok else 1
+
+
+def print_metrics(service: SessionService) -> None:
+    metrics = service.get_metrics()
+    if metrics is not None:
+        print(metrics.to_text(), file=sys.stderr)
 
 
 def main() -> None:
     args = parse_args()
-    saves_dir = Path(__file__).resolve().parent / "saves"
-    service = SessionService(saves_dir=saves_dir)
-    run_cli(service=service, slot=args.slot, create_new=args.new, seed=args.seed)
+    if args.script is not None or args.actions_file is not None:
+        sys.exit(run_headless(args))
+
+    from interfaces import run_cli
+
+    service = create_service(args, estimate=not args.no_estimate)
+    run_cli(service=service, slot=args.slot, create_new=args.new,
+            seed=session_seed(args), show_frame_stats=args.frame_stats)
+    service.close()
+    print_metrics(service)
 
 
 if __name__ == "__main__":
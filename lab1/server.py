@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from application import SqliteSlotStorage
+from interfaces.server import SessionServer
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Diploma defense session server")
+    parser.add_argument("--host", default="127.0.0.1", help="TCP host to listen on")
+    parser.add_argument("--port", type=int, default=8765, help="TCP port to listen on")
+    parser.add_argument("--unix", type=Path, default=None, help="Listen on a Unix socket instead of TCP")
+    parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=SessionServer.DEFAULT_IDLE_TIMEOUT,
+        help="Seconds before an idle session is saved and dropped from memory",
+    )
+    parser.add_argument(
+        "--saves-dir",
+        type=Path,
+        default=Path(__file__).resolve().parent / "saves",
+        help="Directory for save slots",
+    )
+    parser.add_argument("--sqlite", type=Path, default=None, help="Store slots in this SQLite database")
+    return parser.parse_args()
+
+
+async def serve(args: argparse.Namespace) -> None:
+    storage = SqliteSlotStorage(args.sqlite) if args.sqlite is not None else None
+    server = SessionServer(args.saves_dir, storage=storage, idle_timeout=args.idle_timeout)
+    await server.start(host=args.host, port=args.port, unix_path=args.unix)
+    print(f"Listening on {server.get_address()}", flush=True)
+    try:
+        await server.serve_forever()
+    finally:
+        await server.close()
+
+
+def main() -> None:
+    try:
+        asyncio.run(serve(parse_args()))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,52 @@
-from .session_service import SessionService
+from __future__ import annotations
 
-__all__ = ["SessionService"]
+from importlib import import_module
+
+# Public names map to the submodule that defines them. Submodules are imported
+# on first use, so a headless session does not load the solver, the batch
+# simulator and their multiprocessing imports.
+_EXPORTS: dict[str, str] = {
+    "Advice": "advisor",
+    "BatchSimulator": "batch_simulator",
+    "BackgroundEstimator": "win_estimator",
+    "BinarySaveCodec": "save_codecs",
+    "Estimate": "win_estimator",
+    "FileSlotStorage": "slot_storage",
+    "Histogram": "metrics",
+    "JsonSaveCodec": "save_codecs",
+    "MctsAdvisor": "advisor",
+    "Metrics": "metrics",
+    "OptimalSolver": "optimal_solver",
+    "ParameterSweep": "parameter_sweep",
+    "POLICIES": "policies",
+    "Policy": "policies",
+    "ReplaySaveCodec": "save_codecs",
+    "SAVE_CODECS": "save_codecs",
+    "SessionService": "session_service",
+    "SlotCatalog": "slot_catalog",
+    "SlotStorage": "slot_storage",
+    "SolverResult": "optimal_solver",
+    "SqliteSlotStorage": "slot_storage",
+    "SweepPoint": "parameter_sweep",
+    "WinEstimator": "win_estimator",
+    "first_action_policy": "policies",
+    "greedy_policy": "policies",
+    "load_scenario": "scenario_config",
+    "parse_scenario": "scenario_config",
+    "random_policy": "policies",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> object:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + __all__)
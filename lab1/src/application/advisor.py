@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import math
+import random
+import time
+
+from domain import DefenseProcess
+
+from .policies import Policy, greedy_policy
+
+
+class Advice:
+    def __init__(
+        self,
+        action: str,
+        expected_grade: float,
+        expected_score: float,
+        defense_probability: float,
+        visits: int,
+    ):
+        self.__action: str = action
+        self.__expected_grade: float = expected_grade
+        self.__expected_score: float = expected_score
+        self.__defense_probability: float = defense_probability
+        self.__visits: int = visits
+
+    def get_action(self) -> str:
+        return self.__action
+
+    def get_expected_grade(self) -> float:
+        return self.__expected_grade
+
+    def get_expected_score(self) -> float:
+        return self.__expected_score
+
+    def get_defense_probability(self) -> float:
+        return self.__defense_probability
+
+    def get_visits(self) -> int:
+        return self.__visits
+
+
+class _Node:
+    __slots__ = ("children", "untried", "visits", "reward", "grade", "score", "passed")
+
+    def __init__(self, actions: list[str]):
+        self.children: dict[str, _Node] = {}
+        self.untried: list[str] = list(reversed(actions))
+        self.visits: int = 0
+        self.reward: float = 0.0
+        self.grade: int = 0
+        self.score: int = 0
+        self.passed: int = 0
+
+
+class MctsAdvisor:
+    DEFAULT_TIME_BUDGET: float = 0.05
+    EXPLORATION: float = 1.4
+
+    def __init__(
+        self,
+        time_budget: float = DEFAULT_TIME_BUDGET,
+        rollout_policy: Policy = greedy_policy,
+        seed: int | None = None,
+    ):
+        if time_budget <= 0:
+            raise ValueError("Time budget must be positive.")
+
+        self.__time_budget: float = time_budget
+        self.__rollout_policy: Policy = rollout_policy
+        self.__rng: random.Random = random.Random(seed)
+        self.__root: _Node | None = None
+        self.__root_state: DefenseProcess | None = None
+        self.__root_key: dict[str, object] | None = None
+
+    def reset(self) -> None:
+        self.__root = None
+        self.__root_state = None
+        self.__root_key = None
+
+    def advance(self, action_code: str) -> None:
+        if self.__root is None or self.__root_state is None:
+            return
+        child = self.__root.children.get(action_code)
+        if child is None or action_code not in self.__root_state.get_available_actions():
+            self.reset()
+            return
+        self.__root_state.perform_action(action_code)
+        self.__root = child
+        self.__root_key = self._state_key(self.__root_state)
+
+    def get_root_visits(self) -> int:
+        return self.__root.visits if self.__root is not None else 0
+
+    def advise(
+        self,
+        process: DefenseProcess,
+        time_budget: float | None = None,
+        max_iterations: int | None = None,
+    ) -> Advice:
+        if process.is_finished():
+            raise ValueError("Session is already finished.")
+
+        key = self._state_key(process)
+        if self.__root is None or self.__root_key != key:
+            self.__root = _Node(process.get_available_actions())
+            self.__root_state = process.fork()
+            self.__root_key = key
+
+        # An iteration budget on its own is not cut short by the clock, so the
+        # result does not depend on how fast the machine is.
+        if max_iterations is not None and time_budget is None:
+            deadline = math.inf
+        else:
+            deadline = time.perf_counter() + (self.__time_budget if time_budget is None else time_budget)
+        simulation = process.fork()
+        start = simulation.snapshot()
+        iterations = 0
+        # At least one pass per root action so that every move has an estimate.
+        while (self.__root.untried
+               or (time.perf_counter() < deadline
+                   and (max_iterations is None or iterations < max_iterations))):
+            simulation.restore(start)
+            self._iterate(simulation)
+            iterations += 1
+
+        action, child = max(self.__root.children.items(), key=lambda item: item[1].visits)
+        return Advice(
+            action=action,
+            expected_grade=child.grade / child.visits,
+            expected_score=child.score / child.visits,
+            defense_probability=child.passed / child.visits,
+            visits=child.visits,
+        )
+
+    def _iterate(self, simulation: DefenseProcess) -> None:
+        node = self.__root
+        path = [node]
+        while not node.untried and node.children:
+            action, node = self._select(node)
+            simulation.perform_action(action)
+            path.append(node)
+
+        if node.untried:
+            action = node.untried.pop()
+            simulation.perform_action(action)
+            child = _Node(simulation.get_available_actions())
+            node.children[action] = child
+            path.append(child)
+
+        while not simulation.is_finished():
+            simulation.perform_action(self.__rollout_policy(simulation, self.__rng))
+
+        status = simulation.get_status()
+        passed = bool(status["defense_passed"])
+        grade = int(status["final_grade"])
+        score = int(status["score"])
+        reward = self._reward(passed, grade, score)
+        for item in path:
+            item.visits += 1
+            item.reward += reward
+            item.grade += grade
+            item.score += score
+            item.passed += passed
+
+    def _select(self, node: _Node) -> tuple[str, _Node]:
+        log_visits = math.log(node.visits)
+        best_action, best_child, best_value = None, None, -math.inf
+        for action, child in node.children.items():
+            value = (child.reward / child.visits
+                     + self.EXPLORATION * math.sqrt(log_visits / child.visits))
+            if value > best_value:
+                best_action, best_child, best_value = action, child, value
+        return best_action, best_child
+
+    @staticmethod
+    def _state_key(process: DefenseProcess) -> dict[str, object]:
+        # The seed only shaped the starting state, so it must not invalidate the tree.
+        data = process.to_dict()
+        del data["seed"]
+        return data
+
+    @staticmethod
+    def _reward(passed: bool, grade: int, score: int) -> float:
+        # Passing dominates, then the grade, then the score as a tie-breaker.
+        grade_part = max(0, min(grade, DefenseProcess.MAX_GRADE)) / DefenseProcess.MAX_GRADE
+        score_part = max(0, min(score, 1000)) / 1000
+        return 0.5 * passed + 0.4 * grade_part + 0.1 * score_part
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import os
+import random
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+
+from domain import Scenario
+
+from .policies import Policy, random_policy
+from .session_service import SessionService
+
+
+def _run_chunk(
+    seeds: list[int],
+    student_name: str,
+    student_intelligence: int,
+    policy: Policy,
+) -> list[dict[str, object]]:
+    return [
+        BatchSimulator.play_session(seed, student_name, student_intelligence, policy)
+        for seed in seeds
+    ]
+
+
+class BatchSimulator:
+    DEFAULT_CHUNK_SIZE: int = 1024
+
+    def __init__(
+        self,
+        policy: Policy = random_policy,
+        student_intelligence: int = 2,
+        student_name: str = "Batch Student",
+        max_workers: int | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ):
+        if chunk_size <= 0:
+            raise ValueError("Chunk size must be >= 1.")
+
+        self.__policy: Policy = policy
+        self.__student_intelligence: int = student_intelligence
+        self.__student_name: str = student_name
+        self.__max_workers: int = max_workers if max_workers is not None else (os.cpu_count() or 1)
+        self.__chunk_size: int = chunk_size
+
+    @staticmethod
+    def play_session(
+        seed: int,
+        student_name: str,
+        student_intelligence: int,
+        policy: Policy,
+        scenario: Scenario | None = None,
+    ) -> dict[str, object]:
+        process = SessionService.create_process(
+            student_name=student_name,
+            student_intelligence=student_intelligence,
+            seed=seed,
+            scenario=scenario,
+        )
+        rng = random.Random(seed)
+        steps = 0
+        while not process.is_finished():
+            process.perform_action(policy(process, rng))
+            steps += 1
+
+        record = dict(process.get_status())
+        record["revision_passed"] = list(record["revision_passed"])
+        record["seed"] = seed
+        record["steps"] = steps
+        return record
+
+    def run(self, seeds: Iterable[int]) -> list[dict[str, object]]:
+        return list(self.iter_results(seeds))
+
+    def iter_results(self, seeds: Iterable[int]) -> Iterator[dict[str, object]]:
+        chunks = self._iter_chunks(seeds)
+        if self.__max_workers <= 1:
+            for chunk in chunks:
+                yield from _run_chunk(*self._chunk_args(chunk))
+            return
+
+        # Keep a bounded window of chunks in flight so that millions of seeds
+        # never materialize as futures at once; results keep the seed order.
+        window = self.__max_workers * 2
+        with ProcessPoolExecutor(max_workers=self.__max_workers) as executor:
+            pending: deque[Future[list[dict[str, object]]]] = deque()
+            for chunk in chunks:
+                pending.append(executor.submit(_run_chunk, *self._chunk_args(chunk)))
+                if len(pending) >= window:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+
+    def _iter_chunks(self, seeds: Iterable[int]) -> Iterator[list[int]]:
+        iterator = iter(seeds)
+        while chunk := list(islice(iterator, self.__chunk_size)):
+            yield chunk
+
+    def _chunk_args(self, chunk: list[int]) -> tuple[list[int], str, int, Policy]:
+        return chunk, self.__student_name, self.__student_intelligence, self.__policy
+
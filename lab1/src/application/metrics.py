@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import math
+from bisect import bisect_left
+
+
+class Histogram:
+    # Upper bucket bounds in microseconds; the last bucket is unbounded.
+    BOUNDS_US: tuple[float, ...] = (1, 5, 10, 50, 100, 500, 1_000, 5_000, 10_000, 50_000, 100_000, math.inf)
+
+    __slots__ = ("__buckets", "__count", "__total", "__max")
+
+    def __init__(self):
+        self.__buckets: list[int] = [0] * len(self.BOUNDS_US)
+        self.__count: int = 0
+        self.__total: float = 0.0
+        self.__max: float = 0.0
+
+    def observe(self, seconds: float) -> None:
+        micros = seconds * 1e6
+        self.__buckets[bisect_left(self.BOUNDS_US, micros)] += 1
+        self.__count += 1
+        self.__total += micros
+        if micros > self.__max:
+            self.__max = micros
+
+    def get_count(self) -> int:
+        return self.__count
+
+    def get_mean_us(self) -> float:
+        return self.__total / self.__count if self.__count else 0.0
+
+    def get_max_us(self) -> float:
+        return self.__max
+
+    def get_buckets(self) -> dict[float, int]:
+        return dict(zip(self.BOUNDS_US, self.__buckets))
+
+    def quantile_bound_us(self, quantile: float) -> float:
+        if not 0 <= quantile <= 1:
+            raise ValueError("Quantile must be in range 0..1.")
+        if not self.__count:
+            return 0.0
+        rank = max(1, math.ceil(quantile * self.__count))
+        seen = 0
+        for bound, count in zip(self.BOUNDS_US, self.__buckets):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.__max)
+        return self.__max
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "count": self.__count,
+            "mean_us": round(self.get_mean_us(), 3),
+            "max_us": round(self.__max, 3),
+            "p50_us": self.quantile_bound_us(0.5),
+            "p99_us": self.quantile_bound_us(0.99),
+        }
+
+
+class Metrics:
+    def __init__(self):
+        self.__counters: dict[str, int] = {}
+        self.__histograms: dict[str, Histogram] = {}
+
+    def increment(self, name: str, amount: int = 1) -> None:
+        self.__counters[name] = self.__counters.get(name, 0) + amount
+
+    def observe(self, name: str, seconds: float) -> None:
+        histogram = self.__histograms.get(name)
+        if histogram is None:
+            histogram = self.__histograms[name] = Histogram()
+        histogram.observe(seconds)
+
+    def get_counter(self, name: str) -> int:
+        return self.__counters.get(name, 0)
+
+    def get_histogram(self, name: str) -> Histogram | None:
+        return self.__histograms.get(name)
+
+    def reset(self) -> None:
+        self.__counters.clear()
+        self.__histograms.clear()
+
+    def snapshot(self) -> dict[str, object]:
+        return {
+            "counters": dict(sorted(self.__counters.items())),
+            "histograms": {
+                name: histogram.to_dict() for name, histogram in sorted(self.__histograms.items())
+            },
+        }
+
+    def to_text(self) -> str:
+        lines = [f"counter {name} {value}" for name, value in sorted(self.__counters.items())]
+        for name, histogram in sorted(self.__histograms.items()):
+            lines.append(
+                f"histogram {name} count={histogram.get_count()} "
+                f"mean={histogram.get_mean_us():.1f}us "
+                f"p50<={histogram.quantile_bound_us(0.5):.1f}us "
+                f"p99<={histogram.quantile_bound_us(0.99):.1f}us "
+                f"max={histogram.get_max_us():.1f}us"
+            )
+        return "\n".join(lines)
@@ -0,0 +1,316 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+
+from domain import ActionRule, DefenseCalendar, DefenseProcess, DefenseRules, DefenseStage, Student
+
+_STAGES: tuple[DefenseStage, ...] = DefenseCalendar.STAGES
+_STAGE_COUNT = len(_STAGES)
+_REVISION_MASKS = DefenseCalendar.REVISION_MASKS
+_CALENDAR: tuple[int, ...] = DefenseCalendar.get_table()
+_PREPARATION = _STAGES.index(DefenseStage.PREPARATION)
+_REVISION = _STAGES.index(DefenseStage.REVISION)
+_REHEARSAL = _STAGES.index(DefenseStage.REHEARSAL)
+_DEFENSE = _STAGES.index(DefenseStage.DEFENSE)
+_ATTESTATION = _STAGES.index(DefenseStage.ATTESTATION)
+_FINISHED = _STAGES.index(DefenseStage.FINISHED)
+
+_STAGE_ACTIONS: dict[int, tuple[str, ...]] = {
+    _STAGES.index(stage): actions for stage, actions in DefenseRules.STAGE_ACTIONS.items()
+}
+
+# State tuple layout used by the solver:
+# (today, stage, stamina, answer_skill, completion, quality, presentation,
+#  revision_0, revision_1, revision_2, defense_passed)
+State = tuple[int, int, int, int, int, int, int, bool, bool, bool, bool]
+# (intelligence, review factor, loyalty penalty)
+Params = tuple[int, int, bool]
+Transition = Callable[[State, Params], tuple[State, int, int, bool]]
+
+_STATE_BITS = 42
+_FACTORED_BIT = 1 << (_STATE_BITS + 4)
+# Clamps to 0..100 by indexing; negative indices down to -100 wrap onto the zero tail.
+_CLIP: tuple[int, ...] = tuple(min(100, value) for value in range(201)) + (0,) * 100
+
+
+class SolverResult:
+    def __init__(
+        self,
+        actions: list[str],
+        final_grade: int,
+        score: int,
+        defense_passed: bool,
+    ):
+        self.__actions: list[str] = actions
+        self.__final_grade: int = final_grade
+        self.__score: int = score
+        self.__defense_passed: bool = defense_passed
+
+    def get_actions(self) -> list[str]:
+        return list(self.__actions)
+
+    def get_final_grade(self) -> int:
+        return self.__final_grade
+
+    def get_score(self) -> int:
+        return self.__score
+
+    def is_defense_passed(self) -> bool:
+        return self.__defense_passed
+
+    def __repr__(self) -> str:
+        return (f"SolverResult(final_grade={self.__final_grade}, score={self.__score}, "
+                f"defense_passed={self.__defense_passed}, actions={self.__actions})")
+
+
+# Sessions are ranked by defense_passed, then final_grade, then score. Every
+# action adds a fixed amount to grade and score except attestation, which
+# multiplies the accumulated score. So each node keeps its best grade delta
+# and, per number k of attestations left on the path, the best constant c of
+# the final score m**k * score + b_k * grade + c. The table then does not
+# depend on the grade and score accumulated before the node.
+class OptimalSolver:
+    def __init__(self) -> None:
+        self.__tables: dict[tuple[int, bool], dict[int, tuple]] = {}
+
+    def solve(self, source: DefenseProcess | Mapping[str, object]) -> SolverResult:
+        data = source.to_dict() if isinstance(source, DefenseProcess) else source
+        if "scenario" in data:
+            raise ValueError("The solver only supports the built-in scenario.")
+        intelligence = int(data["student"]["intelligence"])
+        # Supervisor and commission only enter the rules through these two
+        # values, so sessions that agree on them share one table.
+        review_factor = DefenseRules.review_factor(
+            int(data["supervisor"]["intelligence"]), int(data["supervisor"]["loyalty"]), intelligence)
+        penalty = DefenseRules.loyalty_penalty(int(data["commission"]["loyalty"]), intelligence)
+        params = (intelligence, review_factor, penalty)
+
+        revision = [bool(item) for item in data["revision_passed"]]
+        state: State = (
+            int(data["today"]),
+            _STAGES.index(DefenseStage[str(data["stage"])]),
+            int(data["student"]["stamina"]),
+            int(data["student"]["answer_skill"]),
+            int(data["diploma_project"]["pct_complition"]),
+            int(data["diploma_project"]["quality"]),
+            int(data["presentation"]["pct_complition"]),
+            revision[0],
+            revision[1],
+            revision[2],
+            bool(data.get("defense_passed", False)),
+        )
+        grade = int(data["final_grade"] or 0)
+        score = int(data["score"])
+
+        table = self.__tables.setdefault((intelligence, penalty), {})
+        review_bits = (review_factor + 1) << _STATE_BITS
+        passed, grade_delta, candidates = self._search(state, params, table, review_bits)
+
+        multiplier = DefenseRules.attestation_multiplier(intelligence)
+        best_k, best_score = 0, None
+        for k, (constant, _) in candidates.items():
+            value = multiplier ** k * score + self._grade_factor(multiplier, k) * grade + constant
+            if best_score is None or value > best_score:
+                best_k, best_score = k, value
+
+        actions: list[str] = []
+        k = best_k
+        while True:
+            _, _, node_candidates = table[self._encode(state, review_bits)]
+            action = node_candidates[k][1]
+            if action is None:
+                break
+            actions.append(action)
+            state = self._apply(state, params, action)[0]
+            if action == "attestation":
+                k -= 1
+
+        return SolverResult(
+            actions=actions,
+            final_grade=grade + grade_delta,
+            score=best_score,
+            defense_passed=passed,
+        )
+
+    def get_table_size(self) -> int:
+        return sum(len(table) for table in self.__tables.values())
+
+    def clear(self) -> None:
+        self.__tables.clear()
+
+    @staticmethod
+    def _grade_factor(multiplier: int, k: int) -> int:
+        # b_k from the comment above the class: b_0 = 0, b_k = 2 * m**k + b_(k-1).
+        return sum(DefenseRules.ATTESTATION_GRADE_SCORE * multiplier ** i for i in range(1, k + 1))
+
+    @staticmethod
+    def _encode(state: State, review_bits: int) -> int:
+        today, stage, stamina, answer, completion, quality, presentation, r0, r1, r2, passed = state
+        # Fields that can no longer influence the outcome are folded into one
+        # canonical value, so equivalent states share a table entry.
+        if stage == _FINISHED:
+            return _FINISHED << 39 | passed
+        if presentation > DefenseRules.DEFENSE_MIN_PRESENTATION:
+            presentation = DefenseRules.DEFENSE_MIN_PRESENTATION
+        if today >= 18 and stage != _PREPARATION and stage != _REVISION:
+            # Reviews are over, so the supervisor no longer matters either.
+            completion = r0 = r1 = r2 = review_bits = 0
+            if stage == _ATTESTATION:
+                stamina = answer = presentation = 0
+            if ((stage == _REHEARSAL and not passed)
+                    or (stage == _DEFENSE and today >= 23 and not passed)
+                    or (stage == _ATTESTATION and today >= 24)):
+                # Exactly one attestation is left on every path, so its
+                # quality bonus is added by the caller instead of being keyed.
+                quality = 0
+                review_bits = _FACTORED_BIT
+            else:
+                quality = DefenseRules.attestation_grade(quality) - _MIN_ATTESTATION_GRADE
+        elif r2:
+            completion = 0
+
+        key = today
+        key = key << 3 | stage
+        key = key << 7 | stamina
+        key = key << 2 | answer
+        key = key << 7 | completion
+        key = key << 7 | quality
+        key = key << 7 | presentation
+        return review_bits | key << 4 | r0 << 3 | r1 << 2 | r2 << 1 | passed
+
+    def _search(
+        self,
+        state: State,
+        params: Params,
+        table: dict[int, tuple],
+        review_bits: int,
+    ) -> tuple:
+        multiplier = DefenseRules.attestation_multiplier(params[0])
+        powers = [multiplier ** k for k in range(DefenseProcess.MAX_DAY + 2)]
+        factors = [self._grade_factor(multiplier, k) for k in range(DefenseProcess.MAX_DAY + 2)]
+        encode = self._encode
+
+        def with_quality(result: tuple, state: State) -> tuple:
+            bonus = DefenseRules.attestation_grade(state[5])
+            (k, (constant, action)), = result[2].items()
+            return result[0], result[1] + bonus, {k: (constant + factors[k] * bonus, action)}
+
+        def visit(state: State, key: int) -> tuple:
+            stage = state[1]
+            if stage == _FINISHED:
+                result = (state[10], 0, {0: (0, None)})
+                table[key] = result
+                return result
+
+            factored = key & _FACTORED_BIT
+            best_passed = best_grade = -1
+            best: dict[int, tuple[int, str]] = {}
+            for action, transition in _STAGE_TRANSITIONS[stage]:
+                next_state, grade_delta, score_delta, attested = transition(state, params)
+                child_key = encode(next_state, review_bits)
+                child = table.get(child_key)
+                if child is None:
+                    child = visit(next_state, child_key)
+                if child_key & _FACTORED_BIT and not factored:
+                    child = with_quality(child, next_state)
+                if attested and factored:
+                    grade_delta = 0
+
+                passed = child[0]
+                grade = grade_delta + child[1]
+                if passed < best_passed or (passed == best_passed and grade < best_grade):
+                    continue
+                if passed > best_passed or grade > best_grade:
+                    best_passed, best_grade, best = passed, grade, {}
+
+                for child_k, (constant, _) in child[2].items():
+                    if attested:
+                        k = child_k + 1
+                        constant += factors[k] * grade_delta
+                    else:
+                        k = child_k
+                        constant += powers[k] * score_delta + factors[k] * grade_delta
+                    current = best.get(k)
+                    if current is None or constant > current[0]:
+                        best[k] = (constant, action)
+
+            result = (bool(best_passed), best_grade, best)
+            table[key] = result
+            return result
+
+        key = encode(state, review_bits)
+        result = table.get(key)
+        if result is None:
+            result = visit(state, key)
+        if key & _FACTORED_BIT:
+            result = with_quality(result, state)
+        return result
+
+    @staticmethod
+    def _apply(state: State, params: Params, action: str) -> tuple[State, int, int, bool]:
+        transition = _TRANSITIONS.get(action)
+        if transition is None:
+            raise ValueError("Action is not available at the current stage.")
+        return transition(state, params)
+
+
+def _compile_transition(rule: ActionRule) -> Transition:
+    completion_gain, quality_gain, presentation_gain = rule.completion, rule.quality, rule.presentation
+    uses_efficiency = rule.uses_efficiency()
+    stamina_delta, score, review, rehearse = rule.stamina, rule.score, rule.review, rule.rehearse
+    inspection, defense, attestation = rule.inspection, rule.defense, rule.attestation
+
+    def transition(state: State, params: Params) -> tuple[State, int, int, bool]:
+        (today, stage, stamina, answer, completion, quality, presentation,
+         r0, r1, r2, passed) = state
+        intelligence, review_factor, penalty = params
+        grade_delta = 0
+        score_delta = score
+
+        if uses_efficiency:
+            efficiency = DefenseRules.efficiency(intelligence, stamina)
+            if completion_gain is not None:
+                completion = _CLIP[completion + completion_gain.delta(efficiency)]
+            if quality_gain is not None:
+                quality = _CLIP[quality + quality_gain.delta(efficiency)]
+            if presentation_gain is not None:
+                presentation = _CLIP[presentation + presentation_gain.delta(efficiency)]
+        if review:
+            quality = _CLIP[quality + review * review_factor]
+        if rehearse:
+            answer = min(Student.MAX_ANSWER_SKILL, answer + stamina // rehearse)
+        if inspection:
+            revision = [r0, r1, r2]
+            for idx, check in enumerate(DefenseRules.REVISION_CHECKS):
+                if completion >= check.min_completion and not revision[idx]:
+                    revision[idx] = True
+                    grade_delta += 1 - today // check.day_divisor
+                    score_delta += check.score
+            r0, r1, r2 = revision
+        if defense:
+            passed = True
+            grade_delta = 1 + answer - (penalty or DefenseRules.presentation_penalty(presentation))
+        if attestation:
+            grade_delta = DefenseRules.attestation_grade(quality)
+        if stamina_delta:
+            stamina = _CLIP[stamina + stamina_delta]
+
+        if today < DefenseProcess.MAX_DAY:
+            today += 1
+        stage = _CALENDAR[((today * _STAGE_COUNT + stage) * _REVISION_MASKS
+                           + (r0 | r1 << 1 | r2 << 2)) * 2 + passed]
+
+        next_state = (today, stage, stamina, answer, completion, quality, presentation,
+                      r0, r1, r2, passed)
+        return next_state, grade_delta, score_delta, attestation
+    return transition
+
+
+_MIN_ATTESTATION_GRADE: int = DefenseRules.attestation_grade(0)
+_TRANSITIONS: dict[str, Transition] = {
+    code: _compile_transition(rule) for code, rule in DefenseRules.ACTIONS.items()
+}
+_STAGE_TRANSITIONS: dict[int, tuple[tuple[str, Transition], ...]] = {
+    stage: tuple((code, _TRANSITIONS[code]) for code in actions)
+    for stage, actions in _STAGE_ACTIONS.items()
+}
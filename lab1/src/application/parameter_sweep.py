@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import csv
+import itertools
+import os
+from collections import deque
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import NamedTuple
+
+from domain import Scenario, Student
+
+from .batch_simulator import BatchSimulator
+from .policies import POLICIES
+
+
+class SweepPoint(NamedTuple):
+    student_intelligence: int
+    supervisor_intelligence: int
+    supervisor_loyalty: int
+    commission_loyalty: int
+    theme_complexity: int
+    student_stamina: int
+    project_quality: int
+    policy: str
+
+    def key(self) -> tuple[str, ...]:
+        return tuple(str(value) for value in self)
+
+
+class ParameterSweep:
+    RESULT_COLUMNS: tuple[str, ...] = (
+        "sessions",
+        "seed_first",
+        "seed_last",
+        "defense_passed",
+        "final_grade_mean",
+        "final_grade_min",
+        "final_grade_max",
+        "score_mean",
+        "score_min",
+        "score_max",
+        "steps_mean",
+    )
+    COLUMNS: tuple[str, ...] = SweepPoint._fields + RESULT_COLUMNS
+
+    def __init__(
+        self,
+        seeds: Sequence[int],
+        student_intelligence: Sequence[int] = Student.ALLOWED_INTELLIGENCE,
+        supervisor_intelligence: Sequence[int] = (1, 2, 3),
+        supervisor_loyalty: Sequence[int] = (1, 2, 3),
+        commission_loyalty: Sequence[int] = (1, 2, 3),
+        theme_complexity: Sequence[int] = (1, 2, 3),
+        student_stamina: Sequence[int] = (80,),
+        project_quality: Sequence[int] = (90,),
+        policies: Sequence[str] = tuple(POLICIES),
+        max_workers: int | None = None,
+    ):
+        self.__seeds: tuple[int, ...] = tuple(seeds)
+        self.__axes: tuple[tuple, ...] = tuple(tuple(dict.fromkeys(axis)) for axis in (
+            student_intelligence,
+            supervisor_intelligence,
+            supervisor_loyalty,
+            commission_loyalty,
+            theme_complexity,
+            student_stamina,
+            project_quality,
+            policies,
+        ))
+        self.__max_workers: int = max_workers if max_workers is not None else (os.cpu_count() or 1)
+        self._validate()
+
+    def _validate(self) -> None:
+        if not self.__seeds:
+            raise ValueError("Sweep needs at least one seed.")
+        for name, axis in zip(SweepPoint._fields, self.__axes):
+            if not axis:
+                raise ValueError(f"Sweep axis {name} is empty.")
+        for intelligence in self.__axes[0]:
+            Student._validate_intelligence(intelligence)
+        unknown = [policy for policy in self.__axes[7] if policy not in POLICIES]
+        if unknown:
+            raise ValueError(f"Unknown policies: {', '.join(unknown)}.")
+        # Building a scenario validates its values; varying one axis at a
+        # time covers every value without building the whole product.
+        first = [axis[0] for axis in self.__axes[1:7]]
+        for idx, axis in enumerate(self.__axes[1:7]):
+            for value in axis:
+                _point_scenario(*first[:idx], value, *first[idx + 1:])
+
+    def get_seeds(self) -> tuple[int, ...]:
+        return self.__seeds
+
+    def points(self) -> Iterator[SweepPoint]:
+        return itertools.starmap(SweepPoint, itertools.product(*self.__axes))
+
+    def count(self) -> int:
+        total = 1
+        for axis in self.__axes:
+            total *= len(axis)
+        return total
+
+    def iter_results(self, points: Iterable[SweepPoint]) -> Iterator[tuple[SweepPoint, tuple]]:
+        if self.__max_workers <= 1:
+            for point in points:
+                yield point, _run_point(point, self.__seeds)
+            return
+
+        # Same bounded in-flight window as BatchSimulator; rows keep point order.
+        window = self.__max_workers * 2
+        with ProcessPoolExecutor(max_workers=self.__max_workers) as executor:
+            pending: deque[tuple[SweepPoint, Future[tuple]]] = deque()
+            for point in points:
+                pending.append((point, executor.submit(_run_point, point, self.__seeds)))
+                if len(pending) >= window:
+                    point, future = pending.popleft()
+                    yield point, future.result()
+            while pending:
+                point, future = pending.popleft()
+                yield point, future.result()
+
+    def run(self, output: str | Path, resume: bool = True) -> int:
+        output = Path(output)
+        done = self.completed_points(output) if resume else set()
+        if not resume:
+            output.unlink(missing_ok=True)
+        todo = (point for point in self.points() if point.key() not in done)
+
+        written = 0
+        new_file = not output.exists() or output.stat().st_size == 0
+        with output.open("a", encoding="utf-8", newline="") as file:
+            writer = csv.writer(file)
+            if new_file:
+                writer.writerow(self.COLUMNS)
+            for point, result in self.iter_results(todo):
+                writer.writerow(point + result)
+                # One flushed row per point: an interrupted sweep loses at
+                # most the points still in flight.
+                file.flush()
+                written += 1
+        return written
+
+    def completed_points(self, output: Path) -> set[tuple[str, ...]]:
+        if not output.exists():
+            return set()
+        _drop_partial_row(output)
+        with output.open(encoding="utf-8", newline="") as file:
+            reader = csv.reader(file)
+            header = next(reader, None)
+            if header is None:
+                return set()
+            if tuple(header) != self.COLUMNS:
+                raise ValueError(f"{output} has different columns; use a new output file.")
+            sessions = self.COLUMNS.index("sessions")
+            seeds = [str(len(self.__seeds)), str(self.__seeds[0]), str(self.__seeds[-1])]
+            done = set()
+            for row in reader:
+                if row[sessions:sessions + 3] != seeds:
+                    raise ValueError(f"{output} was written with different seeds; use a new output file.")
+                done.add(tuple(row[:len(SweepPoint._fields)]))
+        return done
+
+
+def _drop_partial_row(output: Path) -> None:
+    # A killed run can leave half a row behind; cut the file back to the
+    # last complete line. Rows are short, so the tail is enough to look at.
+    with output.open("rb+") as file:
+        size = file.seek(0, os.SEEK_END)
+        start = max(0, size - 65536)
+        file.seek(start)
+        tail = file.read()
+        if tail and not tail.endswith(b"\n"):
+            file.truncate(start + tail.rfind(b"\n") + 1)
+
+
+@lru_cache(maxsize=256)
+def _point_scenario(
+    supervisor_intelligence: int,
+    supervisor_loyalty: int,
+    commission_loyalty: int,
+    theme_complexity: int,
+    student_stamina: int,
+    project_quality: int,
+) -> Scenario:
+    default = Scenario.default()
+    themes = [theme for theme in default.get_themes() if theme.get_complexity() == theme_complexity]
+    if not themes:
+        raise ValueError(f"No theme with complexity {theme_complexity}.")
+    return Scenario(
+        name="sweep",
+        themes=themes,
+        supervisor_names=default.get_supervisor_names(),
+        student_stamina=student_stamina,
+        project_quality=project_quality,
+        supervisor_intelligence=(supervisor_intelligence, supervisor_intelligence),
+        supervisor_loyalty=(supervisor_loyalty, supervisor_loyalty),
+        commission_loyalty=(commission_loyalty, commission_loyalty),
+    )
+
+
+def _run_point(point: SweepPoint, seeds: Sequence[int]) -> tuple:
+    scenario = _point_scenario(*point[1:7])
+    policy = POLICIES[point.policy]
+    passed = 0
+    grades: list[int] = []
+    scores: list[int] = []
+    steps = 0
+    for seed in seeds:
+        record = BatchSimulator.play_session(seed, "Sweep Student", point.student_intelligence, policy, scenario)
+        passed += bool(record["defense_passed"])
+        grades.append(int(record["final_grade"]))
+        scores.append(int(record["score"]))
+        steps += int(record["steps"])
+    count = len(seeds)
+    return (
+        count,
+        seeds[0],
+        seeds[-1],
+        passed,
+        round(sum(grades) / count, 4),
+        min(grades),
+        max(grades),
+        round(sum(scores) / count, 4),
+        min(scores),
+        max(scores),
+        round(steps / count, 4),
+    )
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import random
+from collections.abc import Callable
+
+from domain import DefenseProcess
+
+Policy = Callable[[DefenseProcess, random.Random], str]
+
+
+def first_action_policy(process: DefenseProcess, rng: random.Random) -> str:
+    return process.get_available_actions()[0]
+
+
+def random_policy(process: DefenseProcess, rng: random.Random) -> str:
+    return rng.choice(process.get_available_actions())
+
+
+def greedy_policy(process: DefenseProcess, rng: random.Random) -> str:
+    status = process.get_status()
+    actions = process.get_available_actions()
+    stamina = int(status["stamina"])
+
+    if "attestation" in actions:
+        return "attestation"
+    if "submit_for_inspection" in actions:
+        return "submit_for_inspection"
+    if "defense" in actions:
+        return "defense"
+    if stamina < 40 and "rest" in actions:
+        return "rest"
+    if "work_thesis" in actions and int(status["thesis_completion"]) < 100:
+        return "work_thesis"
+    if "prepare_slides" in actions and int(status["presentation"]) < 100:
+        return "prepare_slides"
+    if "rehearse" in actions and int(status["answer_skill"]) < 3:
+        return "rehearse"
+    return "rest"
+
+
+POLICIES: dict[str, Policy] = {
+    "first": first_action_policy,
+    "random": random_policy,
+    "greedy": greedy_policy,
+}
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import random
+
+from domain import (
+    DefenseProcess,
+    DiplomaProject,
+    Presentation,
+    Scenario,
+    Student,
+)
+
+
+def create_process(
+    student_name: str,
+    student_intelligence: int,
+    seed: int | None = None,
+    scenario: Scenario | None = None,
+) -> DefenseProcess:
+    scenario = scenario or Scenario.default()
+    rng = random.Random(seed)
+
+    student = Student(
+        name=student_name,
+        intelligence=student_intelligence,
+        stamina=scenario.get_student_stamina(),
+        answer_skill=0,
+    )
+    diploma = DiplomaProject(
+        pct_complition=0,
+        quality=scenario.get_project_quality(),
+        theme=rng.choice(scenario.get_themes()),
+    )
+    presentation = Presentation(pct_complition=0)
+    supervisor = scenario.get_supervisor(
+        rng.choice(scenario.get_supervisor_names()),
+        rng.randint(*scenario.get_supervisor_intelligence()),
+        rng.randint(*scenario.get_supervisor_loyalty()),
+    )
+    commission = scenario.get_commission(rng.randint(*scenario.get_commission_loyalty()))
+
+    return DefenseProcess(
+        student=student,
+        diploma_project=diploma,
+        presentation=presentation,
+        scientific_supervisor=supervisor,
+        commission=commission,
+        seed=seed,
+        scenario=scenario,
+    )
@@ -0,0 +1,351 @@
+from __future__ import annotations
+
+import json
+import struct
+import zlib
+from pathlib import Path
+
+from domain import DefenseProcess, DefenseStage
+
+from .process_factory import create_process
+
+_STAGES: tuple[DefenseStage, ...] = tuple(DefenseStage)
+_ACTIONS: tuple[str, ...] = tuple(DefenseProcess.ACTION_LABELS)
+_INT64_RANGE: range = range(-(1 << 63), 1 << 63)
+
+
+class JsonSaveCodec:
+    NAME: str = "json"
+    EXTENSION: str = ".json"
+
+    def encode(self, payload: dict[str, object]) -> bytes:
+        return json.dumps(payload, ensure_ascii=False, indent=2).encode("utf-8")
+
+    def decode(self, data: bytes) -> dict[str, object]:
+        payload = json.loads(data.decode("utf-8"))
+        if not isinstance(payload, dict) or not isinstance(payload.get("process"), dict):
+            raise ValueError("Corrupted save file: missing process data.")
+        return payload
+
+
+class BinarySaveCodec:
+    NAME: str = "binary"
+    EXTENSION: str = ".dps"
+    MAGIC: bytes = b"DPSV"
+    VERSION: int = 1
+
+    # Header: magic, format version, CRC32 of everything after the header.
+    _HEADER = struct.Struct("<4sHI")
+    # Body: slot, today, stage, revision bit mask, defense_passed, has_final_grade,
+    # student intelligence/stamina/answer_skill, theme complexity, thesis
+    # completion/quality, presentation, supervisor intelligence/loyalty,
+    # commission loyalty, final_grade, score, seed kind. Strings follow as
+    # length-prefixed UTF-8: student, theme and supervisor names, then the seed.
+    _RECORD = struct.Struct("<I15BhiB")
+    _LENGTH = struct.Struct("<H")
+    _INT_SEED = struct.Struct("<q")
+
+    _SEED_NONE = 0
+    _SEED_INT = 1
+    _SEED_STATE = 2
+    # Integers outside int64 are kept as decimal text.
+    _SEED_BIG_INT = 3
+
+    def encode(self, payload: dict[str, object]) -> bytes:
+        process = payload["process"]
+        if "scenario" in process:
+            raise ValueError("Binary saves only support the built-in scenario; use the json format.")
+        student = process["student"]
+        diploma = process["diploma_project"]
+        supervisor = process["supervisor"]
+        revision = process["revision_passed"]
+        final_grade = process["final_grade"]
+        seed = process["seed"]
+
+        if seed is None:
+            seed_kind, seed_bytes = self._SEED_NONE, b""
+        elif isinstance(seed, int) and seed in _INT64_RANGE:
+            seed_kind, seed_bytes = self._SEED_INT, self._INT_SEED.pack(seed)
+        elif isinstance(seed, int):
+            seed_kind, seed_bytes = self._SEED_BIG_INT, self._pack_str(str(seed))
+        else:
+            seed_kind, seed_bytes = self._SEED_STATE, self._pack_str(str(seed))
+
+        body = b"".join((
+            self._RECORD.pack(
+                int(payload["slot"]),
+                process["today"],
+                _STAGES.index(DefenseStage[process["stage"]]),
+                revision[0] | revision[1] << 1 | revision[2] << 2,
+                process["defense_passed"],
+                final_grade is not None,
+                student["intelligence"],
+                student["stamina"],
+                student["answer_skill"],
+                process["theme"]["complexity"],
+                diploma["pct_complition"],
+                diploma["quality"],
+                process["presentation"]["pct_complition"],
+                supervisor["intelligence"],
+                supervisor["loyalty"],
+                process["commission"]["loyalty"],
+                final_grade or 0,
+                process["score"],
+                seed_kind,
+            ),
+            self._pack_str(student["name"]),
+            self._pack_str(process["theme"]["name"]),
+            self._pack_str(supervisor["name"]),
+            seed_bytes,
+        ))
+        return self._HEADER.pack(self.MAGIC, self.VERSION, zlib.crc32(body)) + body
+
+    def decode(self, data: bytes) -> dict[str, object]:
+        if len(data) < self._HEADER.size + self._RECORD.size:
+            raise ValueError("Corrupted save file: truncated record.")
+        magic, version, checksum = self._HEADER.unpack_from(data)
+        if magic != self.MAGIC:
+            raise ValueError("Corrupted save file: bad magic.")
+        if version != self.VERSION:
+            raise ValueError(f"Unsupported save format version {version}.")
+        body = memoryview(data)[self._HEADER.size:]
+        if zlib.crc32(body) != checksum:
+            raise ValueError("Corrupted save file: checksum mismatch.")
+
+        (slot, today, stage, revision, defense_passed, has_grade, intelligence, stamina,
+         answer_skill, complexity, completion, quality, presentation, supervisor_intelligence,
+         supervisor_loyalty, commission_loyalty, final_grade, score,
+         seed_kind) = self._RECORD.unpack_from(body)
+        offset = self._RECORD.size
+        student_name, offset = self._unpack_str(body, offset)
+        theme_name, offset = self._unpack_str(body, offset)
+        supervisor_name, offset = self._unpack_str(body, offset)
+        if seed_kind == self._SEED_INT:
+            seed = self._INT_SEED.unpack_from(body, offset)[0]
+        elif seed_kind == self._SEED_STATE:
+            seed = self._unpack_str(body, offset)[0]
+        elif seed_kind == self._SEED_BIG_INT:
+            seed = int(self._unpack_str(body, offset)[0])
+        else:
+            seed = None
+
+        return {
+            "slot": slot,
+            "process": {
+                "today": today,
+                "stage": _STAGES[stage].name,
+                "seed": seed,
+                "revision_passed": [bool(revision & 1), bool(revision & 2), bool(revision & 4)],
+                "defense_passed": bool(defense_passed),
+                "final_grade": final_grade if has_grade else None,
+                "score": score,
+                "student": {
+                    "name": student_name,
+                    "intelligence": intelligence,
+                    "stamina": stamina,
+                    "answer_skill": answer_skill,
+                },
+                "theme": {
+                    "name": theme_name,
+                    "complexity": complexity,
+                },
+                "diploma_project": {
+                    "pct_complition": completion,
+                    "quality": quality,
+                },
+                "presentation": {
+                    "pct_complition": presentation,
+                },
+                "supervisor": {
+                    "name": supervisor_name,
+                    "intelligence": supervisor_intelligence,
+                    "loyalty": supervisor_loyalty,
+                },
+                "commission": {
+                    "loyalty": commission_loyalty,
+                },
+            },
+        }
+
+    def _pack_str(self, value: str) -> bytes:
+        raw = value.encode("utf-8")
+        return self._LENGTH.pack(len(raw)) + raw
+
+    def _unpack_str(self, body: memoryview, offset: int) -> tuple[str, int]:
+        (length,) = self._LENGTH.unpack_from(body, offset)
+        start = offset + self._LENGTH.size
+        if start + length > len(body):
+            raise ValueError("Corrupted save file: truncated record.")
+        return str(body[start:start + length], "utf-8"), start + length
+
+
+class ReplaySaveCodec:
+    NAME: str = "replay"
+    EXTENSION: str = ".dpr"
+    MAGIC: bytes = b"DPRP"
+    VERSION: int = 1
+    DEFAULT_CHECKPOINT_INTERVAL: int = 8
+
+    _HEADER = struct.Struct("<4sHI")
+    # Body: slot, seed, student intelligence, action count, checkpoint
+    # interval. The student name follows as length-prefixed UTF-8, then the
+    # action codes packed two per byte, then one snapshot per checkpoint.
+    _RECORD = struct.Struct("<IqBHB")
+    _LENGTH = struct.Struct("<H")
+    # Snapshot: today, stage, stamina, answer_skill, completion, quality,
+    # presentation, flags (revisions, defense_passed, has_final_grade),
+    # final_grade, score.
+    _SNAPSHOT = struct.Struct("<8Bhi")
+
+    def __init__(self, checkpoint_interval: int = DEFAULT_CHECKPOINT_INTERVAL):
+        if not 0 <= checkpoint_interval <= 255:
+            raise ValueError("Checkpoint interval must be within 0..255.")
+        self.__checkpoint_interval: int = checkpoint_interval
+
+    def encode(self, payload: dict[str, object]) -> bytes:
+        replay = payload.get("replay")
+        if not isinstance(replay, dict):
+            raise ValueError("Replay saves need the session's action history.")
+        if "scenario" in payload["process"]:
+            raise ValueError("Replay saves only support the built-in scenario; use the json format.")
+        seed = replay["seed"]
+        if not isinstance(seed, int) or seed not in _INT64_RANGE:
+            raise ValueError("Replay saves need a 64-bit integer seed.")
+
+        actions = list(replay["actions"])
+        interval = self.__checkpoint_interval
+        checkpoints: list[bytes] = []
+        if interval:
+            process = create_process(replay["student_name"], replay["student_intelligence"], seed)
+            for index, action in enumerate(actions, start=1):
+                process.perform_action(action)
+                if index % interval == 0:
+                    checkpoints.append(self._pack_snapshot(process.snapshot()))
+
+        codes = [_ACTIONS.index(action) for action in actions]
+        if len(codes) % 2:
+            codes.append(0)
+        packed = bytes(codes[idx] | codes[idx + 1] << 4 for idx in range(0, len(codes), 2))
+        name = str(replay["student_name"]).encode("utf-8")
+        body = b"".join((
+            self._RECORD.pack(
+                int(payload["slot"]),
+                seed,
+                replay["student_intelligence"],
+                len(actions),
+                interval,
+            ),
+            self._LENGTH.pack(len(name)),
+            name,
+            packed,
+            *checkpoints,
+        ))
+        return self._HEADER.pack(self.MAGIC, self.VERSION, zlib.crc32(body)) + body
+
+    def decode(self, data: bytes) -> dict[str, object]:
+        slot, replay, checkpoints = self._parse(data)
+        process = create_process(replay["student_name"], replay["student_intelligence"], replay["seed"])
+        actions = replay["actions"]
+        start = 0
+        if checkpoints:
+            # Only the actions after the last checkpoint are replayed.
+            start, token = checkpoints[-1]
+            process.restore(token)
+        for action in actions[start:]:
+            process.perform_action(action)
+        return {"slot": slot, "process": process.to_dict(), "replay": replay}
+
+    def verify(self, data: bytes, expected: dict[str, object] | None = None) -> bool:
+        try:
+            _, replay, checkpoints = self._parse(data)
+            process = create_process(replay["student_name"], replay["student_intelligence"], replay["seed"])
+            stored = dict(checkpoints)
+            for index, action in enumerate(replay["actions"], start=1):
+                process.perform_action(action)
+                if index in stored and stored.pop(index) != process.snapshot():
+                    return False
+        except ValueError:
+            return False
+        if stored:
+            return False
+        if expected is None:
+            return True
+        result = process.to_dict()
+        reference = dict(expected)
+        for item in (result, reference):
+            item.pop("seed", None)
+            item["revision_passed"] = [bool(flag) for flag in item["revision_passed"]]
+        return result == reference
+
+    def _parse(self, data: bytes) -> tuple[int, dict[str, object], list[tuple[int, tuple]]]:
+        if len(data) < self._HEADER.size + self._RECORD.size + self._LENGTH.size:
+            raise ValueError("Corrupted save file: truncated record.")
+        magic, version, checksum = self._HEADER.unpack_from(data)
+        if magic != self.MAGIC:
+            raise ValueError("Corrupted save file: bad magic.")
+        if version != self.VERSION:
+            raise ValueError(f"Unsupported save format version {version}.")
+        body = memoryview(data)[self._HEADER.size:]
+        if zlib.crc32(body) != checksum:
+            raise ValueError("Corrupted save file: checksum mismatch.")
+
+        slot, seed, intelligence, count, interval = self._RECORD.unpack_from(body)
+        offset = self._RECORD.size
+        (length,) = self._LENGTH.unpack_from(body, offset)
+        offset += self._LENGTH.size
+        name = str(body[offset:offset + length], "utf-8")
+        offset += length
+        packed = body[offset:offset + (count + 1) // 2]
+        offset += len(packed)
+        if len(packed) != (count + 1) // 2:
+            raise ValueError("Corrupted save file: truncated record.")
+        try:
+            actions = [_ACTIONS[packed[idx // 2] >> (idx % 2 * 4) & 0xF] for idx in range(count)]
+        except IndexError:
+            raise ValueError("Corrupted save file: unknown action code.") from None
+
+        checkpoints: list[tuple[int, tuple]] = []
+        for index in range(interval, count + 1, interval) if interval else ():
+            if offset + self._SNAPSHOT.size > len(body):
+                raise ValueError("Corrupted save file: truncated record.")
+            checkpoints.append((index, self._unpack_snapshot(body, offset)))
+            offset += self._SNAPSHOT.size
+
+        replay = {
+            "seed": seed,
+            "student_name": name,
+            "student_intelligence": intelligence,
+            "actions": actions,
+        }
+        return slot, replay, checkpoints
+
+    def _pack_snapshot(self, token: tuple) -> bytes:
+        (today, stage, stamina, answer_skill, completion, quality, presentation,
+         revision_0, revision_1, revision_2, defense_passed, final_grade, score) = token
+        flags = (revision_0 | revision_1 << 1 | revision_2 << 2 | defense_passed << 3
+                 | (final_grade is not None) << 4)
+        return self._SNAPSHOT.pack(
+            today, _STAGES.index(stage), stamina, answer_skill, completion, quality,
+            presentation, flags, final_grade or 0, score,
+        )
+
+    def _unpack_snapshot(self, body: memoryview, offset: int) -> tuple:
+        (today, stage, stamina, answer_skill, completion, quality, presentation, flags,
+         final_grade, score) = self._SNAPSHOT.unpack_from(body, offset)
+        return (
+            today, _STAGES[stage], stamina, answer_skill, completion, quality, presentation,
+            bool(flags & 1), bool(flags & 2), bool(flags & 4), bool(flags & 8),
+            final_grade if flags & 16 else None, score,
+        )
+
+
+SAVE_CODECS: dict[str, JsonSaveCodec | BinarySaveCodec | ReplaySaveCodec] = {
+    codec.NAME: codec for codec in (JsonSaveCodec(), BinarySaveCodec(), ReplaySaveCodec())
+}
+
+
+def codec_for_path(path: Path) -> JsonSaveCodec | BinarySaveCodec | ReplaySaveCodec | None:
+    for codec in SAVE_CODECS.values():
+        if codec.EXTENSION == path.suffix:
+            return codec
+    return None
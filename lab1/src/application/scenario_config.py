@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import json
+import tomllib
+from collections.abc import Mapping
+from functools import lru_cache
+from pathlib import Path
+
+from domain import DefenseCalendar, DefenseRules, DefenseStage, Gain, RevisionCheck, RevisionWindow, Scenario, Theme
+
+SCENARIO_SUFFIXES: tuple[str, ...] = (".toml", ".json")
+
+_GAIN_FIELDS: tuple[str, ...] = ("completion", "quality", "presentation")
+_INT_FIELDS: tuple[str, ...] = ("stamina", "score", "review", "rehearse")
+_SECTIONS: tuple[str, ...] = (
+    "name", "student", "project", "themes", "supervisors", "commission", "calendar", "rules", "actions",
+)
+
+
+def load_scenario(path: Path | str) -> Scenario:
+    path = Path(path).resolve()
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Scenario file {path} does not exist.") from None
+    # Keyed by modification time too, so an edited file is picked up while
+    # unchanged files are parsed and compiled only once per process.
+    return _load(path, stat.st_mtime_ns, stat.st_size)
+
+
+def clear_scenario_cache() -> None:
+    _load.cache_clear()
+
+
+@lru_cache(maxsize=16)
+def _load(path: Path, mtime_ns: int, size: int) -> Scenario:
+    if path.suffix not in SCENARIO_SUFFIXES:
+        raise ValueError(f"Scenario file must be one of: {', '.join(SCENARIO_SUFFIXES)}.")
+    raw = path.read_bytes()
+    try:
+        data = tomllib.loads(raw.decode("utf-8")) if path.suffix == ".toml" else json.loads(raw)
+    except (UnicodeDecodeError, tomllib.TOMLDecodeError, json.JSONDecodeError) as error:
+        raise ValueError(f"Cannot parse scenario {path.name}: {error}") from None
+    try:
+        return parse_scenario(data)
+    except ValueError as error:
+        raise ValueError(f"Invalid scenario {path.name}: {error}") from None
+
+
+def parse_scenario(data: Mapping[str, object]) -> Scenario:
+    if not isinstance(data, Mapping):
+        raise ValueError("Scenario must be a table/object.")
+    name = _str(data, "name")
+    if name == Scenario.DEFAULT_NAME:
+        raise ValueError(f"Scenario name {Scenario.DEFAULT_NAME!r} is reserved for the built-in rules.")
+    unknown = sorted(set(data) - set(_SECTIONS))
+    if unknown:
+        raise ValueError(f"Unknown scenario sections: {', '.join(unknown)}.")
+
+    default = Scenario.default()
+    student = _table(data, "student")
+    project = _table(data, "project")
+    supervisors = _table(data, "supervisors")
+    commission = _table(data, "commission")
+
+    themes = data.get("themes")
+    if themes is None:
+        parsed_themes = default.get_themes()
+    else:
+        parsed_themes = tuple(Theme(_str(item, "name"), _int(item, "complexity")) for item in _list(themes, "themes"))
+
+    return Scenario(
+        name=name,
+        themes=parsed_themes,
+        supervisor_names=tuple(
+            str(item) for item in _list(supervisors.get("names", default.get_supervisor_names()), "supervisors.names")),
+        student_stamina=_int(student, "stamina", default.get_student_stamina()),
+        project_quality=_int(project, "quality", default.get_project_quality()),
+        supervisor_intelligence=_range(supervisors, "intelligence", default.get_supervisor_intelligence()),
+        supervisor_loyalty=_range(supervisors, "loyalty", default.get_supervisor_loyalty()),
+        commission_loyalty=_range(commission, "loyalty", default.get_commission_loyalty()),
+        calendar=_parse_calendar(_table(data, "calendar")),
+        rules=_parse_rules(_table(data, "rules"), _table(data, "actions")),
+    )
+
+
+def _parse_calendar(data: Mapping[str, object]) -> type[DefenseCalendar]:
+    if not data:
+        return DefenseCalendar
+    windows = _list(data.get("revision_windows", []), "calendar.revision_windows")
+    parsed_windows = DefenseCalendar.REVISION_WINDOWS
+    if windows:
+        if len(windows) != len(DefenseCalendar.REVISION_WINDOWS):
+            raise ValueError(f"Calendar needs exactly {len(DefenseCalendar.REVISION_WINDOWS)} revision windows.")
+        parsed_windows = []
+        for item, base in zip(windows, DefenseCalendar.REVISION_WINDOWS):
+            if not isinstance(item, Mapping):
+                raise ValueError("calendar.revision_windows entries must be tables.")
+            parsed_windows.append(RevisionWindow(
+                opens=_int(item, "opens"),
+                closes=_int(item, "closes"),
+                next_stage=_stage(item.get("next_stage", base.next_stage.name)),
+            ))
+    return DefenseCalendar.derive(
+        max_day=_int(data, "max_day", DefenseCalendar.MAX_DAY),
+        revision_windows=tuple(parsed_windows),
+        defense_days=_ints(data, "defense_days", DefenseCalendar.DEFENSE_DAYS),
+    )
+
+
+def _parse_rules(constants: Mapping[str, object], actions: Mapping[str, object]) -> type[DefenseRules]:
+    checks = constants.get("revision_checks")
+    if not actions and not constants:
+        return DefenseRules
+
+    overrides: dict[str, dict[str, object]] = {}
+    for code, fields in actions.items():
+        if not isinstance(fields, Mapping):
+            raise ValueError(f"actions.{code} must be a table.")
+        parsed: dict[str, object] = {}
+        for field, value in fields.items():
+            if field in _GAIN_FIELDS:
+                gain = _table(fields, field)
+                parsed[field] = Gain(_int(gain, "base"), _int(gain, "per_efficiency"))
+            elif field in _INT_FIELDS:
+                parsed[field] = _int(fields, field)
+            else:
+                parsed[field] = value
+        overrides[code] = parsed
+
+    return DefenseRules.derive(
+        constants={
+            key.upper(): _int(constants, key) for key in constants if key != "revision_checks"
+        },
+        actions=overrides,
+        revision_checks=None if checks is None else tuple(
+            RevisionCheck(_int(item, "min_completion"), _int(item, "day_divisor"), _int(item, "score"))
+            for item in _list(checks, "rules.revision_checks")
+        ),
+    )
+
+
+def _table(data: Mapping[str, object], key: str) -> Mapping[str, object]:
+    value = data.get(key, {})
+    if not isinstance(value, Mapping):
+        raise ValueError(f"{key} must be a table.")
+    return value
+
+
+def _list(value: object, key: str) -> list[object]:
+    if not isinstance(value, (list, tuple)):
+        raise ValueError(f"{key} must be a list.")
+    return list(value)
+
+
+def _str(data: Mapping[str, object], key: str) -> str:
+    value = data.get(key) if isinstance(data, Mapping) else None
+    if not isinstance(value, str) or not value:
+        raise ValueError(f"{key} must be a non-empty string.")
+    return value
+
+
+def _int(data: Mapping[str, object], key: str, default: int | None = None) -> int:
+    value = data.get(key, default) if isinstance(data, Mapping) else None
+    if not isinstance(value, int) or isinstance(value, bool):
+        raise ValueError(f"{key} must be an integer.")
+    return value
+
+
+def _ints(data: Mapping[str, object], key: str, default: tuple[int, ...]) -> tuple[int, ...]:
+    value = _list(data.get(key, default), key)
+    if not all(isinstance(item, int) and not isinstance(item, bool) for item in value):
+        raise ValueError(f"{key} must be a list of integers.")
+    return tuple(value)
+
+
+def _range(data: Mapping[str, object], key: str, default: tuple[int, int]) -> tuple[int, int]:
+    value = _ints(data, key, default)
+    if len(value) != 2:
+        raise ValueError(f"{key} must be a [low, high] pair of integers.")
+    return value[0], value[1]
+
+
+def _stage(name: object) -> DefenseStage:
+    try:
+        return DefenseStage[str(name)]
+    except KeyError:
+        raise ValueError(f"Unknown stage: {name}.") from None
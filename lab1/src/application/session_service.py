@@ -1,18 +1,21 @@
 from __future__ import annotations
 
-import json
-import random
+import time
+import zlib
+from collections import deque
+from collections.abc import Callable, Mapping
 from pathlib import Path
+from typing import TYPE_CHECKING, TextIO
 
-from domain import (
-    Commission,
-    DefenseProcess,
-    DiplomaProject,
-    Presentation,
-    ScientificSupervisor,
-    Student,
-    Theme,
-)
+from domain import DefenseCalendar, DefenseProcess, DefenseStage, Scenario
+
+from .metrics import Metrics
+from .process_factory import create_process
+from .slot_storage import FileSlotStorage, SlotStorage
+
+if TYPE_CHECKING:
+    from .advisor import Advice, MctsAdvisor
+    from .win_estimator import BackgroundEstimator, Estimate
 
 class SessionService:
     ACTION_HELP: dict[str, str] = {
@@ -26,13 +29,93 @@ class SessionService:
         "attestation": "",
     }
     
-    def __init__(self, saves_dir: str | Path):
+    DEFAULT_SNAPSHOT_INTERVAL: int = 32
+    DEFAULT_HISTORY_SIZE: int = 64
+
+    def __init__(
+        self,
+        saves_dir: str | Path,
+        journal: bool = False,
+        snapshot_interval: int = DEFAULT_SNAPSHOT_INTERVAL,
+        save_format: str = "json",
+        storage: SlotStorage | None = None,
+        autosave: bool = True,
+        history_size: int = DEFAULT_HISTORY_SIZE,
+        metrics: bool = False,
+        scenario: Scenario | None = None,
+        estimate: bool = False,
+    ):
+        if snapshot_interval <= 0:
+            raise ValueError("Snapshot interval must be >= 1.")
+        if history_size < 0:
+            raise ValueError("History size must be >= 0.")
+
         self.__saves_dir = Path(saves_dir)
         self.__process: DefenseProcess | None = None
+        self.__scenario: Scenario = scenario or Scenario.default()
         self.__slot: int | None = None
+        self.__advisor: MctsAdvisor | None = None
+        self.__estimate: bool = estimate
+        self.__estimator: BackgroundEstimator | None = None
+        self.__estimate_listener: Callable[[Estimate], None] | None = None
+        self.__journal: bool = journal
+        self.__autosave: bool = autosave
+        self.__replay: dict[str, object] | None = None
+        self.__undo: deque[tuple[tuple, str]] = deque(maxlen=history_size)
+        self.__redo: deque[tuple[tuple, str]] = deque(maxlen=history_size)
+        self.__journal_stale: bool = False
+        self.__journal_session: str = ""
+        self.__snapshot_interval: int = snapshot_interval
+        self.__journal_file: TextIO | None = None
+        self.__pending_actions: int = 0
+        self.__storage: SlotStorage = (
+            storage if storage is not None else FileSlotStorage(self.__saves_dir, save_format)
+        )
+        save_format = self.__storage.get_save_format()
+        if not self.__scenario.is_builtin() and save_format != "json":
+            raise ValueError(
+                f"Scenario {self.__scenario.get_name()!r} needs json saves; {save_format} saves "
+                "only support the built-in scenario.")
+        # Metrics are opt-in; with None every hook below is a single identity check.
+        self.__metrics: Metrics | None = Metrics() if metrics else None
+        if self.__metrics is not None and storage is None:
+            # A shared storage reports to whoever enables metrics on it.
+            self.__storage.set_metrics(self.__metrics)
+
+    def get_action_history(self) -> list[str]:
+        self._require_process()
+        if self.__replay is None:
+            raise RuntimeError("Action history is only recorded for sessions started with a seed.")
+        return list(self.__replay["actions"])
+
+    def get_storage(self) -> SlotStorage:
+        return self.__storage
+
+    def get_metrics(self) -> Metrics | None:
+        return self.__metrics
+
+    def get_scenario(self) -> Scenario:
+        return self.__scenario
+
+    def get_calendar(self) -> type[DefenseCalendar]:
+        return self.__scenario.get_calendar()
 
     def has_save(self, slot: int) -> bool:
-        return self._slot_path(slot).exists()
+        return self.__storage.exists(slot)
+
+    @staticmethod
+    def create_process(
+        student_name: str,
+        student_intelligence: int,
+        seed: int | None = None,
+        scenario: Scenario | None = None,
+    ) -> DefenseProcess:
+        return create_process(
+            student_name=student_name,
+            student_intelligence=student_intelligence,
+            seed=seed,
+            scenario=scenario,
+        )
 
     def start_new(
         self,
@@ -42,81 +125,125 @@ class SessionService:
         seed: int | None = None,
     ) -> DefenseProcess:
         self._validate_slot(slot)
-        rng = random.Random(seed)
-
-        themes = [
-            Theme("Smart recommendation system", 2),
-            Theme("Neural network optimization", 3),
-            Theme("Knowledge base assistant", 1),
-        ]
-        supervisors = ["Dr. Ivanov", "Dr. Petrov", "Dr. Sidorov"]
-
-        student = Student(
-            name=student_name,
-            intelligence=student_intelligence,
-            stamina=80,
-            answer_skill=0,
-        )
-        diploma = DiplomaProject(
-            pct_complition=0,
-            quality=90,
-            theme=rng.choice(themes),
-        )
-        presentation = Presentation(pct_complition=0)
-        supervisor = ScientificSupervisor(
-            name=rng.choice(supervisors),
-            intelligence=rng.randint(1, 3),
-            loyalty=rng.randint(1, 3),
-        )
-        commission = Commission(loyalty=rng.randint(1, 3))
-
-        process = DefenseProcess(
-            student=student,
-            diploma_project=diploma,
-            presentation=presentation,
-            scientific_supervisor=supervisor,
-            commission=commission,
+        process = self.create_process(
+            student_name=student_name,
+            student_intelligence=student_intelligence,
             seed=seed,
+            scenario=self.__scenario,
         )
+        self.close()
+        # A crashed journal-mode session can leave lines behind; they belong
+        # to the old session and must not be replayed onto this one.
+        self._journal_path(slot).unlink(missing_ok=True)
         self.__process = process
         self.__slot = slot
+        self.__journal_session = self._session_key(process)
+        self.__advisor = None
+        self.__undo.clear()
+        self.__redo.clear()
+        self.__replay = {
+            "seed": seed,
+            "student_name": student_name,
+            "student_intelligence": student_intelligence,
+            "actions": [],
+        } if isinstance(seed, int) else None
         self.save()
         return process
 
     def load(self, slot: int) -> DefenseProcess:
         self._validate_slot(slot)
-        slot_path = self._slot_path(slot)
-        if not slot_path.exists():
-            raise FileNotFoundError(f"Save slot {slot} does not exist.")
-
-        payload = json.loads(slot_path.read_text(encoding="utf-8"))
-        process_data = payload.get("process")
-        if not isinstance(process_data, dict):
-            raise ValueError("Corrupted save file: missing process data.")
-
-        process = DefenseProcess.from_dict(process_data)
+        self.close()
+        metrics = self.__metrics
+        started = time.perf_counter() if metrics is not None else 0.0
+        payload = self.__storage.read(slot)
+        process = DefenseProcess.from_dict(payload["process"], self.__scenario)
+        replay = payload.get("replay")
+        self.__replay = dict(replay, actions=list(replay["actions"])) if replay else None
+        restored = time.perf_counter() if metrics is not None else 0.0
+        self.__journal_session = self._session_key(process)
+        replayed = self._replay_journal(process, slot)
+        if metrics is not None:
+            finished = time.perf_counter()
+            metrics.observe("load.journal_replay", finished - restored)
+            metrics.observe("load.total", finished - started)
         self.__process = process
         self.__slot = slot
+        self.__advisor = None
+        self.__undo.clear()
+        self.__redo.clear()
+        self.__pending_actions = replayed
         return process
 
     def save(self) -> Path:
         process = self._require_process()
         slot = self._require_slot()
-        self.__saves_dir.mkdir(parents=True, exist_ok=True)
-
-        path = self._slot_path(slot)
-        tmp_path = path.with_suffix(".tmp")
+        metrics = self.__metrics
+        started = time.perf_counter() if metrics is not None else 0.0
         payload = {"slot": slot, "process": process.to_dict()}
-        tmp_path.write_text(
-            json.dumps(payload, ensure_ascii=False, indent=2),
-            encoding="utf-8",
-        )
-        tmp_path.replace(path)
+        if self.__replay is not None:
+            payload["replay"] = dict(self.__replay, actions=list(self.__replay["actions"]))
+        path = self.__storage.write(slot, payload)
+        if self.__journal_file is not None or self.__pending_actions:
+            self._truncate_journal(slot)
+        self.__pending_actions = 0
+        self.__journal_stale = False
+        if metrics is not None:
+            metrics.observe("save.total", time.perf_counter() - started)
         return path
 
-    def get_status(self) -> dict[str, int | str | bool]:
+    def convert_slot(self, slot: int, save_format: str) -> Path:
+        self._validate_slot(slot)
+        if not isinstance(self.__storage, FileSlotStorage):
+            raise RuntimeError("Save formats can only be converted in file storage.")
+        return self.__storage.convert(slot, save_format)
+
+    def list_slots(self) -> list[dict[str, object]]:
+        return self.__storage.list_slots()
+
+    def query_slots(
+        self,
+        stage: DefenseStage | str | None = None,
+        min_day: int | None = None,
+        max_day: int | None = None,
+        min_score: int | None = None,
+        max_score: int | None = None,
+        sort_by: str = "slot",
+        descending: bool = False,
+        limit: int | None = None,
+    ) -> list[dict[str, object]]:
+        return self.__storage.query_slots(
+            stage=stage,
+            min_day=min_day,
+            max_day=max_day,
+            min_score=min_score,
+            max_score=max_score,
+            sort_by=sort_by,
+            descending=descending,
+            limit=limit,
+        )
+
+    def close(self) -> None:
+        if self.__pending_actions and self.__process is not None:
+            self.save()
+        if self.__journal_file is not None:
+            self.__journal_file.close()
+            self.__journal_file = None
+        self.__storage.flush()
+        if self.__estimator is not None:
+            self.__estimator.close()
+            self.__estimator = None
+
+    def get_status(self) -> Mapping[str, object]:
+        if self.__metrics is not None:
+            self.__metrics.increment("calls.get_status")
         return self._require_process().get_status()
 
+    def get_version(self) -> int:
+        return self._require_process().get_version()
+
+    def has_changed_since(self, version: int) -> bool:
+        return self._require_process().has_changed_since(version)
+
     def get_available_actions(self) -> list[str]:
         return self._require_process().get_available_actions()
 
@@ -129,15 +256,164 @@ class SessionService:
 
     def perform_action(self, action_code: str) -> None:
         process = self._require_process()
-        result = process.perform_action(action_code)
-        self.save()
+        day = process.get_today()
+        token = process.snapshot()
+        metrics = self.__metrics
+        if metrics is None:
+            result = process.perform_action(action_code)
+        else:
+            started = time.perf_counter()
+            result = process.perform_action(action_code)
+            metrics.observe(f"action.{action_code}", time.perf_counter() - started)
+        self.__undo.append((token, action_code))
+        self.__redo.clear()
+        if self.__replay is not None:
+            self.__replay["actions"].append(action_code)
+        if self.__advisor is not None:
+            self.__advisor.advance(action_code)
+        if not self.__journal:
+            if self.__autosave:
+                self.save()
+            else:
+                self.__pending_actions += 1
+            return result
+
+        self.__pending_actions += 1
+        if self.__journal_stale:
+            # After an undo the log no longer leads to the current state.
+            self.save()
+            return result
+        self._append_journal(action_code, day)
+        if self.__pending_actions >= self.__snapshot_interval or process.is_finished():
+            self.save()
         return result
 
+    def can_undo(self) -> bool:
+        return bool(self.__undo)
+
+    def can_redo(self) -> bool:
+        return bool(self.__redo)
+
+    def undo(self) -> None:
+        process = self._require_process()
+        if not self.__undo:
+            raise RuntimeError("Nothing to undo.")
+        token, action_code = self.__undo.pop()
+        self.__redo.append((process.snapshot(), action_code))
+        process.restore(token)
+        if self.__replay is not None:
+            self.__replay["actions"].pop()
+        self._mark_dirty()
+
+    def redo(self) -> None:
+        process = self._require_process()
+        if not self.__redo:
+            raise RuntimeError("Nothing to redo.")
+        token, action_code = self.__redo.pop()
+        self.__undo.append((process.snapshot(), action_code))
+        process.restore(token)
+        if self.__replay is not None:
+            self.__replay["actions"].append(action_code)
+        self._mark_dirty()
+
+    def get_hint(self, time_budget: float | None = None, max_iterations: int | None = None) -> Advice:
+        process = self._require_process()
+        if self.__advisor is None:
+            from .advisor import MctsAdvisor
+
+            self.__advisor = MctsAdvisor()
+        if self.__metrics is None:
+            return self.__advisor.advise(process, time_budget=time_budget, max_iterations=max_iterations)
+
+        started = time.perf_counter()
+        advice = self.__advisor.advise(process, time_budget=time_budget, max_iterations=max_iterations)
+        self.__metrics.observe("advisor.hint", time.perf_counter() - started)
+        return advice
+
+    def get_estimate(self) -> Estimate | None:
+        # Rollouts run on a background worker; this only queues the current
+        # state and returns the last finished estimate, possibly for an
+        # earlier state (compare its version with get_version()).
+        if not self.__estimate:
+            return None
+        process = self._require_process()
+        if self.__estimator is None:
+            from .win_estimator import BackgroundEstimator
+
+            self.__estimator = BackgroundEstimator(on_done=self._estimate_finished)
+        self.__estimator.request(process)
+        return self.__estimator.get_latest()
+
+    def set_estimate_listener(self, listener: Callable[[Estimate], None] | None) -> None:
+        # The listener runs on the estimator thread, so it must not touch the
+        # session itself; it only gets the finished estimate.
+        self.__estimate_listener = listener
+
+    def _estimate_finished(self, estimate: Estimate) -> None:
+        listener = self.__estimate_listener
+        if listener is not None:
+            listener(estimate)
+
     def is_finished(self) -> bool:
         return self._require_process().is_finished()
 
-    def _slot_path(self, slot: int) -> Path:
-        return self.__saves_dir / f"slot_{slot}.json"
+    def _mark_dirty(self) -> None:
+        # Nothing is written here; close() or the next save() persists the state.
+        self.__pending_actions += 1
+        self.__journal_stale = self.__journal
+
+    def _journal_path(self, slot: int) -> Path:
+        return self.__saves_dir / f"slot_{slot}.journal"
+
+    @staticmethod
+    def _session_key(process: DefenseProcess) -> str:
+        return f"{process.get_seed()} {process.get_status()['student_name']}"
+
+    def _journal_record(self, action_code: str, day: int | str) -> str:
+        # The checksum also covers the session, so lines written by another
+        # session in the same slot fail the check instead of being replayed.
+        body = f"{action_code} {day}"
+        checksum = zlib.crc32(f"{self.__journal_session} {body}".encode("utf-8"))
+        return f"{body} {checksum:08x}\n"
+
+    def _append_journal(self, action_code: str, day: int) -> None:
+        if self.__journal_file is None:
+            self.__journal_file = self._journal_path(self._require_slot()).open(
+                "a", encoding="utf-8")
+        started = time.perf_counter() if self.__metrics is not None else 0.0
+        self.__journal_file.write(self._journal_record(action_code, day))
+        self.__journal_file.flush()
+        if self.__metrics is not None:
+            self.__metrics.observe("journal.append", time.perf_counter() - started)
+
+    def _truncate_journal(self, slot: int) -> None:
+        if self.__journal_file is not None:
+            self.__journal_file.truncate(0)
+        else:
+            self._journal_path(slot).unlink(missing_ok=True)
+
+    def _replay_journal(self, process: DefenseProcess, slot: int) -> int:
+        path = self._journal_path(slot)
+        if not path.exists():
+            return 0
+
+        replayed = 0
+        for line in path.read_text(encoding="utf-8").splitlines():
+            parts = line.split(" ")
+            # A torn or corrupted tail ends the replay; the snapshot stays valid.
+            if len(parts) != 3 or self._journal_record(parts[0], parts[1]) != line + "\n":
+                break
+            action_code, day = parts[0], int(parts[1])
+            # Records older than the snapshot were written before it was taken.
+            if day < process.get_today():
+                continue
+            if day != process.get_today() or action_code not in process.get_available_actions():
+                break
+            process.perform_action(action_code)
+            if self.__replay is not None:
+                self.__replay["actions"].append(action_code)
+            replayed += 1
+        return replayed
 
     @staticmethod
     def _validate_slot(slot: int) -> None:
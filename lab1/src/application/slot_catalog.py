@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import json
+import os
+import re
+import time
+from pathlib import Path
+
+from domain import DefenseStage
+
+from .save_codecs import codec_for_path
+
+_SLOT_FILE = re.compile(r"slot_(\d+)(\.[a-z]+)$")
+_STAGE_ORDER: dict[str, int] = {stage.value: idx for idx, stage in enumerate(DefenseStage)}
+
+
+class SlotCatalog:
+    FILE_NAME: str = "catalog.jsonl"
+    COMPACT_MIN_RECORDS: int = 64
+    COMPACT_RATIO: int = 4
+    # Coarse filesystem clocks can give two writes the same mtime; a stamp
+    # younger than this is not trusted to have caught the second one.
+    MTIME_SLACK_NS: int = 2_000_000_000
+    SORT_KEYS: tuple[str, ...] = ("slot", "student_name", "today", "stage", "score", "final_grade")
+
+    def __init__(self, saves_dir: str | Path):
+        self.__saves_dir = Path(saves_dir)
+        self.__entries: dict[int, dict[str, object]] | None = None
+        self.__records: int = 0
+        self.__stamp: tuple[int, int, int] | None = None
+
+    def get_path(self) -> Path:
+        return self.__saves_dir / self.FILE_NAME
+
+    @staticmethod
+    def summarize(slot: int, process: dict[str, object]) -> dict[str, object]:
+        return {
+            "slot": slot,
+            "student_name": process["student"]["name"],
+            "today": process["today"],
+            "stage": DefenseStage[process["stage"]].value,
+            "score": process["score"],
+            "final_grade": process["final_grade"],
+            "defense_passed": process["defense_passed"],
+        }
+
+    def update(self, slot: int, path: Path, process: dict[str, object]) -> None:
+        stat = path.stat()
+        entry = self.summarize(slot, process)
+        entry.update(file=path.name, mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+        self._entries()[slot] = entry
+        self._append(entry)
+
+    def list_slots(self) -> list[dict[str, object]]:
+        return self.query_slots()
+
+    def query_slots(
+        self,
+        stage: DefenseStage | str | None = None,
+        min_day: int | None = None,
+        max_day: int | None = None,
+        min_score: int | None = None,
+        max_score: int | None = None,
+        sort_by: str = "slot",
+        descending: bool = False,
+        limit: int | None = None,
+    ) -> list[dict[str, object]]:
+        if sort_by not in self.SORT_KEYS:
+            raise ValueError(f"Cannot sort slots by {sort_by}.")
+        stage_value = DefenseStage(stage).value if stage is not None else None
+
+        self.refresh()
+        result = [
+            entry for entry in self.__entries.values()
+            if (stage_value is None or entry["stage"] == stage_value)
+            and (min_day is None or entry["today"] >= min_day)
+            and (max_day is None or entry["today"] <= max_day)
+            and (min_score is None or entry["score"] >= min_score)
+            and (max_score is None or entry["score"] <= max_score)
+        ]
+        if sort_by == "stage":
+            result.sort(key=lambda entry: (_STAGE_ORDER[entry["stage"]], entry["slot"]),
+                        reverse=descending)
+        else:
+            # final_grade is None until attestation; such slots sort first.
+            result.sort(
+                key=lambda entry: (
+                    entry[sort_by] is not None,
+                    entry[sort_by] if entry[sort_by] is not None else 0,
+                    entry["slot"],
+                ),
+                reverse=descending,
+            )
+        if limit is not None:
+            result = result[:limit]
+        return [self._public(entry) for entry in result]
+
+    def refresh(self, force: bool = False) -> None:
+        entries = self._entries()
+        # Every writer replaces slot files inside the directory and appends to
+        # the catalog, so unchanged stamps mean nothing to rescan.
+        stamp = self._stamp()
+        if stamp is not None and stamp == self.__stamp and not force:
+            return
+
+        # One directory scan with stat only; a slot file is parsed again only
+        # when its mtime or size no longer matches the catalog.
+        found: dict[int, os.DirEntry] = {}
+        if self.__saves_dir.exists():
+            with os.scandir(self.__saves_dir) as items:
+                for item in items:
+                    match = _SLOT_FILE.match(item.name)
+                    if match is None or codec_for_path(Path(item.name)) is None:
+                        continue
+                    slot = int(match.group(1))
+                    current = found.get(slot)
+                    if current is None or item.stat().st_mtime_ns > current.stat().st_mtime_ns:
+                        found[slot] = item
+
+        changed = False
+        for slot in list(entries):
+            if slot not in found:
+                del entries[slot]
+                changed = True
+        for slot, item in found.items():
+            entry = entries.get(slot)
+            stat = item.stat()
+            if (entry is not None and entry["file"] == item.name
+                    and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size):
+                continue
+            path = Path(item.path)
+            try:
+                process = codec_for_path(path).decode(path.read_bytes())["process"]
+            except (OSError, ValueError, KeyError):
+                entries.pop(slot, None)
+                changed = True
+                continue
+            entry = self.summarize(slot, process)
+            entry.update(file=item.name, mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+            entries[slot] = entry
+            changed = True
+
+        if changed:
+            self.compact()
+        if stamp is not None and max(stamp[:2]) < time.time_ns() - self.MTIME_SLACK_NS:
+            self.__stamp = stamp
+
+    def compact(self) -> None:
+        entries = self._entries()
+        self.__saves_dir.mkdir(parents=True, exist_ok=True)
+        path = self.get_path()
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(
+            "".join(json.dumps(entry, ensure_ascii=False) + "\n" for entry in entries.values()),
+            encoding="utf-8",
+        )
+        tmp_path.replace(path)
+        self.__records = len(entries)
+
+    def _stamp(self) -> tuple[int, int, int] | None:
+        try:
+            directory = self.__saves_dir.stat()
+        except FileNotFoundError:
+            return None
+        try:
+            catalog = self.get_path().stat()
+        except FileNotFoundError:
+            return directory.st_mtime_ns, 0, 0
+        return directory.st_mtime_ns, catalog.st_mtime_ns, catalog.st_size
+
+    def _entries(self) -> dict[int, dict[str, object]]:
+        if self.__entries is None:
+            self.__entries = {}
+            self.__records = 0
+            path = self.get_path()
+            if not path.exists():
+                return self.__entries
+            for line in path.read_text(encoding="utf-8").splitlines():
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # A torn last line is left by an interrupted append.
+                    continue
+                self.__records += 1
+                self.__entries[record["slot"]] = record
+        return self.__entries
+
+    def _append(self, record: dict[str, object]) -> None:
+        entries = self._entries()
+        self.__records += 1
+        if self.__records > max(self.COMPACT_MIN_RECORDS, len(entries) * self.COMPACT_RATIO):
+            self.compact()
+            return
+
+        self.__saves_dir.mkdir(parents=True, exist_ok=True)
+        with self.get_path().open("a", encoding="utf-8") as catalog:
+            catalog.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    @staticmethod
+    def _public(entry: dict[str, object]) -> dict[str, object]:
+        return {
+            key: value for key, value in entry.items()
+            if key not in ("file", "mtime_ns", "size")
+        }
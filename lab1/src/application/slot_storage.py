@@ -0,0 +1,366 @@
+from __future__ import annotations
+
+import queue
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from contextlib import contextmanager
+from functools import partial
+from pathlib import Path
+
+from domain import DefenseStage
+
+from .metrics import Metrics
+from .save_codecs import SAVE_CODECS, codec_for_path
+from .slot_catalog import SlotCatalog
+
+
+class SlotStorage(ABC):
+    _metrics: Metrics | None = None
+
+    def set_metrics(self, metrics: Metrics | None) -> None:
+        self._metrics = metrics
+
+    def _clock(self) -> float:
+        return time.perf_counter() if self._metrics is not None else 0.0
+
+    def _lap(self, name: str, started: float) -> float:
+        # Records the phase that began at started and returns the start of the
+        # next one; without metrics this is a single identity check.
+        metrics = self._metrics
+        if metrics is None:
+            return 0.0
+        now = time.perf_counter()
+        metrics.observe(name, now - started)
+        return now
+
+    @abstractmethod
+    def get_save_format(self) -> str:
+        ...
+
+    @abstractmethod
+    def exists(self, slot: int) -> bool:
+        ...
+
+    @abstractmethod
+    def read(self, slot: int) -> dict[str, object]:
+        ...
+
+    @abstractmethod
+    def write(self, slot: int, payload: dict[str, object]) -> Path:
+        ...
+
+    @abstractmethod
+    def query_slots(
+        self,
+        stage: DefenseStage | str | None = None,
+        min_day: int | None = None,
+        max_day: int | None = None,
+        min_score: int | None = None,
+        max_score: int | None = None,
+        sort_by: str = "slot",
+        descending: bool = False,
+        limit: int | None = None,
+    ) -> list[dict[str, object]]:
+        ...
+
+    def list_slots(self) -> list[dict[str, object]]:
+        return self.query_slots()
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.flush()
+
+
+class FileSlotStorage(SlotStorage):
+    def __init__(self, saves_dir: str | Path, save_format: str = "json"):
+        if save_format not in SAVE_CODECS:
+            raise ValueError(f"Unknown save format: {save_format}.")
+
+        self.__saves_dir = Path(saves_dir)
+        self.__save_format: str = save_format
+        self.__catalog: SlotCatalog = SlotCatalog(self.__saves_dir)
+        self.__catalog_lock = threading.Lock()
+
+    def get_save_format(self) -> str:
+        return self.__save_format
+
+    def exists(self, slot: int) -> bool:
+        return self._find_path(slot) is not None
+
+    def read(self, slot: int) -> dict[str, object]:
+        path = self._find_path(slot)
+        if path is None:
+            raise FileNotFoundError(f"Save slot {slot} does not exist.")
+        mark = self._clock()
+        data = path.read_bytes()
+        mark = self._lap("load.read", mark)
+        payload = codec_for_path(path).decode(data)
+        self._lap("load.decode", mark)
+        return payload
+
+    def write(self, slot: int, payload: dict[str, object]) -> Path:
+        return self._write(slot, payload, self.__save_format)
+
+    def convert(self, slot: int, save_format: str) -> Path:
+        if save_format not in SAVE_CODECS:
+            raise ValueError(f"Unknown save format: {save_format}.")
+
+        return self._write(slot, self.read(slot), save_format)
+
+    def query_slots(
+        self,
+        stage: DefenseStage | str | None = None,
+        min_day: int | None = None,
+        max_day: int | None = None,
+        min_score: int | None = None,
+        max_score: int | None = None,
+        sort_by: str = "slot",
+        descending: bool = False,
+        limit: int | None = None,
+    ) -> list[dict[str, object]]:
+        with self.__catalog_lock:
+            return self.__catalog.query_slots(
+                stage=stage,
+                min_day=min_day,
+                max_day=max_day,
+                min_score=min_score,
+                max_score=max_score,
+                sort_by=sort_by,
+                descending=descending,
+                limit=limit,
+            )
+
+    def _path(self, slot: int, save_format: str | None = None) -> Path:
+        codec = SAVE_CODECS[save_format or self.__save_format]
+        return self.__saves_dir / f"slot_{slot}{codec.EXTENSION}"
+
+    def _find_path(self, slot: int) -> Path | None:
+        # Writes remove the other formats, but a directory written by an older
+        # version can still hold several; the newest one is the current save.
+        paths = [path for path in map(partial(self._path, slot), SAVE_CODECS) if path.exists()]
+        if len(paths) <= 1:
+            return paths[0] if paths else None
+        return max(paths, key=lambda path: path.stat().st_mtime_ns)
+
+    def _write(self, slot: int, payload: dict[str, object], save_format: str) -> Path:
+        self.__saves_dir.mkdir(parents=True, exist_ok=True)
+        path = self._path(slot, save_format)
+        tmp_path = path.with_suffix(".tmp")
+        mark = self._clock()
+        data = SAVE_CODECS[save_format].encode(payload)
+        mark = self._lap("save.encode", mark)
+        tmp_path.write_bytes(data)
+        mark = self._lap("save.write", mark)
+        tmp_path.replace(path)
+        for other_format in SAVE_CODECS:
+            if other_format != save_format:
+                self._path(slot, other_format).unlink(missing_ok=True)
+        mark = self._lap("save.replace", mark)
+        with self.__catalog_lock:
+            self.__catalog.update(slot, path, payload["process"])
+        self._lap("save.catalog", mark)
+        return path
+
+
+class SqliteSlotStorage(SlotStorage):
+    DEFAULT_POOL_SIZE: int = 8
+    DEFAULT_BATCH_SIZE: int = 64
+    SORT_COLUMNS: dict[str, str] = {
+        "slot": "slot",
+        "student_name": "student_name",
+        "today": "today",
+        "stage": "stage_order",
+        "score": "score",
+        "final_grade": "final_grade",
+    }
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS slots (
+            slot INTEGER PRIMARY KEY,
+            student_name TEXT NOT NULL,
+            today INTEGER NOT NULL,
+            stage TEXT NOT NULL,
+            stage_order INTEGER NOT NULL,
+            score INTEGER NOT NULL,
+            final_grade INTEGER,
+            defense_passed INTEGER NOT NULL,
+            data BLOB NOT NULL
+        )
+    """
+    _UPSERT = "INSERT OR REPLACE INTO slots VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+    _SELECT = "SELECT data FROM slots WHERE slot = ?"
+    _EXISTS = "SELECT 1 FROM slots WHERE slot = ?"
+
+    def __init__(
+        self,
+        path: str | Path,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ):
+        if pool_size <= 0:
+            raise ValueError("Pool size must be >= 1.")
+        if batch_size <= 0:
+            raise ValueError("Batch size must be >= 1.")
+
+        self.__path = Path(path)
+        self.__path.parent.mkdir(parents=True, exist_ok=True)
+        self.__batch_size: int = batch_size
+        self.__codec = SAVE_CODECS["binary"]
+        self.__stage_order: dict[str, int] = {stage.name: idx for idx, stage in enumerate(DefenseStage)}
+
+        # SQLite allows one writer at a time, so all writes go through a single
+        # connection; readers take connections from the pool and see committed
+        # rows, while rows still waiting for the batch commit are served from
+        # the pending map.
+        self.__writer: sqlite3.Connection = self._connect()
+        self.__writer.execute("PRAGMA journal_mode=WAL")
+        self.__writer.execute(self._SCHEMA)
+        self.__writer.commit()
+        self.__write_lock = threading.Lock()
+        self.__pending: dict[int, tuple] = {}
+        self.__pool: queue.SimpleQueue[sqlite3.Connection] = queue.SimpleQueue()
+        self.__connections: list[sqlite3.Connection] = [self.__writer]
+        for _ in range(pool_size):
+            connection = self._connect()
+            self.__connections.append(connection)
+            self.__pool.put(connection)
+
+    def get_path(self) -> Path:
+        return self.__path
+
+    def get_save_format(self) -> str:
+        return "binary"
+
+    def exists(self, slot: int) -> bool:
+        with self.__write_lock:
+            if slot in self.__pending:
+                return True
+        with self._reader() as connection:
+            return connection.execute(self._EXISTS, (slot,)).fetchone() is not None
+
+    def read(self, slot: int) -> dict[str, object]:
+        with self.__write_lock:
+            row = self.__pending.get(slot)
+        if row is None:
+            with self._reader() as connection:
+                row = connection.execute(self._SELECT, (slot,)).fetchone()
+            if row is None:
+                raise FileNotFoundError(f"Save slot {slot} does not exist.")
+        mark = self._clock()
+        payload = self.__codec.decode(row[-1])
+        self._lap("load.decode", mark)
+        return payload
+
+    def write(self, slot: int, payload: dict[str, object]) -> Path:
+        mark = self._clock()
+        summary = SlotCatalog.summarize(slot, payload["process"])
+        row = (
+            slot,
+            summary["student_name"],
+            summary["today"],
+            summary["stage"],
+            self.__stage_order[payload["process"]["stage"]],
+            summary["score"],
+            summary["final_grade"],
+            summary["defense_passed"],
+            self.__codec.encode(payload),
+        )
+        self._lap("save.encode", mark)
+        with self.__write_lock:
+            self.__pending[slot] = row
+            if len(self.__pending) >= self.__batch_size:
+                self._commit_pending()
+        return self.__path
+
+    def flush(self) -> None:
+        with self.__write_lock:
+            self._commit_pending()
+
+    def close(self) -> None:
+        self.flush()
+        for connection in self.__connections:
+            connection.close()
+        self.__connections.clear()
+
+    def query_slots(
+        self,
+        stage: DefenseStage | str | None = None,
+        min_day: int | None = None,
+        max_day: int | None = None,
+        min_score: int | None = None,
+        max_score: int | None = None,
+        sort_by: str = "slot",
+        descending: bool = False,
+        limit: int | None = None,
+    ) -> list[dict[str, object]]:
+        column = self.SORT_COLUMNS.get(sort_by)
+        if column is None:
+            raise ValueError(f"Cannot sort slots by {sort_by}.")
+
+        clauses: list[str] = []
+        params: list[object] = []
+        for condition, value in (
+            ("stage = ?", DefenseStage(stage).value if stage is not None else None),
+            ("today >= ?", min_day),
+            ("today <= ?", max_day),
+            ("score >= ?", min_score),
+            ("score <= ?", max_score),
+        ):
+            if value is not None:
+                clauses.append(condition)
+                params.append(value)
+
+        order = "DESC" if descending else "ASC"
+        sql = ("SELECT slot, student_name, today, stage, score, final_grade, defense_passed "
+               "FROM slots")
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += f" ORDER BY {column} {order}, slot {order}"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        self.flush()
+        with self._reader() as connection:
+            rows = connection.execute(sql, params).fetchall()
+        return [
+            {
+                "slot": slot,
+                "student_name": student_name,
+                "today": today,
+                "stage": stage_value,
+                "score": score,
+                "final_grade": final_grade,
+                "defense_passed": bool(defense_passed),
+            }
+            for slot, student_name, today, stage_value, score, final_grade, defense_passed in rows
+        ]
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.__path, check_same_thread=False, timeout=30)
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+    @contextmanager
+    def _reader(self) -> Iterator[sqlite3.Connection]:
+        connection = self.__pool.get()
+        try:
+            yield connection
+        finally:
+            self.__pool.put(connection)
+
+    def _commit_pending(self) -> None:
+        if not self.__pending:
+            return
+        mark = self._clock()
+        with self.__writer:
+            self.__writer.executemany(self._UPSERT, self.__pending.values())
+        self._lap("save.commit", mark)
+        if self._metrics is not None:
+            self._metrics.increment("save.committed_rows", len(self.__pending))
+        self.__pending.clear()
@@ -0,0 +1,288 @@
+from __future__ import annotations
+
+import logging
+import math
+import multiprocessing
+import os
+import random
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent import futures
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+
+from domain import DefenseProcess
+
+from .policies import Policy, random_policy
+
+logger = logging.getLogger(__name__)
+
+
+class Estimate:
+    def __init__(
+        self,
+        defense_probability: float,
+        low: float,
+        high: float,
+        expected_grade: float,
+        rollouts: int,
+        day: int,
+        version: int,
+    ):
+        self.__defense_probability: float = defense_probability
+        self.__low: float = low
+        self.__high: float = high
+        self.__expected_grade: float = expected_grade
+        self.__rollouts: int = rollouts
+        self.__day: int = day
+        self.__version: int = version
+
+    def get_defense_probability(self) -> float:
+        return self.__defense_probability
+
+    def get_interval(self) -> tuple[float, float]:
+        return self.__low, self.__high
+
+    def get_margin(self) -> float:
+        return (self.__high - self.__low) / 2
+
+    def get_expected_grade(self) -> float:
+        return self.__expected_grade
+
+    def get_rollouts(self) -> int:
+        return self.__rollouts
+
+    def get_day(self) -> int:
+        return self.__day
+
+    def get_version(self) -> int:
+        return self.__version
+
+
+def wilson_interval(passed: int, total: int, z: float) -> tuple[float, float]:
+    if total <= 0:
+        return 0.0, 1.0
+    p = passed / total
+    z2 = z * z
+    denominator = 1 + z2 / total
+    centre = (p + z2 / (2 * total)) / denominator
+    margin = z * math.sqrt(p * (1 - p) / total + z2 / (4 * total * total)) / denominator
+    return max(0.0, centre - margin), min(1.0, centre + margin)
+
+
+class WinEstimator:
+    DEFAULT_MAX_ROLLOUTS: int = 4000
+    DEFAULT_MIN_ROLLOUTS: int = 200
+    DEFAULT_BATCH_SIZE: int = 100
+    DEFAULT_MARGIN: float = 0.02
+    Z: float = 1.96
+
+    def __init__(
+        self,
+        policy: Policy = random_policy,
+        max_rollouts: int = DEFAULT_MAX_ROLLOUTS,
+        min_rollouts: int = DEFAULT_MIN_ROLLOUTS,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        margin: float = DEFAULT_MARGIN,
+        max_workers: int | None = None,
+        seed: int | None = None,
+    ):
+        if batch_size <= 0:
+            raise ValueError("Batch size must be >= 1.")
+        if not 0 < min_rollouts <= max_rollouts:
+            raise ValueError("Rollout limits must satisfy 0 < min_rollouts <= max_rollouts.")
+        if not 0 < margin < 1:
+            raise ValueError("Margin must be in range (0, 1).")
+
+        self.__policy: Policy = policy
+        self.__max_rollouts: int = max_rollouts
+        self.__min_rollouts: int = min_rollouts
+        self.__batch_size: int = batch_size
+        self.__margin: float = margin
+        self.__max_workers: int = max_workers if max_workers is not None else (os.cpu_count() or 1)
+        self.__rng: random.Random = random.Random(seed)
+        self.__executor: ProcessPoolExecutor | None = None
+
+    def close(self) -> None:
+        if self.__executor is not None:
+            self.__executor.shutdown(wait=True, cancel_futures=True)
+            self.__executor = None
+
+    def __enter__(self) -> WinEstimator:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def estimate(self, process: DefenseProcess, cancel: threading.Event | None = None) -> Estimate:
+        if process.is_finished():
+            raise ValueError("Session is already finished.")
+
+        start = self.__rng.getrandbits(32)
+        batches = (
+            range(first, min(first + self.__batch_size, start + self.__max_rollouts))
+            for first in range(start, start + self.__max_rollouts, self.__batch_size)
+        )
+        passed = grades = total = 0
+        results = self._iter_batches(process, batches)
+        try:
+            for batch_passed, batch_grades, batch_total in results:
+                passed += batch_passed
+                grades += batch_grades
+                total += batch_total
+                if cancel is not None and cancel.is_set():
+                    break
+                # Stop as soon as the interval is tight enough; states close to
+                # the end of a session usually settle after the first batches.
+                low, high = wilson_interval(passed, total, self.Z)
+                if total >= self.__min_rollouts and (high - low) / 2 <= self.__margin:
+                    break
+        finally:
+            results.close()
+
+        low, high = wilson_interval(passed, total, self.Z)
+        return Estimate(
+            defense_probability=passed / total,
+            low=low,
+            high=high,
+            expected_grade=grades / total,
+            rollouts=total,
+            day=process.get_today(),
+            version=process.get_version(),
+        )
+
+    def _iter_batches(
+        self,
+        process: DefenseProcess,
+        batches: Iterable[range],
+    ) -> Iterator[tuple[int, int, int]]:
+        # Scenarios hold compiled handlers that cannot be pickled, so their
+        # sessions are rolled out in this process.
+        scenario = process.get_scenario()
+        if self.__max_workers <= 1 or (scenario is not None and not scenario.is_builtin()):
+            simulation = process.fork()
+            for seeds in batches:
+                yield _rollouts(simulation, seeds, self.__policy)
+            return
+
+        if self.__executor is None:
+            # The estimator may run on a background thread; forking a
+            # multi-threaded process is unsafe, so workers are spawned.
+            self.__executor = ProcessPoolExecutor(
+                max_workers=self.__max_workers, mp_context=multiprocessing.get_context("spawn"))
+        data = process.to_dict()
+        window = self.__max_workers * 2
+        pending: deque[Future[tuple[int, int, int]]] = deque()
+        try:
+            for seeds in batches:
+                pending.append(self.__executor.submit(_rollouts_from_dict, data, seeds, self.__policy))
+                if len(pending) >= window:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+class BackgroundEstimator:
+    def __init__(
+        self,
+        estimator: WinEstimator | None = None,
+        on_done: Callable[[Estimate], None] | None = None,
+    ):
+        self.__estimator: WinEstimator = estimator if estimator is not None else WinEstimator()
+        self.__on_done: Callable[[Estimate], None] | None = on_done
+        self.__executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="estimate")
+        self.__lock: threading.RLock = threading.RLock()
+        self.__latest: Estimate | None = None
+        self.__running: Future[Estimate] | None = None
+        self.__cancel: threading.Event = threading.Event()
+        self.__pending: DefenseProcess | None = None
+        self.__requested: int | None = None
+        self.__closed: bool = False
+
+    def get_latest(self) -> Estimate | None:
+        return self.__latest
+
+    def is_busy(self) -> bool:
+        with self.__lock:
+            return self.__running is not None
+
+    def request(self, process: DefenseProcess) -> None:
+        with self.__lock:
+            if self.__closed or process.get_version() == self.__requested:
+                return
+            self.__requested = process.get_version()
+            if process.is_finished():
+                self.__pending = None
+                self.__cancel.set()
+                return
+            # Only the newest state matters: a running estimate for an older
+            # state is cut short and this one replaces anything still queued.
+            fork = process.fork()
+            if self.__running is None:
+                self._start(fork)
+            else:
+                self.__pending = fork
+                self.__cancel.set()
+
+    def wait(self, timeout: float | None = None) -> Estimate | None:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self.__lock:
+                running = self.__running
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if running is None or (remaining is not None and remaining <= 0):
+                return self.__latest
+            futures.wait([running], remaining)
+
+    def close(self) -> None:
+        with self.__lock:
+            self.__closed = True
+            self.__pending = None
+            self.__cancel.set()
+        self.__executor.shutdown(wait=True, cancel_futures=True)
+        self.__estimator.close()
+
+    def _start(self, fork: DefenseProcess) -> None:
+        self.__cancel = threading.Event()
+        self.__running = self.__executor.submit(self.__estimator.estimate, fork, self.__cancel)
+        self.__running.add_done_callback(self._finished)
+
+    def _finished(self, future: Future[Estimate]) -> None:
+        latest = None
+        with self.__lock:
+            error = None if future.cancelled() else future.exception()
+            if error is not None:
+                logger.warning("Win estimate failed.", exc_info=error)
+            elif not future.cancelled() and not self.__cancel.is_set():
+                latest = self.__latest = future.result()
+            self.__running = None
+            if self.__pending is not None and not self.__closed:
+                fork, self.__pending = self.__pending, None
+                self._start(fork)
+        # Outside the lock: the callback may redraw a UI that is itself
+        # waiting to queue the next request.
+        if latest is not None and self.__on_done is not None:
+            self.__on_done(latest)
+
+
+def _rollouts(process: DefenseProcess, seeds: range, policy: Policy) -> tuple[int, int, int]:
+    start = process.snapshot()
+    passed = grades = 0
+    for seed in seeds:
+        process.restore(start)
+        rng = random.Random(seed)
+        while not process.is_finished():
+            process.perform_action(policy(process, rng))
+        status = process.get_status()
+        passed += bool(status["defense_passed"])
+        grades += int(status["final_grade"])
+    process.restore(start)
+    return passed, grades, len(seeds)
+
+
+def _rollouts_from_dict(data: dict[str, object], seeds: range, policy: Policy) -> tuple[int, int, int]:
+    return _rollouts(DefenseProcess.from_dict(data), seeds, policy)
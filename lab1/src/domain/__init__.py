@@ -1,17 +1,28 @@
 from .commission import Commission
+from .defense_calendar import CalendarPhase, DefenseCalendar, RevisionWindow
 from .defense_process import DefenseStage, DefenseProcess
+from .defense_rules import ActionRule, DefenseRules, Gain, RevisionCheck
 from .diploma_project import DiplomaProject
 from .presentation import Presentation
+from .scenario import Scenario
 from .scientific_supervisor import ScientificSupervisor
 from .student import Student
 from .theme import Theme
 
 __all__ = [
+    "ActionRule",
+    "CalendarPhase",
+    "DefenseCalendar",
     "DefenseStage",
     "Commission",
     "DefenseProcess",
+    "DefenseRules",
     "DiplomaProject",
+    "Gain",
     "Presentation",
+    "RevisionCheck",
+    "RevisionWindow",
+    "Scenario",
     "ScientificSupervisor",
     "Student",
     "Theme",
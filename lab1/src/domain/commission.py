@@ -1,4 +1,6 @@
 class Commission:
+    __slots__ = ("__loyalty",)
+
     ALLOWED_LOYALTY: tuple[int, int, int] = (1, 2, 3)
     
     def __init__(self, loyalty: int):
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+from typing import NamedTuple
+
+from .defense_stage import DefenseStage
+
+
+class RevisionWindow(NamedTuple):
+    opens: int
+    closes: int
+    next_stage: DefenseStage
+
+
+class CalendarPhase(NamedTuple):
+    stage: DefenseStage
+    start: int
+    end: int
+
+
+class DefenseCalendar:
+    MAX_DAY: int = 25
+    STAGES: tuple[DefenseStage, ...] = tuple(DefenseStage)
+
+    # A window switches the session to revision on its opening day. Once the
+    # matching revision is passed the next stage starts on the following day;
+    # if it is still missing on the closing day the session is finished.
+    REVISION_WINDOWS: tuple[RevisionWindow, ...] = (
+        RevisionWindow(opens=5, closes=7, next_stage=DefenseStage.PREPARATION),
+        RevisionWindow(opens=11, closes=13, next_stage=DefenseStage.PREPARATION),
+        RevisionWindow(opens=16, closes=18, next_stage=DefenseStage.REHEARSAL),
+    )
+    DEFENSE_DAYS: tuple[int, ...] = (23, 24)
+
+    REVISION_MASKS: int = 1 << len(REVISION_WINDOWS)
+
+    _table: tuple[int, ...] = ()
+
+    @classmethod
+    def next_stage(
+        cls,
+        day: int,
+        stage: DefenseStage,
+        revision_passed: list[bool],
+        defense_passed: bool,
+    ) -> DefenseStage:
+        mask = 0
+        for idx, passed in enumerate(revision_passed):
+            mask |= passed << idx
+        return cls.STAGES[cls._table[cls.table_index(day, _STAGE_INDEX[stage], mask, defense_passed)]]
+
+    @classmethod
+    def table_index(cls, day: int, stage_index: int, revision_mask: int, defense_passed: bool) -> int:
+        return ((day * len(cls.STAGES) + stage_index) * cls.REVISION_MASKS + revision_mask) * 2 + defense_passed
+
+    @classmethod
+    def get_table(cls) -> tuple[int, ...]:
+        return cls._table
+
+    @classmethod
+    def derive(
+        cls,
+        max_day: int,
+        revision_windows: tuple[RevisionWindow, ...],
+        defense_days: tuple[int, ...],
+    ) -> type[DefenseCalendar]:
+        if len(revision_windows) != len(cls.REVISION_WINDOWS):
+            raise ValueError(f"Calendar needs exactly {len(cls.REVISION_WINDOWS)} revision windows.")
+        day = 0
+        for window in revision_windows:
+            if not day < window.opens < window.closes:
+                raise ValueError("Revision windows must be ordered and must not overlap.")
+            day = window.closes
+        if not defense_days or list(defense_days) != sorted(set(defense_days)):
+            raise ValueError("Defense days must be a non-empty increasing list.")
+        # The last day always sends the session to attestation, so a defense
+        # held on it could never be followed by one.
+        if not day < defense_days[0] or not defense_days[-1] < max_day:
+            raise ValueError("Defense days must fall between the last revision window and the last day.")
+
+        # Each calendar is its own class with its own compiled table, so
+        # sessions with different calendars can run side by side.
+        calendar = type(cls.__name__, (cls,), {
+            "MAX_DAY": max_day,
+            "REVISION_WINDOWS": tuple(revision_windows),
+            "DEFENSE_DAYS": tuple(defense_days),
+        })
+        calendar._table = calendar._compile()
+        return calendar
+
+    @classmethod
+    def get_phases(cls) -> tuple[CalendarPhase, ...]:
+        phases: list[CalendarPhase] = []
+        day = 0
+        for window in cls.REVISION_WINDOWS:
+            phases.append(CalendarPhase(DefenseStage.PREPARATION, day, window.opens))
+            phases.append(CalendarPhase(DefenseStage.REVISION, window.opens, window.closes))
+            day = window.closes
+        phases.append(CalendarPhase(DefenseStage.REHEARSAL, day, cls.DEFENSE_DAYS[0]))
+        phases.append(CalendarPhase(DefenseStage.DEFENSE, cls.DEFENSE_DAYS[0], cls.MAX_DAY))
+        return tuple(phases)
+
+    @classmethod
+    def _resolve(
+        cls,
+        day: int,
+        stage: DefenseStage,
+        revision_mask: int,
+        defense_passed: bool,
+    ) -> DefenseStage:
+        for idx, window in enumerate(cls.REVISION_WINDOWS):
+            passed = bool(revision_mask >> idx & 1)
+            if day == window.opens:
+                stage = DefenseStage.REVISION
+            elif window.opens < day <= window.closes:
+                if passed:
+                    stage = window.next_stage
+                elif day == window.closes:
+                    stage = DefenseStage.FINISHED
+
+        if day in cls.DEFENSE_DAYS:
+            stage = DefenseStage.DEFENSE
+
+        if stage == DefenseStage.ATTESTATION:
+            return DefenseStage.FINISHED
+        if day == cls.MAX_DAY or defense_passed:
+            return DefenseStage.ATTESTATION
+        return stage
+
+    @classmethod
+    def _compile(cls) -> tuple[int, ...]:
+        table: list[int] = []
+        for day in range(cls.MAX_DAY + 1):
+            for stage in cls.STAGES:
+                for revision_mask in range(cls.REVISION_MASKS):
+                    for defense_passed in (False, True):
+                        resolved = cls._resolve(day, stage, revision_mask, defense_passed)
+                        table.append(_STAGE_INDEX[resolved])
+        return tuple(table)
+
+
+_STAGE_INDEX: dict[DefenseStage, int] = {
+    stage: idx for idx, stage in enumerate(DefenseCalendar.STAGES)
+}
+DefenseCalendar._table = DefenseCalendar._compile()
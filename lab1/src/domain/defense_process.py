@@ -6,35 +6,46 @@ from .presentation import Presentation
 from .scientific_supervisor import ScientificSupervisor
 from .commission import Commission
 from .theme import Theme
+from .defense_calendar import DefenseCalendar
+from .defense_stage import DefenseStage
+from .defense_rules import ActionRule, DefenseRules
 
-from enum import Enum
-import random
-import ast
+import itertools
+from collections.abc import Callable, Mapping
+from types import MappingProxyType
+from typing import TYPE_CHECKING
 
+if TYPE_CHECKING:
+    from .scenario import Scenario
 
-class DefenseStage(Enum):
-    PREPARATION = "Preparation"
-    REVISION = "Revision"
-    REHEARSAL = "Rehearsal"
-    DEFENSE = "Defense"
-    ATTESTATION = "Attestation"
-    FINISHED = "Finished"
+Dispatch = dict[DefenseStage, dict[str, Callable[["DefenseProcess"], None]]]
 
 
 class DefenseProcess:
-    MAX_DAY = 25
+    __slots__ = (
+        "__student",
+        "__diploma_project",
+        "__presentation",
+        "__scientific_supervisor",
+        "__commission",
+        "__today",
+        "__stage",
+        "__seed",
+        "__revision_passed",
+        "__defense_passed",
+        "__final_grade",
+        "__score",
+        "__version",
+        "__status",
+        "__scenario",
+        "__calendar",
+        "__dispatch",
+    )
+
+    MAX_DAY = DefenseCalendar.MAX_DAY
     MAX_GRADE = 10
 
-    ACTION_LABELS: dict[str, str] = {
-        "work_thesis": "Work on thesis",
-        "rest": "Rest",
-        "send_review": "Send for review",
-        "submit_for_inspection": "Submit for inspection",
-        "prepare_slides": "Prepare presentation",
-        "rehearse": "Rehearse defense",
-        "defense": "Go to defense",
-        "attestation": "Get final grade",
-    }
+    ACTION_LABELS: dict[str, str] = {code: rule.label for code, rule in DefenseRules.ACTIONS.items()}
 
     def __init__(
             self,
@@ -45,7 +56,8 @@ class DefenseProcess:
             commission: Commission,
             today: int = 0,
             stage: DefenseStage = DefenseStage.PREPARATION,
-            seed: int | None = None):
+            seed: int | None = None,
+            scenario: Scenario | None = None):
 
         self.__student: Student = student
         self.__diploma_project: DiplomaProject = diploma_project
@@ -61,31 +73,53 @@ class DefenseProcess:
         self.__final_grade: int = 0
         self.__score: int = 0
 
-        self.__rng = random.Random(seed)
+        # Bumped by every mutation; get_status() rebuilds its cached snapshot
+        # only after the version moves. Versions come from one process-wide
+        # counter, so a version never matches a different session's state.
+        self.__version: int = next(_VERSIONS)
+        self.__status: Mapping[str, object] | None = None
+
+        # Scenarios are shared by reference; None means the built-in rules.
+        self.__scenario: Scenario | None = scenario
+        self.__calendar: type[DefenseCalendar] = DefenseCalendar if scenario is None else scenario.get_calendar()
+        self.__dispatch: Dispatch = _DISPATCH if scenario is None else scenario.get_dispatch()
 
     def get_action_label(self, action_code: str) -> str:
         return self.ACTION_LABELS[action_code]
 
     def get_available_actions(self) -> list[str]:
-        if self.__stage == DefenseStage.PREPARATION:
-            return ['work_thesis', 'rest', 'send_review']
-        if self.__stage == DefenseStage.REVISION:
-            return ['work_thesis', 'rest', 'submit_for_inspection']
-        if self.__stage == DefenseStage.REHEARSAL:
-            return ['prepare_slides', 'rest', 'rehearse']
-        if self.__stage == DefenseStage.DEFENSE:
-            return ['prepare_slides', 'rest', 'rehearse', 'defense']
-        if self.__stage == DefenseStage.ATTESTATION:
-            return ['attestation']
-        return []
+        return list(self.__dispatch[self.__stage])
 
     def is_finished(self) -> bool:
         return self.__stage == DefenseStage.FINISHED
 
-    def get_status(self) -> dict[str, int | str | bool]:
+    def get_seed(self) -> int | None:
+        return self.__seed
+
+    def get_today(self) -> int:
+        return self.__today
+
+    def get_scenario(self) -> Scenario | None:
+        return self.__scenario
+
+    def get_calendar(self) -> type[DefenseCalendar]:
+        return self.__calendar
+
+    def get_version(self) -> int:
+        return self.__version
+
+    def has_changed_since(self, version: int) -> bool:
+        return self.__version != version
+
+    def get_status(self) -> Mapping[str, object]:
+        if self.__status is None:
+            self.__status = MappingProxyType(self._build_status())
+        return self.__status
+
+    def _build_status(self) -> dict[str, object]:
         return {
             'today': self.__today,
-            'max_days': self.__class__.MAX_DAY,
+            'max_days': self.__calendar.MAX_DAY,
             'stage': self.__stage.value,
             'student_name': self.__student.get_name(),
             'student_intelligence': self.__student.get_intelligence(),
@@ -96,144 +130,146 @@ class DefenseProcess:
             'theme_complexity': self.__diploma_project.get_theme_complexity(),
             'presentation': self.__presentation.get_pct_complition(),
             'answer_skill': self.__student.get_answer_skill(),
-            'revision_passed': self.__revision_passed,
+            'revision_passed': tuple(self.__revision_passed),
             'defense_passed': self.__defense_passed,
             'score': self.__score,
             'final_grade': self.__final_grade
             
         }
 
+    def _touch(self) -> None:
+        self.__version = next(_VERSIONS)
+        self.__status = None
+
     def perform_action(self, action_code: str) -> None:
-        if action_code not in self.get_available_actions():
+        handler = self.__dispatch[self.__stage].get(action_code)
+        if handler is None:
             raise ValueError("Action is not available at the current stage.")
-
-        action_map = {
-            'work_thesis': self._work_on_thesis,
-            'prepare_slides': self._prepare_slides,
-            'rest': self._rest,
-            'send_review': self._send_to_review,
-            'submit_for_inspection': self._submit_for_inspection,
-            'rehearse': self._rehearse_defense,
-            'defense': self._start_defense,
-            'attestation': self._perform_attestation,
-        }
-        return action_map[action_code]()
+        handler(self)
 
     def change_day(self) -> None:
-        if self.__today < self.__class__.MAX_DAY:
+        # Every action ends here, so this also covers the handlers' changes.
+        self._touch()
+        if self.__today < self.__calendar.MAX_DAY:
             self.__today += 1
 
-        if self.__today in (5, 11, 16):
-            self.__stage = DefenseStage.REVISION
-            
-        if (self.__today in (6, 7, 12, 13) and
-            self.__revision_passed[self.__today // 8] == True):
-            self.__stage = DefenseStage.PREPARATION
-            
-        if (self.__today in (17, 18) and
-            self.__revision_passed[2] == True):
-            self.__stage = DefenseStage.REHEARSAL
-            
-        if (self.__today in (7, 13, 18) and
-            self.__revision_passed[self.__today // 8] == False):
-            self.__stage = DefenseStage.FINISHED
-        
-        if self.__today in (24, 23):
-            self.__stage = DefenseStage.DEFENSE
-
-        if (self.__stage == DefenseStage.ATTESTATION):
-            self.__stage = DefenseStage.FINISHED
-        elif (self.__today == 25 or self.__defense_passed == True):
-            self.__stage = DefenseStage.ATTESTATION
+        self.__stage = self.__calendar.next_stage(
+            self.__today,
+            self.__stage,
+            self.__revision_passed,
+            self.__defense_passed,
+        )
 
         return True
     
-    def _work_on_thesis(self) -> None:
-        k1: int = self.__student.get_intelligence() - 2  
-        k2: int = 5 - self.__student.get_stamina() // 20
-        
-        self.__student.change_stamina(-20)
-        self.__diploma_project.change_complition(22 + k1 * 2 - k2 * 2)
-        self.__diploma_project.change_quality(k1 - k2)
-        
-        self.change_day()
-            
-    def _prepare_slides(self) -> None:
-        k1: int = self.__student.get_intelligence() - 2  
-        k2: int = 5 - self.__student.get_stamina() // 20
-        
-        self.__student.change_stamina(-15)
-        self.__presentation.change_complition(52 + k1 * 2 - k2 * 2)
-        
-        self.change_day()
+    @staticmethod
+    def compile_dispatch(rules: type[DefenseRules]) -> Dispatch:
+        handlers = {code: DefenseProcess._compile_action(rule, rules) for code, rule in rules.ACTIONS.items()}
+        return {
+            stage: {code: handlers[code] for code in actions}
+            for stage, actions in rules.STAGE_ACTIONS.items()
+        }
 
-    def _rest(self) -> None:
-        self.__student.change_stamina(20)
-        
-        self.__score += 9
-        
-        self.change_day()
-        
-    def _send_to_review(self) -> None:
-        k = (self.__scientific_supervisor.get_intelligence()
-             - self.__student.get_intelligence())
-        
-        self.__student.change_stamina(-10)
-        self.__diploma_project.change_quality(
-            (k + self.__scientific_supervisor.get_loyalty()) * 4)
-        
-        self.__score -= 3
-        
-        self.change_day()
-        
-    def _submit_for_inspection(self) -> None:
-        pct: int = self.__diploma_project.get_pct_complition()
-        if (pct > 33 and self.__revision_passed[0] == False):
-            self.__revision_passed[0] = True
-            self.__final_grade += 1 - self.__today // 6
-            self.__score += 2
-        if (pct > 66 and self.__revision_passed[1] == False):
-            self.__revision_passed[1] = True
-            self.__final_grade += 1 - self.__today // 12
-            self.__score += 5
-        if (pct == 100 and self.__revision_passed[2] == False):
-            self.__revision_passed[2] = True
-            self.__final_grade += 1 - self.__today // 17
-            self.__score += 8
-        
-        self.__student.change_stamina(-7)
-        
-        self.change_day()
-        
-    def _rehearse_defense(self) -> None:
-        self.__student.change_answer_skill(self.__student.get_stamina() // 50)
-        self.__student.change_stamina(-15)
-        
-        self.change_day()
-        
-    def _start_defense(self) -> None:
-        self.__defense_passed = True
-        self.__student.change_stamina(-20)
-        self.__final_grade += (1 + self.__student.get_answer_skill())
-        
-        if (self.__commission.get_loyalty() 
-            + self.__student.get_intelligence() <= 3 or
-            self.__presentation.get_pct_complition() <= 51):
-            self.__final_grade -= 1
-        
-        self.change_day()
-        
-        
-    def _perform_attestation(self) -> None:
-        self.__final_grade += (self.__diploma_project.get_quality() - 70) // 9
-        
-        self.__score += self.__final_grade * 2
-        self.__score *= (4 - self.__student.get_intelligence())
-        self.change_day()
+    @staticmethod
+    def _compile_action(rule: ActionRule, rules: type[DefenseRules]) -> Callable[[DefenseProcess], None]:
+        completion, quality, presentation = rule.completion, rule.quality, rule.presentation
+        uses_efficiency = rule.uses_efficiency()
+        stamina, score, review, rehearse = rule.stamina, rule.score, rule.review, rule.rehearse
+        inspection, defense, attestation = rule.inspection, rule.defense, rule.attestation
+        checks = tuple(enumerate(rules.REVISION_CHECKS))
+
+        def handler(process: DefenseProcess) -> None:
+            student = process.__student
+            project = process.__diploma_project
+            if uses_efficiency:
+                efficiency = rules.efficiency(student.get_intelligence(), student.get_stamina())
+                if completion is not None:
+                    project.change_complition(completion.delta(efficiency))
+                if quality is not None:
+                    project.change_quality(quality.delta(efficiency))
+                if presentation is not None:
+                    process.__presentation.change_complition(presentation.delta(efficiency))
+            if review:
+                supervisor = process.__scientific_supervisor
+                project.change_quality(review * rules.review_factor(
+                    supervisor.get_intelligence(), supervisor.get_loyalty(), student.get_intelligence()))
+            if rehearse:
+                student.change_answer_skill(student.get_stamina() // rehearse)
+            if inspection:
+                pct = project.get_pct_complition()
+                revision_passed = process.__revision_passed
+                for idx, check in checks:
+                    if pct >= check.min_completion and not revision_passed[idx]:
+                        revision_passed[idx] = True
+                        process.__final_grade += 1 - process.__today // check.day_divisor
+                        process.__score += check.score
+            if defense:
+                process.__defense_passed = True
+                penalty = (rules.loyalty_penalty(process.__commission.get_loyalty(), student.get_intelligence())
+                           or rules.presentation_penalty(process.__presentation.get_pct_complition()))
+                process.__final_grade += 1 + student.get_answer_skill() - penalty
+            process.__score += score
+            if attestation:
+                process.__final_grade += rules.attestation_grade(project.get_quality())
+                process.__score = ((process.__score + process.__final_grade * rules.ATTESTATION_GRADE_SCORE)
+                                   * rules.attestation_multiplier(student.get_intelligence()))
+            if stamina:
+                student.change_stamina(stamina)
+            process.change_day()
+        return handler
+
+    def fork(self) -> DefenseProcess:
+        clone = DefenseProcess.__new__(DefenseProcess)
+        clone.__student = self.__student.copy()
+        clone.__diploma_project = self.__diploma_project.copy()
+        clone.__presentation = self.__presentation.copy()
+        clone.__scientific_supervisor = self.__scientific_supervisor
+        clone.__commission = self.__commission
+        clone.__today = self.__today
+        clone.__stage = self.__stage
+        clone.__seed = self.__seed
+        clone.__revision_passed = self.__revision_passed.copy()
+        clone.__defense_passed = self.__defense_passed
+        clone.__final_grade = self.__final_grade
+        clone.__score = self.__score
+        clone.__version = self.__version
+        # The cached snapshot is immutable, so the clone can share it.
+        clone.__status = self.__status
+        clone.__scenario = self.__scenario
+        clone.__calendar = self.__calendar
+        clone.__dispatch = self.__dispatch
+        return clone
+
+    def snapshot(self) -> tuple:
+        revision_passed = self.__revision_passed
+        return (
+            self.__today,
+            self.__stage,
+            self.__student.get_stamina(),
+            self.__student.get_answer_skill(),
+            self.__diploma_project.get_pct_complition(),
+            self.__diploma_project.get_quality(),
+            self.__presentation.get_pct_complition(),
+            revision_passed[0],
+            revision_passed[1],
+            revision_passed[2],
+            self.__defense_passed,
+            self.__final_grade,
+            self.__score,
+        )
 
+    def restore(self, token: tuple) -> None:
+        (self.__today, self.__stage, stamina, answer_skill, pct_complition, quality,
+         presentation, revision_0, revision_1, revision_2, self.__defense_passed,
+         self.__final_grade, self.__score) = token
+        self.__student._restore(stamina, answer_skill)
+        self.__diploma_project._restore(pct_complition, quality)
+        self.__presentation._restore(presentation)
+        self.__revision_passed[:] = (revision_0, revision_1, revision_2)
+        self._touch()
 
     def to_dict(self) -> dict[str, object]:
-        return {
+        data = {
             'today': self.__today,
             'stage': self.__stage.name,
             'seed': self.__seed,
@@ -267,9 +303,17 @@ class DefenseProcess:
                 'loyalty': self.__commission.get_loyalty(),
             }
         }
+        if self.__scenario is not None and not self.__scenario.is_builtin():
+            data['scenario'] = self.__scenario.get_name()
+        return data
 
     @classmethod
-    def from_dict(cls, data: dict[str, object]) -> DefenseProcess:
+    def from_dict(cls, data: dict[str, object], scenario: Scenario | None = None) -> DefenseProcess:
+        saved_with = data.get("scenario")
+        expected = None if scenario is None or scenario.is_builtin() else scenario.get_name()
+        if saved_with != expected:
+            raise ValueError(
+                f"Session uses scenario {saved_with or 'default'!r}, not {expected or 'default'!r}.")
         student_data = data["student"]
         theme_data = data["theme"]
         diploma_data = data["diploma_project"]
@@ -313,6 +357,7 @@ class DefenseProcess:
             today=int(data["today"]),
             stage=DefenseStage[stage_name],
             seed=data.get("seed"),
+            scenario=scenario,
         )
 
         revision_passed = data["revision_passed"]
@@ -326,9 +371,10 @@ class DefenseProcess:
         process.__final_grade = int(final_grade) if final_grade is not None else None
         process.__score = int(data["score"])
 
-        rng_state = data["seed"]
-        
-        if isinstance(rng_state, str):
-            process.__rng.setstate(ast.literal_eval(rng_state))
-
         return process
+
+
+_VERSIONS = itertools.count()
+
+# Per-stage dispatch tables, compiled once from the declarative rules.
+_DISPATCH: Dispatch = DefenseProcess.compile_dispatch(DefenseRules)
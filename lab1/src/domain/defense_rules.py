@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any, NamedTuple
+
+from .defense_stage import DefenseStage
+
+
+class Gain(NamedTuple):
+    base: int
+    per_efficiency: int
+
+    def delta(self, efficiency: Any) -> Any:
+        return self.base + self.per_efficiency * efficiency
+
+
+class RevisionCheck(NamedTuple):
+    min_completion: int
+    day_divisor: int
+    score: int
+
+
+class ActionRule(NamedTuple):
+    label: str
+    stamina: int = 0
+    score: int = 0
+    completion: Gain | None = None
+    quality: Gain | None = None
+    presentation: Gain | None = None
+    # Quality gained per point of (supervisor intelligence - student
+    # intelligence + supervisor loyalty).
+    review: int = 0
+    # Answer skill gained per this many points of stamina.
+    rehearse: int = 0
+    inspection: bool = False
+    defense: bool = False
+    attestation: bool = False
+
+    def uses_efficiency(self) -> bool:
+        return self.completion is not None or self.quality is not None or self.presentation is not None
+
+
+# The formulas below take plain ints or numpy arrays alike, so the scalar
+# engine, the vectorized engine and the solver all compile the same rules.
+# Every formula reads the state from before the action; stamina changes last.
+class DefenseRules:
+    ACTIONS: dict[str, ActionRule] = {
+        "work_thesis": ActionRule(
+            label="Work on thesis",
+            stamina=-20,
+            completion=Gain(base=22, per_efficiency=2),
+            quality=Gain(base=0, per_efficiency=1),
+        ),
+        "rest": ActionRule(label="Rest", stamina=20, score=9),
+        "send_review": ActionRule(label="Send for review", stamina=-10, score=-3, review=4),
+        "submit_for_inspection": ActionRule(label="Submit for inspection", stamina=-7, inspection=True),
+        "prepare_slides": ActionRule(
+            label="Prepare presentation",
+            stamina=-15,
+            presentation=Gain(base=52, per_efficiency=2),
+        ),
+        "rehearse": ActionRule(label="Rehearse defense", stamina=-15, rehearse=50),
+        "defense": ActionRule(label="Go to defense", stamina=-20, defense=True),
+        "attestation": ActionRule(label="Get final grade", attestation=True),
+    }
+
+    STAGE_ACTIONS: dict[DefenseStage, tuple[str, ...]] = {
+        DefenseStage.PREPARATION: ("work_thesis", "rest", "send_review"),
+        DefenseStage.REVISION: ("work_thesis", "rest", "submit_for_inspection"),
+        DefenseStage.REHEARSAL: ("prepare_slides", "rest", "rehearse"),
+        DefenseStage.DEFENSE: ("prepare_slides", "rest", "rehearse", "defense"),
+        DefenseStage.ATTESTATION: ("attestation",),
+        DefenseStage.FINISHED: (),
+    }
+
+    # Checked in order by one inspection; each revision is passed once.
+    REVISION_CHECKS: tuple[RevisionCheck, ...] = (
+        RevisionCheck(min_completion=34, day_divisor=6, score=2),
+        RevisionCheck(min_completion=67, day_divisor=12, score=5),
+        RevisionCheck(min_completion=100, day_divisor=17, score=8),
+    )
+
+    EFFICIENCY_INTELLIGENCE: int = 2
+    EFFICIENCY_STAMINA_STEP: int = 20
+    EFFICIENCY_STAMINA_STEPS: int = 5
+
+    DEFENSE_MIN_LOYALTY: int = 4
+    DEFENSE_MIN_PRESENTATION: int = 52
+
+    ATTESTATION_QUALITY: int = 70
+    ATTESTATION_QUALITY_STEP: int = 9
+    ATTESTATION_GRADE_SCORE: int = 2
+    ATTESTATION_MULTIPLIER: int = 4
+
+    @classmethod
+    def efficiency(cls, intelligence: Any, stamina: Any) -> Any:
+        return ((intelligence - cls.EFFICIENCY_INTELLIGENCE)
+                - (cls.EFFICIENCY_STAMINA_STEPS - stamina // cls.EFFICIENCY_STAMINA_STEP))
+
+    @staticmethod
+    def review_factor(supervisor_intelligence: Any, supervisor_loyalty: Any, intelligence: Any) -> Any:
+        return supervisor_intelligence - intelligence + supervisor_loyalty
+
+    @classmethod
+    def loyalty_penalty(cls, commission_loyalty: Any, intelligence: Any) -> Any:
+        return commission_loyalty + intelligence < cls.DEFENSE_MIN_LOYALTY
+
+    @classmethod
+    def presentation_penalty(cls, presentation: Any) -> Any:
+        return presentation < cls.DEFENSE_MIN_PRESENTATION
+
+    @classmethod
+    def attestation_grade(cls, quality: Any) -> Any:
+        return (quality - cls.ATTESTATION_QUALITY) // cls.ATTESTATION_QUALITY_STEP
+
+    @classmethod
+    def attestation_multiplier(cls, intelligence: Any) -> Any:
+        return cls.ATTESTATION_MULTIPLIER - intelligence
+
+    @classmethod
+    def get_actions(cls, stage: DefenseStage) -> tuple[str, ...]:
+        return cls.STAGE_ACTIONS[stage]
+
+    @classmethod
+    def get_rule(cls, action_code: str) -> ActionRule:
+        return cls.ACTIONS[action_code]
+
+    @classmethod
+    def get_constants(cls) -> dict[str, int]:
+        return {name: getattr(cls, name) for name in _CONSTANTS}
+
+    @classmethod
+    def derive(
+        cls,
+        constants: Mapping[str, int] | None = None,
+        actions: Mapping[str, Mapping[str, object]] | None = None,
+        revision_checks: tuple[RevisionCheck, ...] | None = None,
+    ) -> type[DefenseRules]:
+        constants = dict(constants or {})
+        unknown = sorted(set(constants) - set(_CONSTANTS))
+        if unknown:
+            raise ValueError(f"Unknown rule constants: {', '.join(unknown)}.")
+        if constants.get("EFFICIENCY_STAMINA_STEP", 1) <= 0 or constants.get("ATTESTATION_QUALITY_STEP", 1) <= 0:
+            raise ValueError("Rule step constants must be positive.")
+
+        rules = dict(cls.ACTIONS)
+        for code, fields in (actions or {}).items():
+            if code not in rules:
+                raise ValueError(f"Unknown action: {code}.")
+            unknown = sorted(set(fields) - set(_TUNABLE_FIELDS))
+            if unknown:
+                raise ValueError(f"Action {code} cannot override: {', '.join(unknown)}.")
+            rule = rules[code]._replace(**fields)
+            if (rule.rehearse < 0 or (rules[code].rehearse > 0) != (rule.rehearse > 0)
+                    or (rules[code].review != 0) != (rule.review != 0)):
+                raise ValueError(f"Action {code} cannot gain or lose review or rehearsal effects.")
+            rules[code] = rule
+
+        checks = cls.REVISION_CHECKS if revision_checks is None else tuple(revision_checks)
+        if len(checks) != len(cls.REVISION_CHECKS) or any(check.day_divisor <= 0 for check in checks):
+            raise ValueError(
+                f"Rules need exactly {len(cls.REVISION_CHECKS)} revision checks with positive day divisors.")
+
+        return type(cls.__name__, (cls,), dict(constants, ACTIONS=rules, REVISION_CHECKS=checks))
+
+
+_CONSTANTS: tuple[str, ...] = tuple(
+    name for name, value in vars(DefenseRules).items() if name.isupper() and isinstance(value, int)
+)
+_TUNABLE_FIELDS: tuple[str, ...] = ("stamina", "score", "completion", "quality", "presentation", "review", "rehearse")
@@ -0,0 +1,10 @@
+from enum import Enum
+
+
+class DefenseStage(Enum):
+    PREPARATION = "Preparation"
+    REVISION = "Revision"
+    REHEARSAL = "Rehearsal"
+    DEFENSE = "Defense"
+    ATTESTATION = "Attestation"
+    FINISHED = "Finished"
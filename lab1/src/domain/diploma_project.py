@@ -1,7 +1,11 @@
+from __future__ import annotations
+
 from .theme import Theme
 
 
 class DiplomaProject:
+    __slots__ = ("__pct_complition", "__quality", "__theme")
+
     MIN_PCT: int = 0
     MAX_PCT: int = 100
 
@@ -38,6 +42,17 @@ class DiplomaProject:
     def get_theme_complexity(self) -> int:
         return self.__theme.get_complexity()
 
+    def copy(self) -> DiplomaProject:
+        clone = DiplomaProject.__new__(DiplomaProject)
+        clone.__pct_complition = self.__pct_complition
+        clone.__quality = self.__quality
+        clone.__theme = self.__theme
+        return clone
+
+    def _restore(self, pct_complition: int, quality: int) -> None:
+        self.__pct_complition = pct_complition
+        self.__quality = quality
+
     def change_complition(self, delta: int) -> int:
         new_pct_complition = self.__pct_complition + delta
         self.__pct_complition = max(self.MIN_PCT, min(
@@ -1,4 +1,9 @@
+from __future__ import annotations
+
+
 class Presentation:
+    __slots__ = ("__pct_complition",)
+
     MIN_PCT: int = 0
     MAX_PCT: int = 100
 
@@ -15,6 +20,14 @@ class Presentation:
     def get_pct_complition(self) -> int:
         return self.__pct_complition
 
+    def copy(self) -> Presentation:
+        clone = Presentation.__new__(Presentation)
+        clone.__pct_complition = self.__pct_complition
+        return clone
+
+    def _restore(self, pct_complition: int) -> None:
+        self.__pct_complition = pct_complition
+
     def change_complition(self, delta: int) -> int:
         new_pct_complition = self.__pct_complition + delta
         self.__pct_complition = max(self.MIN_PCT, min(
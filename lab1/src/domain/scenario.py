@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from .commission import Commission
+from .defense_calendar import DefenseCalendar
+from .defense_process import DefenseProcess, Dispatch
+from .defense_rules import DefenseRules
+from .diploma_project import DiplomaProject
+from .scientific_supervisor import ScientificSupervisor
+from .student import Student
+from .theme import Theme
+
+
+class Scenario:
+    __slots__ = (
+        "__name",
+        "__themes",
+        "__supervisor_names",
+        "__supervisor_intelligence",
+        "__supervisor_loyalty",
+        "__commission_loyalty",
+        "__student_stamina",
+        "__project_quality",
+        "__calendar",
+        "__rules",
+        "__dispatch",
+        "__supervisors",
+        "__commissions",
+    )
+
+    DEFAULT_NAME: str = "default"
+
+    def __init__(
+            self,
+            name: str,
+            themes: Sequence[Theme],
+            supervisor_names: Sequence[str],
+            student_stamina: int = 80,
+            project_quality: int = 90,
+            supervisor_intelligence: tuple[int, int] = (1, 3),
+            supervisor_loyalty: tuple[int, int] = (1, 3),
+            commission_loyalty: tuple[int, int] = (1, 3),
+            calendar: type[DefenseCalendar] = DefenseCalendar,
+            rules: type[DefenseRules] = DefenseRules):
+        if not name:
+            raise ValueError("Scenario name must be a non-empty string.")
+        if not themes:
+            raise ValueError("Scenario needs at least one theme.")
+        if not supervisor_names:
+            raise ValueError("Scenario needs at least one supervisor name.")
+        Student._validate_stamina(student_stamina)
+        DiplomaProject._validate_quality(project_quality)
+        for bounds in (supervisor_intelligence, supervisor_loyalty, commission_loyalty):
+            if len(bounds) != 2 or bounds[0] > bounds[1]:
+                raise ValueError("Ranges must be [low, high] with low <= high.")
+
+        self.__name: str = name
+        self.__themes: tuple[Theme, ...] = tuple(themes)
+        self.__supervisor_names: tuple[str, ...] = tuple(supervisor_names)
+        self.__supervisor_intelligence: tuple[int, int] = tuple(supervisor_intelligence)
+        self.__supervisor_loyalty: tuple[int, int] = tuple(supervisor_loyalty)
+        self.__commission_loyalty: tuple[int, int] = tuple(commission_loyalty)
+        self.__student_stamina: int = student_stamina
+        self.__project_quality: int = project_quality
+        self.__calendar: type[DefenseCalendar] = calendar
+        self.__rules: type[DefenseRules] = rules
+        self.__dispatch: Dispatch = DefenseProcess.compile_dispatch(rules)
+
+        # Supervisors and commissions are immutable, so every combination is
+        # built (and validated) once and shared by all sessions.
+        self.__supervisors: dict[tuple[str, int, int], ScientificSupervisor] = {
+            (supervisor, intelligence, loyalty): ScientificSupervisor(supervisor, intelligence, loyalty)
+            for supervisor in self.__supervisor_names
+            for intelligence in range(supervisor_intelligence[0], supervisor_intelligence[1] + 1)
+            for loyalty in range(supervisor_loyalty[0], supervisor_loyalty[1] + 1)
+        }
+        self.__commissions: dict[int, Commission] = {
+            loyalty: Commission(loyalty)
+            for loyalty in range(commission_loyalty[0], commission_loyalty[1] + 1)
+        }
+
+    @classmethod
+    def default(cls) -> Scenario:
+        return _DEFAULT
+
+    def is_builtin(self) -> bool:
+        return self is _DEFAULT
+
+    def get_name(self) -> str:
+        return self.__name
+
+    def get_themes(self) -> tuple[Theme, ...]:
+        return self.__themes
+
+    def get_supervisor_names(self) -> tuple[str, ...]:
+        return self.__supervisor_names
+
+    def get_supervisor_intelligence(self) -> tuple[int, int]:
+        return self.__supervisor_intelligence
+
+    def get_supervisor_loyalty(self) -> tuple[int, int]:
+        return self.__supervisor_loyalty
+
+    def get_commission_loyalty(self) -> tuple[int, int]:
+        return self.__commission_loyalty
+
+    def get_student_stamina(self) -> int:
+        return self.__student_stamina
+
+    def get_project_quality(self) -> int:
+        return self.__project_quality
+
+    def get_calendar(self) -> type[DefenseCalendar]:
+        return self.__calendar
+
+    def get_rules(self) -> type[DefenseRules]:
+        return self.__rules
+
+    def get_dispatch(self) -> Dispatch:
+        return self.__dispatch
+
+    def get_supervisor(self, name: str, intelligence: int, loyalty: int) -> ScientificSupervisor:
+        supervisor = self.__supervisors.get((name, intelligence, loyalty))
+        if supervisor is None:
+            raise ValueError("Supervisor is not part of this scenario.")
+        return supervisor
+
+    def get_commission(self, loyalty: int) -> Commission:
+        commission = self.__commissions.get(loyalty)
+        if commission is None:
+            raise ValueError("Commission loyalty is not part of this scenario.")
+        return commission
+
+    def __repr__(self) -> str:
+        return f"Scenario(name={self.__name!r})"
+
+
+_DEFAULT = Scenario(
+    name=Scenario.DEFAULT_NAME,
+    themes=(
+        Theme("Smart recommendation system", 2),
+        Theme("Neural network optimization", 3),
+        Theme("Knowledge base assistant", 1),
+    ),
+    supervisor_names=("Dr. Ivanov", "Dr. Petrov", "Dr. Sidorov"),
+)
@@ -1,4 +1,6 @@
 class ScientificSupervisor:
+    __slots__ = ("__name", "__intelligence", "__loyalty")
+
     ALLOWED_INTELLIGENCE: tuple[int, int, int] = (1, 2, 3)
     ALLOWED_LOYALTY: tuple[int, int, int] = (1, 2, 3)
 
@@ -1,4 +1,9 @@
+from __future__ import annotations
+
+
 class Student:
+    __slots__ = ("__name", "__intelligence", "__stamina", "__answer_skill")
+
     MIN_STAMINA: int = 0
     MAX_STAMINA: int = 100
     MAX_ANSWER_SKILL: int = 3
@@ -48,6 +53,18 @@ class Student:
     def get_answer_skill(self) -> int:
         return self.__answer_skill
 
+    def copy(self) -> Student:
+        clone = Student.__new__(Student)
+        clone.__name = self.__name
+        clone.__intelligence = self.__intelligence
+        clone.__stamina = self.__stamina
+        clone.__answer_skill = self.__answer_skill
+        return clone
+
+    def _restore(self, stamina: int, answer_skill: int) -> None:
+        self.__stamina = stamina
+        self.__answer_skill = answer_skill
+
     def change_stamina(self, delta: int) -> int:
         new_stamina = self.__stamina + delta
         self.__stamina = max(self.MIN_STAMINA, min(
@@ -1,4 +1,6 @@
 class Theme:
+    __slots__ = ("__name", "__complexity")
+
     ALLOWED_COMLEXITY: tuple[int, int, int] = (1, 2, 3)
 
     def __init__(self, name: str, complexity: int):
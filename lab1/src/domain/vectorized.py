@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+
+import numpy as np
+
+from .defense_calendar import DefenseCalendar
+from .defense_process import DefenseProcess, DefenseStage
+from .defense_rules import ActionRule, DefenseRules
+from .student import Student
+
+
+class VectorizedDefense:
+    STAGES: tuple[DefenseStage, ...] = DefenseCalendar.STAGES
+    ACTIONS: tuple[str, ...] = tuple(DefenseProcess.ACTION_LABELS)
+
+    PREPARATION: int = STAGES.index(DefenseStage.PREPARATION)
+    REVISION: int = STAGES.index(DefenseStage.REVISION)
+    REHEARSAL: int = STAGES.index(DefenseStage.REHEARSAL)
+    DEFENSE: int = STAGES.index(DefenseStage.DEFENSE)
+    ATTESTATION: int = STAGES.index(DefenseStage.ATTESTATION)
+    FINISHED: int = STAGES.index(DefenseStage.FINISHED)
+
+    WORK_THESIS: int = ACTIONS.index("work_thesis")
+    REST: int = ACTIONS.index("rest")
+    SEND_REVIEW: int = ACTIONS.index("send_review")
+    SUBMIT_FOR_INSPECTION: int = ACTIONS.index("submit_for_inspection")
+    PREPARE_SLIDES: int = ACTIONS.index("prepare_slides")
+    REHEARSE: int = ACTIONS.index("rehearse")
+    START_DEFENSE: int = ACTIONS.index("defense")
+    ATTESTATION_ACTION: int = ACTIONS.index("attestation")
+
+    def __init__(self, processes: Sequence[DefenseProcess]):
+        snapshots = [process.to_dict() for process in processes]
+        if any("scenario" in item for item in snapshots):
+            raise ValueError("The vectorized engine only supports the built-in scenario.")
+        size = len(snapshots)
+
+        self.__size: int = size
+        self.__seeds: list[object] = [item["seed"] for item in snapshots]
+        self.__student_names: list[str] = [item["student"]["name"] for item in snapshots]
+        self.__theme_names: list[str] = [item["theme"]["name"] for item in snapshots]
+        self.__supervisor_names: list[str] = [item["supervisor"]["name"] for item in snapshots]
+
+        def column(*path: str) -> np.ndarray:
+            values = []
+            for item in snapshots:
+                for key in path:
+                    item = item[key]
+                values.append(item)
+            return np.array(values, dtype=np.int64).reshape(size)
+
+        self.theme_complexity: np.ndarray = column("theme", "complexity")
+        self.intelligence: np.ndarray = column("student", "intelligence")
+        self.stamina: np.ndarray = column("student", "stamina")
+        self.answer_skill: np.ndarray = column("student", "answer_skill")
+        self.completion: np.ndarray = column("diploma_project", "pct_complition")
+        self.quality: np.ndarray = column("diploma_project", "quality")
+        self.presentation: np.ndarray = column("presentation", "pct_complition")
+        self.supervisor_intelligence: np.ndarray = column("supervisor", "intelligence")
+        self.supervisor_loyalty: np.ndarray = column("supervisor", "loyalty")
+        self.commission_loyalty: np.ndarray = column("commission", "loyalty")
+        self.today: np.ndarray = column("today")
+        self.final_grade: np.ndarray = column("final_grade")
+        self.score: np.ndarray = column("score")
+        self.stage: np.ndarray = np.array(
+            [self.STAGES.index(DefenseStage[item["stage"]]) for item in snapshots],
+            dtype=np.int64,
+        ).reshape(size)
+        self.revision_passed: np.ndarray = np.array(
+            [item["revision_passed"] for item in snapshots],
+            dtype=bool,
+        ).reshape(size, 3)
+        self.defense_passed: np.ndarray = np.array(
+            [item["defense_passed"] for item in snapshots],
+            dtype=bool,
+        ).reshape(size)
+
+    @classmethod
+    def _build_stage_tables(cls) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        available = np.zeros((len(cls.STAGES), len(cls.ACTIONS)), dtype=bool)
+        ordered = np.full((len(cls.STAGES), len(cls.ACTIONS)), -1, dtype=np.int64)
+        counts = np.zeros(len(cls.STAGES), dtype=np.int64)
+        for stage_idx, stage in enumerate(cls.STAGES):
+            codes = [cls.ACTIONS.index(code) for code in DefenseRules.get_actions(stage)]
+            available[stage_idx, codes] = True
+            ordered[stage_idx, :len(codes)] = codes
+            counts[stage_idx] = len(codes)
+        return available, ordered, counts
+
+    def __len__(self) -> int:
+        return self.__size
+
+    def available_mask(self) -> np.ndarray:
+        return _AVAILABLE[self.stage]
+
+    def is_finished(self) -> np.ndarray:
+        return self.stage == self.FINISHED
+
+    def all_finished(self) -> bool:
+        return bool(np.all(self.stage == self.FINISHED))
+
+    def pick_actions(self, uniform: np.ndarray) -> np.ndarray:
+        # Mirrors ``actions[int(u * len(actions))]`` over get_available_actions().
+        counts = _COUNTS[self.stage]
+        picks = np.minimum((uniform * counts).astype(np.int64), np.maximum(counts - 1, 0))
+        return np.where(counts > 0, _ORDERED[self.stage, picks], -1)
+
+    def step(self, actions: np.ndarray) -> None:
+        actions = np.asarray(actions, dtype=np.int64)
+        active = ~self.is_finished()
+        valid = np.zeros(self.__size, dtype=bool)
+        in_range = (actions >= 0) & (actions < len(self.ACTIONS))
+        valid[in_range] = _AVAILABLE[self.stage[in_range], actions[in_range]]
+        if np.any(active & ~valid):
+            raise ValueError("Action is not available at the current stage.")
+
+        for code, apply in enumerate(_STEPS):
+            mask = active & (actions == code)
+            if mask.any():
+                apply(self, mask)
+        self.change_day(active)
+
+    def change_day(self, mask: np.ndarray) -> None:
+        self.today[mask] = np.minimum(self.today[mask] + 1, DefenseProcess.MAX_DAY)
+
+        revision_mask = self.revision_passed[mask] @ _REVISION_BITS
+        index = ((self.today[mask] * len(self.STAGES) + self.stage[mask])
+                 * DefenseCalendar.REVISION_MASKS + revision_mask) * 2 + self.defense_passed[mask]
+        self.stage[mask] = _CALENDAR[index]
+
+    @staticmethod
+    def _compile_step(rule: ActionRule) -> Callable[[VectorizedDefense, np.ndarray], None]:
+        completion, quality, presentation = rule.completion, rule.quality, rule.presentation
+        uses_efficiency = rule.uses_efficiency()
+        stamina, score, review, rehearse = rule.stamina, rule.score, rule.review, rule.rehearse
+        inspection, defense, attestation = rule.inspection, rule.defense, rule.attestation
+
+        def apply(engine: VectorizedDefense, mask: np.ndarray) -> None:
+            intelligence = engine.intelligence[mask]
+            if uses_efficiency:
+                efficiency = DefenseRules.efficiency(intelligence, engine.stamina[mask])
+                if completion is not None:
+                    engine.completion[mask] = np.clip(
+                        engine.completion[mask] + completion.delta(efficiency), 0, 100)
+                if quality is not None:
+                    engine.quality[mask] = np.clip(engine.quality[mask] + quality.delta(efficiency), 0, 100)
+                if presentation is not None:
+                    engine.presentation[mask] = np.clip(
+                        engine.presentation[mask] + presentation.delta(efficiency), 0, 100)
+            if review:
+                factor = DefenseRules.review_factor(
+                    engine.supervisor_intelligence[mask], engine.supervisor_loyalty[mask], intelligence)
+                engine.quality[mask] = np.clip(engine.quality[mask] + review * factor, 0, 100)
+            if rehearse:
+                engine.answer_skill[mask] = np.minimum(
+                    Student.MAX_ANSWER_SKILL, engine.answer_skill[mask] + engine.stamina[mask] // rehearse)
+            if inspection:
+                revision = engine.revision_passed
+                for idx, check in enumerate(DefenseRules.REVISION_CHECKS):
+                    passed = mask & (engine.completion >= check.min_completion) & ~revision[:, idx]
+                    revision[passed, idx] = True
+                    engine.final_grade[passed] += 1 - engine.today[passed] // check.day_divisor
+                    engine.score[passed] += check.score
+            if defense:
+                engine.defense_passed[mask] = True
+                penalty = (DefenseRules.loyalty_penalty(engine.commission_loyalty[mask], intelligence)
+                           | DefenseRules.presentation_penalty(engine.presentation[mask]))
+                engine.final_grade[mask] += 1 + engine.answer_skill[mask] - penalty
+            if score:
+                engine.score[mask] += score
+            if attestation:
+                engine.final_grade[mask] += DefenseRules.attestation_grade(engine.quality[mask])
+                engine.score[mask] = ((engine.score[mask] + engine.final_grade[mask] * DefenseRules.ATTESTATION_GRADE_SCORE)
+                                      * DefenseRules.attestation_multiplier(intelligence))
+            if stamina:
+                engine.stamina[mask] = np.clip(engine.stamina[mask] + stamina, 0, 100)
+        return apply
+
+    def get_status(self, index: int) -> dict[str, int | str | bool]:
+        return {
+            'today': int(self.today[index]),
+            'max_days': DefenseProcess.MAX_DAY,
+            'stage': self.STAGES[self.stage[index]].value,
+            'student_name': self.__student_names[index],
+            'student_intelligence': int(self.intelligence[index]),
+            'stamina': int(self.stamina[index]),
+            'thesis_completion': int(self.completion[index]),
+            'thesis_quality': int(self.quality[index]),
+            'theme_name': self.__theme_names[index],
+            'theme_complexity': int(self.theme_complexity[index]),
+            'presentation': int(self.presentation[index]),
+            'answer_skill': int(self.answer_skill[index]),
+            'revision_passed': tuple(bool(item) for item in self.revision_passed[index]),
+            'defense_passed': bool(self.defense_passed[index]),
+            'score': int(self.score[index]),
+            'final_grade': int(self.final_grade[index]),
+        }
+
+    def to_dict(self, index: int) -> dict[str, object]:
+        return {
+            'today': int(self.today[index]),
+            'stage': self.STAGES[self.stage[index]].name,
+            'seed': self.__seeds[index],
+            'revision_passed': [bool(item) for item in self.revision_passed[index]],
+            'defense_passed': bool(self.defense_passed[index]),
+            'final_grade': int(self.final_grade[index]),
+            'score': int(self.score[index]),
+            'student': {
+                'name': self.__student_names[index],
+                'intelligence': int(self.intelligence[index]),
+                'stamina': int(self.stamina[index]),
+                'answer_skill': int(self.answer_skill[index]),
+            },
+            'theme': {
+                'name': self.__theme_names[index],
+                'complexity': int(self.theme_complexity[index]),
+            },
+            'diploma_project': {
+                'pct_complition': int(self.completion[index]),
+                'quality': int(self.quality[index]),
+            },
+            'presentation': {
+                'pct_complition': int(self.presentation[index]),
+            },
+            'supervisor': {
+                'name': self.__supervisor_names[index],
+                'intelligence': int(self.supervisor_intelligence[index]),
+                'loyalty': int(self.supervisor_loyalty[index]),
+            },
+            'commission': {
+                'loyalty': int(self.commission_loyalty[index]),
+            }
+        }
+
+
+_AVAILABLE, _ORDERED, _COUNTS = VectorizedDefense._build_stage_tables()
+_STEPS: tuple[Callable[[VectorizedDefense, np.ndarray], None], ...] = tuple(
+    VectorizedDefense._compile_step(DefenseRules.get_rule(code)) for code in VectorizedDefense.ACTIONS
+)
+_CALENDAR: np.ndarray = np.array(DefenseCalendar.get_table(), dtype=np.int64)
+_REVISION_BITS: np.ndarray = 1 << np.arange(len(DefenseCalendar.REVISION_WINDOWS), dtype=np.int64)
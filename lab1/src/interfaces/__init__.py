@@ -1,3 +1,15 @@
-from .cli import run_cli
+from __future__ import annotations
 
-__all__ = ["run_cli"]
+__all__ = ["SessionServer", "run_cli"]
+
+
+# Submodules are imported on first use, so the server and other headless
+# entry points never pay for importing rich.
+def __getattr__(name: str) -> object:
+    if name == "run_cli":
+        from .cli import run_cli
+        return run_cli
+    if name == "SessionServer":
+        from .server import SessionServer
+        return SessionServer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,4 +1,4 @@
-from application import SessionService
+from application import Estimate, SessionService
 
 from rich.console import Console, Group
 from rich.columns import Columns
@@ -9,11 +9,14 @@ from rich.table import Table
 from rich.text import Text
 from rich.markdown import Markdown
 
+from .timeline import Timeline
+
 def run_cli(
     service: SessionService,
     slot: int,
     create_new: bool = False,
     seed: int | None = None,
+    show_frame_stats: bool = False,
 ) -> None:
     if create_new or not service.has_save(slot):
         
@@ -32,10 +35,11 @@ def run_cli(
 
 
     console = Console()
-    console.print(render_ui(service))
-    
+    if console.is_terminal:
+        _run_live(service, console, show_frame_stats)
+        return
+
     while True:
-        console.clear()
         console.print(render_ui(service))
 
         if service.is_finished():
@@ -48,9 +52,39 @@ def run_cli(
             save_path = service.save()
             print(f"\nSession saved to {save_path}.")
             break
+        _apply_action(service, action_code)
+
+
+def _run_live(service: SessionService, console: Console, show_frame_stats: bool) -> None:
+    from .dashboard import LiveDashboard
 
+    console.clear()
+    with LiveDashboard(service, console) as dashboard:
+        while not service.is_finished():
+            action_code = dashboard.choose_action()
+            if action_code == "exit":
+                break
+            _apply_action(service, action_code)
+            dashboard.update()
+
+    if service.is_finished():
+        console.print(render_final_report(service))
+        print("\nSession is finished.")
+    else:
+        save_path = service.save()
+        print(f"\nSession saved to {save_path}.")
+    if show_frame_stats:
+        print(dashboard.format_frame_stats())
+
+
+def _apply_action(service: SessionService, action_code: str) -> None:
+    if action_code == "undo":
+        service.undo()
+    elif action_code == "redo":
+        service.redo()
+    else:
         service.perform_action(action_code)
-        
+
 
 def render_ui(service: SessionService) -> Group:
     status = service.get_status()
@@ -182,180 +216,59 @@ def render_ui(service: SessionService) -> Group:
     timeline_table = Table.grid(expand=True)
     timeline_table.add_column(no_wrap=True)
     timeline_table.add_column(ratio=1)
-    timeline_table.add_row(
-        Columns(
-            [
-                ProgressBar(
-                    total=2.5, 
-                    completed=status['today'], 
-                    width=6,
-                    complete_style="green",
-                    finished_style="green",
-                ),
-                Text("󰷈", style=f"{'green' if status['today'] > 2.5  else 'grey23'}"),
-                ProgressBar(
-                    total=2.5, 
-                    completed=status['today'] - 2.5, 
-                    width=6,
-                    complete_style="green",
-                    finished_style="green",
-                ),
-                Text(">"),
-                
-                ProgressBar(
-                    total=1, 
-                    completed=status['today'] - 5, 
-                    width=2,
-                    complete_style="green",
-                    finished_style="green",
-                ),
-                Text("󰃯", style=f"{'green' if status['today'] > 6  else 'grey23'}"),
-                ProgressBar(
-                    total=1, 
-                    completed=status['today'] - 6, 
-                    width=2,
-                    complete_style="green",
-                    finished_style="green",
-                ),
-                Text(">"),
-                
-                ProgressBar(
-                    total=2, 
-                    completed=status['today'] - 7, 
-                    width=5,
-                    complete_style="green",
-                    finished_style="green",
-                ),
-                Text("󰷈", style=f"{'green' if status['today'] > 9  else 'grey23'}"),
-                ProgressBar(
-                    total=2, 
-                    completed=status['today'] - 9, 
-                    width=5,
-                    complete_style="green",
-                    finished_style="green",
-                ),
-                Text(">"),
-
-                ProgressBar(
-                    total=1, 
-                    completed=status['today'] - 11,
-                    width=2,
-                    complete_style="green",
-                    finished_style="green",
-                ),
-                Text("󰃯", style=f"{'green' if status['today'] > 12  else 'grey23'}"),
-                ProgressBar(
-                    total=1, 
-                    completed=status['today'] - 12, 
-                    width=2,
-                    complete_style="green",
-                    finished_style="green",
-                ),
-                Text(">"),
-
-                ProgressBar(
-                    total=1.5, 
-                    completed=status['today'] - 13,
-                    width=4,
-                    complete_style="green",
-                    finished_style="green",
-                ),
-                Text("󰷈", style=f"{'green' if status['today'] > 14.5  else 'grey23'}"),
-                ProgressBar(
-                    total=1.5, 
-                    completed=status['today'] - 14.5, 
-                    width=4,
-                    complete_style="green",
-                    finished_style="green",
-                ),
-                Text(">"),
-
-                ProgressBar(
-                    total=1, 
-                    completed=status['today'] - 16,
-                    width=2,
-                    complete_style="green",
-                    finished_style="green",
-                ),
-                Text("󰃯", style=f"{'green' if status['today'] > 17  else 'grey23'}"),
-                ProgressBar(
-                    total=1, 
-                    completed=status['today'] - 17,
-                    width=2,
-                    complete_style="green",
-                    finished_style="green",
-                ),
-                Text(">"),
-
-                ProgressBar(
-                    total=2.5, 
-                    completed=status['today'] - 18,
-                    width=6,
-                    complete_style="green",
-                    finished_style="green",
-                ),
-                Text("󱆿", style=f"{'green' if status['today'] > 20.5  else 'grey23'}"),
-                ProgressBar(
-                    total=2.5, 
-                    completed=status['today'] - 20.5, 
-                    width=6,
-                    complete_style="green",
-                    finished_style="green",
-                ),
-                Text(">"),
-
-                ProgressBar(
-                    total=1, 
-                    completed=status['today'] - 23,
-                    width=2,
-                    complete_style="green",
-                    finished_style="green",
-                ),
-                Text("󰞀", style=f"{'green' if status['today'] > 24  else 'grey23'}"),
-                ProgressBar(
-                    total=1, 
-                    completed=status['today'] - 24, 
-                    width=2,
-                    complete_style="green",
-                    finished_style="green",
-                ),
-                Text(">"),
-
-                ProgressBar(
-                    total=1, 
-                    completed=status['today'] - 24,
-                    width=2,
-                    complete_style="green",
-                    finished_style="green",
-                ),
-            ]
-        )
-    )
+    timeline_table.add_row(Timeline(int(status['today']), service.get_calendar()))
     
     timeline_panel = Panel(timeline_table, width=112)
+    estimate_text = render_estimate(service)
 
     # ----- ACTIONS -----
-    actions = service.get_available_actions()
-    
+    actions_panel = Panel(render_actions(service, service.get_available_actions()), title="Actions", width=60)
+
+    return Group(main_columns, timeline_panel, estimate_text, actions_panel)
+
+
+def render_estimate(service: SessionService) -> Text:
+    # Never waits for rollouts: shows the last finished estimate, which may
+    # describe an earlier day while the current one is being computed.
+    estimate = service.get_estimate() if not service.is_finished() else None
+    return format_estimate(estimate, service.get_version())
+
+
+def format_estimate(estimate: Estimate | None, version: int) -> Text:
+    if estimate is None:
+        return Text()
+    low, high = estimate.get_interval()
+    text = Text(
+        f" Defense chance: {estimate.get_defense_probability():.0%} ({low:.0%}..{high:.0%}), "
+        f"grade ~ {estimate.get_expected_grade():.1f}",
+        style="italic",
+    )
+    if estimate.get_version() != version:
+        text.append(f"  (day {estimate.get_day()}, updating)", style="grey50")
+    return text
+
+
+def render_actions(service: SessionService, actions: list[str]) -> Table:
     action_tables = Table.grid(expand=True)
     action_tables.add_column(no_wrap=True)
     action_tables.add_column(ratio=1)
     action_tables.add_row()
-    
+
     for idx, action_code in enumerate(actions, start=1):
         action_tables.add_row(
             Text(f"{idx}. "),
             Text(f"{service.get_action_label(action_code)}"),
             Text(service.get_action_help(action_code), style="italic")
         )
-    
+
+    action_tables.add_row(Text("H. "), Text("Hint"), Text("best move estimate", style="italic"))
+    if service.can_undo():
+        action_tables.add_row(Text("U. "), Text("Undo"), Text("step back one day", style="italic"))
+    if service.can_redo():
+        action_tables.add_row(Text("R. "), Text("Redo"), Text("repeat undone action", style="italic"))
     action_tables.add_row(Text("0. "), Text("Exit and save   "))
     action_tables.add_row()
-
-    
-    actions_panel = Panel(action_tables, title="Actions", width=60)
-
-    return Group(main_columns, timeline_panel, actions_panel)
+    return action_tables
 
 
 def _prompt_int(prompt: str, min_value: int, max_value: int) -> int:
@@ -374,23 +287,41 @@ def _prompt_int(prompt: str, min_value: int, max_value: int) -> int:
 
 
 def _choose_action(service: SessionService, console: Console) -> str:
-    actions = service.get_available_actions()
     status = service.get_status()
     
     root_str = f"({status['today']}/{status['max_days']}), {status['stage']}"
     while True:
         raw = console.input(f"[[italic]{root_str}[/]][bold]> [/]").strip()
-        if raw == "0":
-            return "exit"
-        try:
-            selected = int(raw)
-        except ValueError:
-            print("Please enter a valid number.")
-            continue
+        action_code, message = resolve_choice(service, raw)
+        if action_code is not None:
+            return action_code
+        console.print(message)
+
 
-        if 1 <= selected <= len(actions):
-            return actions[selected - 1]
-        print("No such option. Try again.")
+def resolve_choice(service: SessionService, raw: str) -> tuple[str | None, str | None]:
+    actions = service.get_available_actions()
+    if raw == "0":
+        return "exit", None
+    if raw.lower() == "u" and service.can_undo():
+        return "undo", None
+    if raw.lower() == "r" and service.can_redo():
+        return "redo", None
+    if raw.lower() == "h":
+        advice = service.get_hint()
+        return None, (
+            f"Hint: [bold]{service.get_action_label(advice.get_action())}[/] "
+            f"(grade ~ {advice.get_expected_grade():.1f}, "
+            f"score ~ {advice.get_expected_score():.0f}, "
+            f"defense {advice.get_defense_probability():.0%})"
+        )
+    try:
+        selected = int(raw)
+    except ValueError:
+        return None, "Please enter a valid number."
+
+    if 1 <= selected <= len(actions):
+        return actions[selected - 1], None
+    return None, "No such option. Try again."
 
 
 def render_final_report(service: SessionService) -> Group:
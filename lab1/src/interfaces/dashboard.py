@@ -0,0 +1,270 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from collections.abc import Mapping
+
+from application import Estimate, SessionService
+
+from rich.columns import Columns
+from rich.console import Console, Group
+from rich.control import Control, ControlType
+from rich.live import Live
+from rich.panel import Panel
+from rich.progress_bar import ProgressBar
+from rich.style import Style
+from rich.table import Table
+from rich.text import Text
+
+from .cli import format_estimate, render_actions, render_estimate, resolve_choice
+from .timeline import Timeline
+
+
+class _Meter:
+    __slots__ = ("bar", "label", "total", "complete_colour")
+
+    def __init__(self, total: int, width: int, complete_colour: str = "red", finished_colour: str = "green"):
+        self.total: int = total
+        self.complete_colour: str = complete_colour
+        self.bar: ProgressBar = ProgressBar(
+            total=total,
+            completed=0,
+            width=width,
+            complete_style=complete_colour,
+            finished_style=finished_colour,
+        )
+        self.label: Text = Text()
+
+    def set(self, value: int) -> None:
+        self.bar.update(completed=value)
+        self.label.plain = f" {value}/{self.total} "
+        colour = self.complete_colour if value != self.total else self.bar.finished_style
+        self.label.style = f"bold black on {colour}"
+
+
+class LiveDashboard:
+    DEFAULT_FRAME_BUDGET: float = 0.05
+    FRAME_HISTORY: int = 256
+
+    STUDENT_FIELDS: tuple[str, ...] = ("student_intelligence", "stamina", "answer_skill")
+    THESIS_FIELDS: tuple[str, ...] = ("thesis_completion", "thesis_quality", "presentation")
+
+    def __init__(self, service: SessionService, console: Console, frame_budget: float = DEFAULT_FRAME_BUDGET):
+        if frame_budget <= 0:
+            raise ValueError("Frame budget must be positive.")
+
+        self.__service = service
+        self.__console = console
+        self.__frame_budget: float = frame_budget
+        self.__frame_times: deque[float] = deque(maxlen=self.FRAME_HISTORY)
+        self.__status: Mapping[str, object] = {}
+        self.__version: int | None = None
+        self.__menu_key: tuple | None = None
+        self.__rebuilt: dict[str, int] = {"timeline": 0, "actions": 0}
+        # Estimates land on a worker thread; this keeps their redraw from
+        # interleaving with one done by the input loop.
+        self.__lock: threading.RLock = threading.RLock()
+        self.__prompting: bool = False
+        self.__finished: bool = False
+
+        self.__student_name = Text(style="bold black on white")
+        self.__theme_name = Text(style="bold black on white")
+        self.__meters: dict[str, _Meter] = {
+            "student_intelligence": _Meter(3, 24, "yellow", "yellow"),
+            "stamina": _Meter(100, 24),
+            "answer_skill": _Meter(3, 24),
+            "thesis_completion": _Meter(100, 31),
+            "thesis_quality": _Meter(100, 31),
+            "presentation": _Meter(100, 31),
+        }
+        self.__message = Text()
+        self.__estimate = Text()
+
+        student_table = self._grid()
+        student_table.add_row()
+        student_table.add_row("Name: ", self.__student_name, " ", "         ")
+        student_table.add_row()
+        for label, field in zip(("Intelligence: ", "Stamina: ", "Answer skill: "), self.STUDENT_FIELDS):
+            meter = self.__meters[field]
+            student_table.add_row(label, meter.bar, " ", meter.label)
+        student_table.add_row()
+
+        project_table = self._grid()
+        project_table.add_row()
+        project_table.add_row("Theme: ", self.__theme_name, " ", "         ")
+        project_table.add_row()
+        for label, field in zip(("Thesis done: ", "Quality: ", "Presentation: "), self.THESIS_FIELDS):
+            meter = self.__meters[field]
+            project_table.add_row(label, meter.bar, " ", meter.label)
+        project_table.add_row()
+
+        self.__timeline_panel = Panel(Text(), width=112)
+        self.__actions_panel = Panel(Text(), title="Actions", width=60)
+        self.__root = Group(
+            Columns([Panel(student_table, title="Student"), Panel(project_table, title="Thesis")], equal=True),
+            self.__timeline_panel,
+            self.__estimate,
+            self.__actions_panel,
+            self.__message,
+        )
+        self.__live = Live(
+            self.__root,
+            console=console,
+            auto_refresh=False,
+            redirect_stdout=False,
+            redirect_stderr=False,
+        )
+
+    def __enter__(self) -> LiveDashboard:
+        # Listen before the first frame queues rollouts; the lock holds back
+        # an early estimate until Live is on screen.
+        self.__service.set_estimate_listener(self._estimate_ready)
+        with self.__lock:
+            self.update(refresh=False)
+            self.__live.start(refresh=True)
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.__service.set_estimate_listener(None)
+        with self.__lock:
+            self.__live.stop()
+
+    def get_renderable(self) -> Group:
+        return self.__root
+
+    def get_rebuild_counts(self) -> dict[str, int]:
+        return dict(self.__rebuilt)
+
+    def get_frame_times(self) -> list[float]:
+        return list(self.__frame_times)
+
+    def get_frame_budget(self) -> float:
+        return self.__frame_budget
+
+    def is_within_budget(self) -> bool:
+        return all(frame_time <= self.__frame_budget for frame_time in self.__frame_times)
+
+    def format_frame_stats(self) -> str:
+        if not self.__frame_times:
+            return "No frames rendered."
+        times = sorted(self.__frame_times)
+        median = times[len(times) // 2]
+        return (
+            f"Frames: {len(times)}, median {median * 1000:.2f} ms, "
+            f"max {times[-1] * 1000:.2f} ms (budget {self.__frame_budget * 1000:.0f} ms)"
+        )
+
+    def set_message(self, message: str | None) -> None:
+        text = Text.from_markup(message) if message else Text()
+        self.__message.plain = text.plain
+        self.__message.spans = text.spans
+
+    def update(self, refresh: bool = True) -> list[str]:
+        started = time.perf_counter()
+        service = self.__service
+        with self.__lock:
+            if self.__version is not None and not service.has_changed_since(self.__version):
+                changed = []
+            else:
+                changed = self._apply_status()
+            self._apply_estimate(render_estimate(service))
+            metrics = service.get_metrics()
+            if metrics is not None:
+                metrics.increment("ui.frames")
+            if refresh:
+                self.__live.refresh()
+        self.__frame_times.append(time.perf_counter() - started)
+        return changed
+
+    def _apply_status(self) -> list[str]:
+        service = self.__service
+        self.__version = service.get_version()
+        status = service.get_status()
+        previous = self.__status
+        changed = [key for key, value in status.items() if previous.get(key) != value]
+
+        for key in changed:
+            meter = self.__meters.get(key)
+            if meter is not None:
+                meter.set(int(status[key]))
+        if "student_name" in changed:
+            self.__student_name.plain = f" {status['student_name']}"
+        if "theme_name" in changed:
+            self.__theme_name.plain = f" {status['theme_name']}"
+        if "today" in changed:
+            timeline_table = self._grid()
+            timeline_table.add_row(Timeline(int(status["today"]), service.get_calendar()))
+            self.__timeline_panel.renderable = timeline_table
+            self.__rebuilt["timeline"] += 1
+
+        actions = service.get_available_actions()
+        menu_key = (tuple(actions), service.can_undo(), service.can_redo())
+        if menu_key != self.__menu_key:
+            self.__actions_panel.renderable = render_actions(service, actions)
+            self.__menu_key = menu_key
+            self.__rebuilt["actions"] += 1
+
+        self.__status = status
+        self.__finished = service.is_finished()
+        return changed
+
+    def _apply_estimate(self, estimate: Text) -> None:
+        self.__estimate.plain = estimate.plain
+        self.__estimate.style = estimate.style
+        self.__estimate.spans = estimate.spans
+
+    def _estimate_ready(self, estimate: Estimate) -> None:
+        # Called on the estimator thread, so only the cached version is used.
+        with self.__lock:
+            if self.__version is None or self.__finished:
+                return
+            self._apply_estimate(format_estimate(estimate, self.__version))
+            if not self.__prompting:
+                self.__live.refresh()
+            elif self.__console.is_terminal:
+                # The cursor is on the prompt line under the live area: redraw
+                # from the line above and put it back where the user types.
+                self.__console.file.write("\x1b7")
+                self.__console.control(Control.move(0, -1))
+                self.__live.refresh()
+                self.__console.file.write("\x1b8")
+                self.__console.file.flush()
+
+    def choose_action(self) -> str:
+        status = self.__service.get_status()
+        prompt = (
+            "["
+            + Style(italic=True).render(f"({status['today']}/{status['max_days']}), {status['stage']}")
+            + "]"
+            + Style(bold=True).render("> ")
+        )
+        while True:
+            # The prompt goes on its own line under the live area and is wiped
+            # afterwards, so the cursor is back where Live expects it.
+            with self.__lock:
+                self.__prompting = True
+            try:
+                raw = input("\n" + prompt).strip()
+            finally:
+                with self.__lock:
+                    self.__prompting = False
+                    self.__console.control(
+                        Control.move(0, -1),
+                        Control((ControlType.ERASE_IN_LINE, 2)),
+                        Control.move(0, -1),
+                    )
+            action_code, message = resolve_choice(self.__service, raw)
+            with self.__lock:
+                self.set_message(message)
+                if action_code is not None:
+                    return action_code
+                self._apply_estimate(render_estimate(self.__service))
+                self.__live.refresh()
+
+    @staticmethod
+    def _grid() -> Table:
+        table = Table.grid(expand=True)
+        table.add_column(no_wrap=True)
+        table.add_column(ratio=1)
+        return table
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable
+from typing import TextIO
+
+from application import SessionService
+
+EMIT_MODES: tuple[str, ...] = ("steps", "final")
+
+
+def run_actions(
+    service: SessionService,
+    actions: Iterable[str],
+    output: TextIO,
+    emit: str = "steps",
+    scenario: int = 0,
+) -> bool:
+    if emit not in EMIT_MODES:
+        raise ValueError(f"Unknown emit mode: {emit}.")
+
+    steps = 0
+    error: str | None = None
+    for raw in actions:
+        action_code = raw.strip()
+        if not action_code or action_code.startswith("#"):
+            continue
+        try:
+            service.perform_action(action_code)
+        except ValueError:
+            error = f"Action {action_code!r} is not available on day {service.get_status()['today']}."
+            break
+        steps += 1
+        if emit == "steps":
+            _write(output, {
+                "scenario": scenario,
+                "step": steps,
+                "action": action_code,
+                "status": dict(service.get_status()),
+            })
+
+    record = {
+        "scenario": scenario,
+        "steps": steps,
+        "finished": service.is_finished(),
+        "status": dict(service.get_status()),
+    }
+    if error is not None:
+        record["error"] = error
+    _write(output, record)
+    output.flush()
+    return error is None
+
+
+def run_script(
+    service: SessionService,
+    lines: Iterable[str],
+    output: TextIO,
+    emit: str = "steps",
+    slot: int = 1,
+) -> int:
+    if emit not in EMIT_MODES:
+        raise ValueError(f"Unknown emit mode: {emit}.")
+
+    failed = 0
+    for scenario, line in enumerate(lines, start=1):
+        if not line.strip() or line.lstrip().startswith("#"):
+            continue
+        try:
+            spec = json.loads(line)
+            if not isinstance(spec, dict):
+                raise ValueError("Scenario must be a JSON object.")
+            actions = spec.get("actions", [])
+            if not isinstance(actions, list) or not all(isinstance(action, str) for action in actions):
+                raise ValueError("Scenario actions must be a list of action codes.")
+            seed = spec.get("seed")
+            if seed is not None and not isinstance(seed, int):
+                raise ValueError("Seed must be an integer.")
+            service.start_new(
+                slot=int(spec.get("slot", slot)),
+                student_name=str(spec.get("name", "Anonymous Student")),
+                student_intelligence=int(spec.get("intelligence", 2)),
+                seed=seed,
+            )
+        except (ValueError, TypeError) as error:
+            _write(output, {"scenario": scenario, "error": str(error)})
+            failed += 1
+            continue
+        if not run_actions(service, actions, output, emit=emit, scenario=scenario):
+            failed += 1
+    service.close()
+    return failed
+
+
+def _write(output: TextIO, record: dict[str, object]) -> None:
+    output.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from pathlib import Path
+
+from application import FileSlotStorage, SessionService, SlotStorage
+
+
+class _Session:
+    __slots__ = ("service", "lock", "last_used")
+
+    def __init__(self, service: SessionService):
+        self.service: SessionService = service
+        self.lock: asyncio.Lock = asyncio.Lock()
+        self.last_used: float = time.monotonic()
+
+
+class SessionServer:
+    DEFAULT_IDLE_TIMEOUT: float = 300.0
+    DEFAULT_BACKLOG: int = 2048
+    COMMANDS: tuple[str, ...] = ("start", "load", "actions", "perform", "status")
+
+    def __init__(
+        self,
+        saves_dir: str | Path,
+        storage: SlotStorage | None = None,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+    ):
+        if idle_timeout <= 0:
+            raise ValueError("Idle timeout must be positive.")
+
+        self.__saves_dir = Path(saves_dir)
+        self.__storage: SlotStorage = (
+            storage if storage is not None else FileSlotStorage(self.__saves_dir)
+        )
+        self.__idle_timeout: float = idle_timeout
+        self.__sessions: dict[int, _Session] = {}
+        self.__server: asyncio.Server | None = None
+        self.__evictor: asyncio.Task | None = None
+
+    async def start(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        unix_path: str | Path | None = None,
+        backlog: int = DEFAULT_BACKLOG,
+    ) -> None:
+        if self.__server is not None:
+            raise RuntimeError("Server is already running.")
+        if unix_path is not None:
+            self.__server = await asyncio.start_unix_server(
+                self._handle_client, path=str(unix_path), backlog=backlog)
+        else:
+            self.__server = await asyncio.start_server(
+                self._handle_client, host=host, port=port, backlog=backlog)
+        self.__evictor = asyncio.create_task(self._evict_idle_sessions())
+
+    def get_address(self) -> object:
+        if self.__server is None:
+            raise RuntimeError("Server is not running.")
+        return self.__server.sockets[0].getsockname()
+
+    def get_session_count(self) -> int:
+        return len(self.__sessions)
+
+    async def serve_forever(self) -> None:
+        if self.__server is None:
+            raise RuntimeError("Server is not running.")
+        await self.__server.serve_forever()
+
+    async def close(self) -> None:
+        if self.__evictor is not None:
+            self.__evictor.cancel()
+            self.__evictor = None
+        if self.__server is not None:
+            self.__server.close()
+            await self.__server.wait_closed()
+            self.__server = None
+        for slot in list(self.__sessions):
+            await self._evict(slot)
+        await asyncio.to_thread(self.__storage.close)
+
+    async def handle_request(self, request: dict[str, object]) -> dict[str, object]:
+        command = request.get("cmd")
+        if command not in self.COMMANDS:
+            raise ValueError(f"Unknown command: {command}.")
+        slot = request.get("slot")
+        if not isinstance(slot, int):
+            raise ValueError("Request must contain an integer slot.")
+
+        if command == "start":
+            student_name = str(request.get("name", "Anonymous Student"))
+            student_intelligence = int(request.get("intelligence", 2))
+            seed = request.get("seed")
+            if seed is not None and not isinstance(seed, int):
+                raise ValueError("Seed must be an integer.")
+
+        while True:
+            session = await self._session(slot, create=command == "start")
+            async with session.lock:
+                # The session may have been evicted while this request waited.
+                if self.__sessions.get(slot) is not session:
+                    continue
+                service = session.service
+                if command == "start":
+                    try:
+                        await asyncio.to_thread(
+                            service.start_new,
+                            slot=slot,
+                            student_name=student_name,
+                            student_intelligence=student_intelligence,
+                            seed=seed,
+                        )
+                    except Exception:
+                        # Drop the session rather than cache one without a
+                        # process; the next request loads the slot's last save.
+                        del self.__sessions[slot]
+                        await asyncio.to_thread(service.close)
+                        raise
+                elif command == "actions":
+                    return {"actions": service.get_available_actions()}
+                elif command == "perform":
+                    service.perform_action(str(request.get("action")))
+                return {"status": dict(service.get_status())}
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while line := await reader.readline():
+                request: object = {}
+                try:
+                    request = json.loads(line)
+                    if not isinstance(request, dict):
+                        raise ValueError("Request must be a JSON object.")
+                    response = {"ok": True, **await self.handle_request(request)}
+                except (ValueError, TypeError, RuntimeError, FileNotFoundError) as error:
+                    response = {"ok": False, "error": str(error)}
+                if isinstance(request, dict) and "id" in request:
+                    response["id"] = request["id"]
+                writer.write(json.dumps(response, ensure_ascii=False).encode("utf-8") + b"\n")
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _session(self, slot: int, create: bool) -> _Session:
+        session = self.__sessions.get(slot)
+        if session is None:
+            session = _Session(SessionService(self.__saves_dir, storage=self.__storage, autosave=False))
+            self.__sessions[slot] = session
+            if not create:
+                async with session.lock:
+                    try:
+                        await asyncio.to_thread(session.service.load, slot)
+                    except Exception:
+                        del self.__sessions[slot]
+                        raise
+        session.last_used = time.monotonic()
+        return session
+
+    async def _evict(self, slot: int) -> None:
+        session = self.__sessions.get(slot)
+        if session is None:
+            return
+        async with session.lock:
+            if self.__sessions.get(slot) is session:
+                del self.__sessions[slot]
+                await asyncio.to_thread(session.service.close)
+
+    async def _evict_idle_sessions(self) -> None:
+        while True:
+            await asyncio.sleep(self.__idle_timeout / 2)
+            deadline = time.monotonic() - self.__idle_timeout
+            for slot, session in list(self.__sessions.items()):
+                if session.last_used < deadline and not session.lock.locked():
+                    await self._evict(slot)
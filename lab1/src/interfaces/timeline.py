@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import io
+from functools import lru_cache
+
+from domain import DefenseCalendar, DefenseStage
+
+from rich.columns import Columns
+from rich.console import Console, ConsoleOptions, RenderResult
+from rich.progress_bar import ProgressBar
+from rich.segment import Segment
+from rich.text import Text
+
+PHASE_ICONS: dict[DefenseStage, str] = {
+    DefenseStage.PREPARATION: "󰷈",
+    DefenseStage.REVISION: "󰃯",
+    DefenseStage.REHEARSAL: "󱆿",
+    DefenseStage.DEFENSE: "󰞀",
+}
+
+
+class Timeline:
+    # Every day at two terminal widths fits, e.g. the dashboard and a resize.
+    CACHE_SIZE: int = (DefenseCalendar.MAX_DAY + 1) * 2
+
+    def __init__(self, today: int, calendar: type[DefenseCalendar] = DefenseCalendar):
+        if not 0 <= today <= calendar.MAX_DAY:
+            raise ValueError(f"Day must be in range 0..{calendar.MAX_DAY}.")
+        self.__today: int = today
+        self.__calendar: type[DefenseCalendar] = calendar
+
+    def get_today(self) -> int:
+        return self.__today
+
+    @staticmethod
+    def build(today: int, calendar: type[DefenseCalendar] = DefenseCalendar) -> Columns:
+        segments = []
+        for phase in calendar.get_phases():
+            length = phase.end - phase.start
+            half = length / 2
+            middle = phase.start + half
+            width = length + 1 if length > 2 else 2
+
+            segments.append(_timeline_bar(half, today - phase.start, width))
+            segments.append(
+                Text(PHASE_ICONS[phase.stage], style=f"{'green' if today > middle else 'grey23'}"))
+            segments.append(_timeline_bar(half, today - middle, width))
+            segments.append(Text(">"))
+
+        segments.append(_timeline_bar(1, today - (calendar.MAX_DAY - 1), 2))
+        return Columns(segments)
+
+    @staticmethod
+    def cache_info() -> object:
+        return _render_lines.cache_info()
+
+    @staticmethod
+    def clear_cache() -> None:
+        _render_lines.cache_clear()
+
+    def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
+        new_line = Segment.line()
+        lines = _render_lines(
+            self.__today, self.__calendar, options.max_width, options.encoding, console.color_system,
+            console.no_color)
+        for line in lines:
+            yield from line
+            yield new_line
+
+
+@lru_cache(maxsize=Timeline.CACHE_SIZE)
+def _render_lines(
+    today: int,
+    calendar: type[DefenseCalendar],
+    width: int,
+    encoding: str,
+    color_system: str | None,
+    no_color: bool,
+) -> tuple[tuple[Segment, ...], ...]:
+    # Segments carry styles rather than escape codes, so lines rendered once
+    # can be replayed on any console with the same width, encoding and colours.
+    console = Console(
+        file=io.StringIO(),
+        width=width,
+        color_system=color_system,
+        no_color=no_color,
+        legacy_windows=False,
+    )
+    options = console.options
+    options.encoding = encoding
+    lines = console.render_lines(Timeline.build(today, calendar), options, pad=False)
+    return tuple(tuple(line) for line in lines)
+
+
+def _timeline_bar(total: float, completed: float, width: int) -> ProgressBar:
+    return ProgressBar(
+        total=total,
+        completed=completed,
+        width=width,
+        complete_style="green",
+        finished_style="green",
+    )
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from application import POLICIES, ParameterSweep
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Diploma defense parameter sweep (CSV output, resumable)")
+    parser.add_argument("--output", type=Path, default=Path("sweep.csv"), help="CSV file to append results to")
+    parser.add_argument("--seeds", type=int, default=100, help="Sessions per parameter point")
+    parser.add_argument("--seed-start", type=int, default=0, help="First seed of every point")
+    parser.add_argument("--intelligence", type=int, nargs="+", default=[1, 2, 3], help="Student intelligence values")
+    parser.add_argument(
+        "--supervisor-intelligence", type=int, nargs="+", default=[1, 2, 3], help="Supervisor intelligence values")
+    parser.add_argument("--supervisor-loyalty", type=int, nargs="+", default=[1, 2, 3], help="Supervisor loyalty values")
+    parser.add_argument("--commission-loyalty", type=int, nargs="+", default=[1, 2, 3], help="Commission loyalty values")
+    parser.add_argument("--theme-complexity", type=int, nargs="+", default=[1, 2, 3], help="Theme complexity values")
+    parser.add_argument("--stamina", type=int, nargs="+", default=[80], help="Starting student stamina values")
+    parser.add_argument("--quality", type=int, nargs="+", default=[90], help="Starting project quality values")
+    parser.add_argument("--policies", nargs="+", choices=sorted(POLICIES), default=sorted(POLICIES), help="Policies")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--restart", action="store_true", help="Discard existing results instead of resuming")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    if args.seeds < 1:
+        sys.exit("--seeds must be >= 1.")
+    try:
+        sweep = ParameterSweep(
+            seeds=range(args.seed_start, args.seed_start + args.seeds),
+            student_intelligence=args.intelligence,
+            supervisor_intelligence=args.supervisor_intelligence,
+            supervisor_loyalty=args.supervisor_loyalty,
+            commission_loyalty=args.commission_loyalty,
+            theme_complexity=args.theme_complexity,
+            student_stamina=args.stamina,
+            project_quality=args.quality,
+            policies=args.policies,
+            max_workers=args.workers,
+        )
+        written = sweep.run(args.output, resume=not args.restart)
+    except ValueError as error:
+        sys.exit(str(error))
+    except KeyboardInterrupt:
+        sys.exit(f"Interrupted; run again to resume {args.output}.")
+    print(f"{written} new points, {sweep.count()} total -> {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from application import MctsAdvisor, SessionService
+
+
+class MctsAdvisorTests(unittest.TestCase):
+    def test_advise_returns_available_action_without_mutating_process(self) -> None:
+        process = SessionService.create_process("Alice", 2, seed=3)
+        before = process.snapshot()
+
+        advisor = MctsAdvisor(seed=1)
+        advice = advisor.advise(process, max_iterations=200)
+
+        self.assertEqual(advisor.get_root_visits(), 200)
+        self.assertIn(advice.get_action(), process.get_available_actions())
+        self.assertEqual(process.snapshot(), before)
+        self.assertGreater(advice.get_visits(), 0)
+        self.assertGreaterEqual(advice.get_defense_probability(), 0.0)
+        self.assertLessEqual(advice.get_defense_probability(), 1.0)
+
+    def test_zero_time_budget_only_tries_each_action_once(self) -> None:
+        process = SessionService.create_process("Alice", 2, seed=3)
+
+        # A generous default must not replace an explicit zero budget.
+        advisor = MctsAdvisor(time_budget=60, seed=1)
+        advisor.advise(process, time_budget=0)
+
+        self.assertEqual(advisor.get_root_visits(), len(process.get_available_actions()))
+
+    def test_advance_reuses_subtree(self) -> None:
+        process = SessionService.create_process("Alice", 2, seed=3)
+        advisor = MctsAdvisor(seed=1)
+        advice = advisor.advise(process, max_iterations=300)
+        reused = advice.get_visits()
+
+        process.perform_action(advice.get_action())
+        advisor.advance(advice.get_action())
+
+        self.assertEqual(advisor.get_root_visits(), reused)
+        advisor.advise(process, max_iterations=10)
+        self.assertGreater(advisor.get_root_visits(), reused)
+
+    def test_advise_rebuilds_tree_for_unrelated_state(self) -> None:
+        advisor = MctsAdvisor(seed=1)
+        advisor.advise(SessionService.create_process("Alice", 2, seed=3), max_iterations=50)
+
+        advisor.advise(SessionService.create_process("Bob", 3, seed=4), max_iterations=5)
+
+        self.assertLess(advisor.get_root_visits(), 50)
+
+    def test_advise_rejects_finished_session(self) -> None:
+        process = SessionService.create_process("Alice", 2, seed=3)
+        while not process.is_finished():
+            process.perform_action(process.get_available_actions()[0])
+
+        with self.assertRaises(ValueError):
+            MctsAdvisor().advise(process)
+
+    def test_following_hints_passes_defense(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            service = SessionService(tmp_dir)
+            service.start_new(slot=1, student_name="Alice", student_intelligence=2, seed=11)
+            while not service.is_finished():
+                service.perform_action(service.get_hint(max_iterations=200).get_action())
+
+            self.assertTrue(service.get_status()["defense_passed"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import sys
+import unittest
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from application import BatchSimulator, first_action_policy, greedy_policy
+
+
+def invalid_policy(process, rng) -> str:
+    return "defense"
+
+
+class BatchSimulatorTests(unittest.TestCase):
+    def test_play_session_runs_until_finished(self) -> None:
+        record = BatchSimulator.play_session(
+            seed=7,
+            student_name="Alice",
+            student_intelligence=2,
+            policy=greedy_policy,
+        )
+
+        self.assertEqual(record["stage"], "Finished")
+        self.assertEqual(record["seed"], 7)
+        self.assertGreater(record["steps"], 0)
+
+    def test_run_returns_records_in_seed_order(self) -> None:
+        simulator = BatchSimulator(max_workers=1, chunk_size=3)
+
+        records = simulator.run(range(10))
+
+        self.assertEqual([record["seed"] for record in records], list(range(10)))
+
+    def test_process_pool_matches_inline_run(self) -> None:
+        seeds = list(range(20))
+        inline = BatchSimulator(policy=first_action_policy, max_workers=1).run(seeds)
+        pooled = BatchSimulator(
+            policy=first_action_policy,
+            max_workers=2,
+            chunk_size=4,
+        ).run(seeds)
+
+        self.assertEqual(pooled, inline)
+
+    def test_invalid_policy_action_raises(self) -> None:
+        simulator = BatchSimulator(policy=invalid_policy, max_workers=1)
+        with self.assertRaises(ValueError):
+            simulator.run([1])
+
+    def test_rejects_non_positive_chunk_size(self) -> None:
+        with self.assertRaises(ValueError):
+            BatchSimulator(chunk_size=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import io
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from application import SessionService
+from interfaces.dashboard import LiveDashboard
+
+from rich.console import Console
+
+
+class LiveDashboardTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.service = SessionService(Path(self._tmp.name))
+        self.service.start_new(slot=1, student_name="Alice", student_intelligence=2, seed=123)
+        self.output = io.StringIO()
+        self.console = Console(file=self.output, force_terminal=True, width=120, height=60)
+        self.dashboard = LiveDashboard(self.service, self.console)
+
+    def tearDown(self) -> None:
+        self.service.close()
+        self._tmp.cleanup()
+
+    def render(self) -> str:
+        with self.console.capture() as capture:
+            self.console.print(self.dashboard.get_renderable())
+        return capture.get()
+
+    def test_first_update_fills_every_widget(self) -> None:
+        changed = self.dashboard.update(refresh=False)
+
+        self.assertIn("stamina", changed)
+        self.assertIn("today", changed)
+        screen = self.render()
+        self.assertIn("Alice", screen)
+        self.assertIn(f" {self.service.get_status()['stamina']}/100 ", screen)
+
+    def test_only_changed_widgets_are_rebuilt(self) -> None:
+        self.dashboard.update(refresh=False)
+        widgets_before = self.render()
+
+        self.assertEqual(self.dashboard.update(refresh=False), [])
+        self.assertEqual(self.dashboard.get_rebuild_counts(), {"timeline": 1, "actions": 1})
+        self.assertEqual(self.render(), widgets_before)
+
+        self.service.perform_action("work_thesis")
+        changed = self.dashboard.update(refresh=False)
+
+        self.assertIn("today", changed)
+        self.assertIn("thesis_completion", changed)
+        self.assertNotIn("student_name", changed)
+        # The undo row appears, so the action menu is rebuilt along with the timeline.
+        self.assertEqual(self.dashboard.get_rebuild_counts(), {"timeline": 2, "actions": 2})
+        self.assertIn("Undo", self.render())
+
+    def test_message_line_is_updated_in_place(self) -> None:
+        self.dashboard.update(refresh=False)
+
+        self.dashboard.set_message("No such option. Try again.")
+        self.assertIn("No such option", self.render())
+
+        self.dashboard.set_message(None)
+        self.assertNotIn("No such option", self.render())
+
+    def test_frame_times_are_recorded(self) -> None:
+        with self.dashboard:
+            self.service.perform_action("work_thesis")
+            self.dashboard.update()
+
+        frame_times = self.dashboard.get_frame_times()
+        self.assertEqual(len(frame_times), 2)
+        self.assertTrue(all(frame_time >= 0 for frame_time in frame_times))
+        self.assertIn("Frames: 2", self.dashboard.format_frame_stats())
+        self.assertIn("Alice", self.output.getvalue())
+
+    def test_estimate_line_shows_last_finished_estimate(self) -> None:
+        self.dashboard.update(refresh=False)
+        self.assertNotIn("Defense chance", self.render())
+
+        service = SessionService(Path(self._tmp.name), estimate=True)
+        service.start_new(slot=2, student_name="Bob", student_intelligence=2, seed=1)
+        dashboard = LiveDashboard(service, self.console)
+        try:
+            # The first frame only queues the rollouts and must not wait for them.
+            dashboard.update(refresh=False)
+            deadline = time.monotonic() + 30
+            while service.get_estimate() is None and time.monotonic() < deadline:
+                time.sleep(0.01)
+            dashboard.update(refresh=False)
+            with self.console.capture() as capture:
+                self.console.print(dashboard.get_renderable())
+        finally:
+            service.close()
+
+        self.assertIn("Defense chance", capture.get())
+
+    def test_finished_estimate_is_drawn_without_another_update(self) -> None:
+        service = SessionService(Path(self._tmp.name), estimate=True)
+        service.start_new(slot=2, student_name="Bob", student_intelligence=2, seed=1)
+        try:
+            with LiveDashboard(service, self.console) as dashboard:
+                deadline = time.monotonic() + 30
+                while "Defense chance" not in self.output.getvalue() and time.monotonic() < deadline:
+                    time.sleep(0.01)
+                frames = len(dashboard.get_frame_times())
+        finally:
+            service.close()
+
+        self.assertIn("Defense chance", self.output.getvalue())
+        self.assertEqual(frames, 1)
+
+    def test_frame_budget_must_be_positive(self) -> None:
+        with self.assertRaises(ValueError):
+            LiveDashboard(self.service, self.console, frame_budget=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import sys
+import unittest
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from domain import DefenseCalendar, DefenseStage
+
+
+def chained_rules(
+    today: int,
+    stage: DefenseStage,
+    revision_passed: list[bool],
+    defense_passed: bool,
+) -> DefenseStage:
+    if today in (5, 11, 16):
+        stage = DefenseStage.REVISION
+    if today in (6, 7, 12, 13) and revision_passed[today // 8]:
+        stage = DefenseStage.PREPARATION
+    if today in (17, 18) and revision_passed[2]:
+        stage = DefenseStage.REHEARSAL
+    if today in (7, 13, 18) and not revision_passed[today // 8]:
+        stage = DefenseStage.FINISHED
+    if today in (24, 23):
+        stage = DefenseStage.DEFENSE
+    if stage == DefenseStage.ATTESTATION:
+        stage = DefenseStage.FINISHED
+    elif today == 25 or defense_passed:
+        stage = DefenseStage.ATTESTATION
+    return stage
+
+
+class DefenseCalendarTests(unittest.TestCase):
+    def test_table_matches_chained_day_rules(self) -> None:
+        for today in range(DefenseCalendar.MAX_DAY + 1):
+            for stage in DefenseStage:
+                for mask in range(DefenseCalendar.REVISION_MASKS):
+                    revision = [bool(mask >> idx & 1) for idx in range(3)]
+                    for defense_passed in (False, True):
+                        with self.subTest(today=today, stage=stage, mask=mask, passed=defense_passed):
+                            self.assertEqual(
+                                DefenseCalendar.next_stage(today, stage, revision, defense_passed),
+                                chained_rules(today, stage, revision, defense_passed),
+                            )
+
+    def test_phases_cover_the_whole_calendar(self) -> None:
+        phases = DefenseCalendar.get_phases()
+
+        self.assertEqual(phases[0].start, 0)
+        self.assertEqual(phases[-1].end, DefenseCalendar.MAX_DAY)
+        for previous, current in zip(phases, phases[1:]):
+            self.assertEqual(previous.end, current.start)
+        self.assertEqual(
+            [phase.stage for phase in phases if phase.stage == DefenseStage.REVISION],
+            [DefenseStage.REVISION] * len(DefenseCalendar.REVISION_WINDOWS),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
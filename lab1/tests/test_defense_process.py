@@ -112,7 +112,7 @@ class DefenseProcessTests(unittest.TestCase):
         process.perform_action("submit_for_inspection")
         status = process.get_status()
 
-        self.assertEqual(status["revision_passed"], [True, True, True])
+        self.assertEqual(status["revision_passed"], (True, True, True))
         self.assertEqual(status["final_grade"], 3)
         self.assertEqual(status["score"], 15)
         self.assertEqual(status["stamina"], 73)
@@ -164,6 +164,58 @@ class DefenseProcessTests(unittest.TestCase):
 
         self.assertEqual(restored.to_dict(), serialized)
 
+    def test_fork_is_independent_copy(self) -> None:
+        process = make_process(diploma_pct=100, today=5, stage=DefenseStage.REVISION)
+        clone = process.fork()
+
+        clone.perform_action("submit_for_inspection")
+
+        self.assertEqual(process.get_status()["today"], 5)
+        self.assertEqual(process.get_status()["revision_passed"], (False, False, False))
+        self.assertEqual(clone.get_status()["revision_passed"], (True, True, True))
+        self.assertEqual(process.to_dict()["supervisor"], clone.to_dict()["supervisor"])
+
+    def test_restore_rewinds_to_snapshot(self) -> None:
+        process = make_process(diploma_pct=100, today=5, stage=DefenseStage.REVISION)
+        expected = process.to_dict()
+        token = process.snapshot()
+
+        process.perform_action("submit_for_inspection")
+        process.perform_action("work_thesis")
+        process.restore(token)
+
+        self.assertEqual(process.to_dict(), expected)
+        self.assertEqual(process.snapshot(), token)
+
+    def test_status_is_cached_until_the_process_changes(self) -> None:
+        process = make_process()
+        version = process.get_version()
+        status = process.get_status()
+
+        self.assertIs(process.get_status(), status)
+        self.assertFalse(process.has_changed_since(version))
+        with self.assertRaises(TypeError):
+            status["stamina"] = 0
+
+        token = process.snapshot()
+        process.perform_action("rest")
+
+        self.assertTrue(process.has_changed_since(version))
+        self.assertIsNot(process.get_status(), status)
+        self.assertEqual(process.get_status()["today"], 1)
+        self.assertEqual(status["today"], 0)
+
+        version = process.get_version()
+        process.restore(token)
+        self.assertTrue(process.has_changed_since(version))
+        self.assertEqual(process.get_status(), status)
+
+    def test_versions_differ_between_processes(self) -> None:
+        first = make_process()
+        second = make_process()
+
+        self.assertTrue(second.has_changed_since(first.get_version()))
+
 
 if __name__ == "__main__":
     unittest.main()
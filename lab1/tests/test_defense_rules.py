@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import random
+import sys
+import unittest
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from application import OptimalSolver, SessionService
+from domain import DefenseCalendar, DefenseProcess, DefenseRules, DefenseStage
+
+
+def solver_state(process: DefenseProcess) -> tuple:
+    snapshot = process.snapshot()
+    return (snapshot[0], DefenseCalendar.STAGES.index(snapshot[1])) + snapshot[2:11]
+
+
+def solver_params(process: DefenseProcess) -> tuple[int, int, bool]:
+    data = process.to_dict()
+    intelligence = data["student"]["intelligence"]
+    return (
+        intelligence,
+        DefenseRules.review_factor(data["supervisor"]["intelligence"], data["supervisor"]["loyalty"], intelligence),
+        DefenseRules.loyalty_penalty(data["commission"]["loyalty"], intelligence),
+    )
+
+
+class DefenseRulesTests(unittest.TestCase):
+    def test_every_stage_lists_known_actions(self) -> None:
+        self.assertEqual(set(DefenseRules.STAGE_ACTIONS), set(DefenseStage))
+        for actions in DefenseRules.STAGE_ACTIONS.values():
+            self.assertTrue(set(actions) <= set(DefenseRules.ACTIONS))
+
+    def test_labels_come_from_rules(self) -> None:
+        self.assertEqual(list(DefenseProcess.ACTION_LABELS), list(DefenseRules.ACTIONS))
+        self.assertEqual(DefenseProcess.ACTION_LABELS["rest"], DefenseRules.get_rule("rest").label)
+
+    def test_available_actions_follow_stage_table(self) -> None:
+        process = SessionService.create_process("Alice", 2, seed=1)
+        actions = process.get_available_actions()
+        actions.append("defense")
+
+        self.assertEqual(process.get_available_actions(), list(DefenseRules.get_actions(DefenseStage.PREPARATION)))
+        with self.assertRaises(ValueError):
+            process.perform_action("defense")
+
+    def test_work_gain_depends_on_efficiency(self) -> None:
+        rule = DefenseRules.get_rule("work_thesis")
+
+        self.assertEqual(DefenseRules.efficiency(2, 100), 0)
+        self.assertEqual(DefenseRules.efficiency(1, 39), -5)
+        self.assertEqual(rule.completion.delta(DefenseRules.efficiency(3, 100)), 24)
+
+    def test_solver_transitions_match_scalar_engine(self) -> None:
+        rng = random.Random(7)
+        for seed in range(20):
+            process = SessionService.create_process(f"Student {seed}", seed % 3 + 1, seed=seed)
+            params = solver_params(process)
+            while not process.is_finished():
+                action = rng.choice(process.get_available_actions())
+                grade, score = process.get_status()["final_grade"], process.get_status()["score"]
+                expected, grade_delta, score_delta, attested = OptimalSolver._apply(
+                    solver_state(process), params, action)
+
+                process.perform_action(action)
+
+                self.assertEqual(solver_state(process), expected)
+                self.assertEqual(process.get_status()["final_grade"], grade + grade_delta)
+                if attested:
+                    multiplier = DefenseRules.attestation_multiplier(params[0])
+                    score = (score + process.get_status()["final_grade"]
+                             * DefenseRules.ATTESTATION_GRADE_SCORE) * multiplier
+                    self.assertEqual(process.get_status()["score"], score)
+                else:
+                    self.assertEqual(process.get_status()["score"], score + score_delta)
+
+    def test_solver_rejects_unknown_action(self) -> None:
+        process = SessionService.create_process("Alice", 2, seed=1)
+
+        with self.assertRaises(ValueError):
+            OptimalSolver._apply(solver_state(process), solver_params(process), "sleep")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import sys
+import unittest
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from application import Histogram, Metrics
+
+
+class HistogramTests(unittest.TestCase):
+    def test_observations_fall_into_microsecond_buckets(self) -> None:
+        histogram = Histogram()
+        for seconds in (0.000_002, 0.000_003, 0.000_040, 0.002):
+            histogram.observe(seconds)
+
+        buckets = histogram.get_buckets()
+        self.assertEqual(buckets[5], 2)
+        self.assertEqual(buckets[50], 1)
+        self.assertEqual(buckets[5_000], 1)
+        self.assertEqual(histogram.get_count(), 4)
+        self.assertAlmostEqual(histogram.get_max_us(), 2000.0)
+        self.assertAlmostEqual(histogram.get_mean_us(), 511.25)
+
+    def test_quantile_bound_is_capped_by_max(self) -> None:
+        histogram = Histogram()
+        for _ in range(99):
+            histogram.observe(0.000_002)
+        histogram.observe(0.000_300)
+
+        self.assertEqual(histogram.quantile_bound_us(0.5), 5)
+        self.assertEqual(histogram.quantile_bound_us(0.99), 5)
+        self.assertAlmostEqual(histogram.quantile_bound_us(1.0), 300.0)
+        with self.assertRaises(ValueError):
+            histogram.quantile_bound_us(1.5)
+
+    def test_empty_histogram_reports_zero(self) -> None:
+        self.assertEqual(Histogram().quantile_bound_us(0.5), 0.0)
+        self.assertEqual(Histogram().get_mean_us(), 0.0)
+
+
+class MetricsTests(unittest.TestCase):
+    def test_snapshot_and_text_export(self) -> None:
+        metrics = Metrics()
+        metrics.increment("calls.get_status")
+        metrics.increment("calls.get_status", 2)
+        metrics.observe("action.rest", 0.000_010)
+
+        snapshot = metrics.snapshot()
+        self.assertEqual(snapshot["counters"], {"calls.get_status": 3})
+        self.assertEqual(snapshot["histograms"]["action.rest"]["count"], 1)
+
+        text = metrics.to_text().splitlines()
+        self.assertEqual(text[0], "counter calls.get_status 3")
+        self.assertTrue(text[1].startswith("histogram action.rest count=1 "))
+
+    def test_reset_clears_everything(self) -> None:
+        metrics = Metrics()
+        metrics.increment("calls.get_status")
+        metrics.observe("save.total", 0.001)
+        metrics.reset()
+
+        self.assertEqual(metrics.get_counter("calls.get_status"), 0)
+        self.assertIsNone(metrics.get_histogram("save.total"))
+        self.assertEqual(metrics.to_text(), "")
+
+
+if __name__ == "__main__":
+    unittest.main()
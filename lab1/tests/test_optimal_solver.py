@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import sys
+import unittest
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from application import OptimalSolver, SessionService
+from domain import DefenseProcess, DefenseStage
+
+
+def make_process(
+    *,
+    stamina: int = 80,
+    diploma_pct: int = 0,
+    diploma_quality: int = 90,
+    presentation_pct: int = 0,
+    today: int = 0,
+    stage: DefenseStage = DefenseStage.PREPARATION,
+    revision_passed: list[bool] | None = None,
+) -> DefenseProcess:
+    data = SessionService.create_process("Alice", 2, seed=42).to_dict()
+    data["student"]["stamina"] = stamina
+    data["diploma_project"]["pct_complition"] = diploma_pct
+    data["diploma_project"]["quality"] = diploma_quality
+    data["presentation"]["pct_complition"] = presentation_pct
+    data["today"] = today
+    data["stage"] = stage.name
+    data["revision_passed"] = revision_passed or [False, False, False]
+    return DefenseProcess.from_dict(data)
+
+
+def brute_force(data: dict[str, object]) -> tuple[bool, int, int]:
+    process = DefenseProcess.from_dict(data)
+    if process.is_finished():
+        status = process.get_status()
+        return bool(status["defense_passed"]), int(status["final_grade"]), int(status["score"])
+
+    best = None
+    for action in process.get_available_actions():
+        child = DefenseProcess.from_dict(data)
+        child.perform_action(action)
+        value = brute_force(child.to_dict())
+        if best is None or value > best:
+            best = value
+    return best
+
+
+class OptimalSolverTests(unittest.TestCase):
+    def _assert_optimal(self, process: DefenseProcess) -> None:
+        data = process.to_dict()
+        result = OptimalSolver().solve(data)
+
+        replay = DefenseProcess.from_dict(data)
+        for action in result.get_actions():
+            replay.perform_action(action)
+        status = replay.get_status()
+
+        self.assertTrue(replay.is_finished())
+        self.assertEqual(
+            (result.is_defense_passed(), result.get_final_grade(), result.get_score()),
+            (status["defense_passed"], status["final_grade"], status["score"]),
+        )
+        self.assertEqual(
+            (result.is_defense_passed(), result.get_final_grade(), result.get_score()),
+            brute_force(data),
+        )
+
+    def test_matches_brute_force_in_rehearsal(self) -> None:
+        self._assert_optimal(make_process(
+            stamina=55,
+            diploma_pct=100,
+            presentation_pct=10,
+            today=18,
+            stage=DefenseStage.REHEARSAL,
+        ))
+
+    def test_matches_brute_force_around_last_revision(self) -> None:
+        for pct in (60, 80, 100):
+            with self.subTest(pct=pct):
+                process = make_process(
+                    stamina=40,
+                    diploma_pct=pct,
+                    diploma_quality=95,
+                    today=16,
+                    stage=DefenseStage.REVISION,
+                    revision_passed=[True, True, False],
+                )
+                self._assert_optimal(process)
+
+    def test_matches_brute_force_with_repeated_attestation(self) -> None:
+        # An early defense stage lets attestation run more than once.
+        process = make_process(
+            stamina=90,
+            presentation_pct=60,
+            today=20,
+            stage=DefenseStage.DEFENSE,
+        )
+        self._assert_optimal(process)
+
+    def test_full_session_plan_is_replayable(self) -> None:
+        process = SessionService.create_process("Alice", 2, seed=5)
+        result = OptimalSolver().solve(process)
+
+        for action in result.get_actions():
+            process.perform_action(action)
+
+        self.assertTrue(process.is_finished())
+        self.assertTrue(result.is_defense_passed())
+        self.assertEqual(process.get_status()["final_grade"], result.get_final_grade())
+        self.assertEqual(process.get_status()["score"], result.get_score())
+
+    def test_solving_finished_session_returns_empty_plan(self) -> None:
+        result = OptimalSolver().solve(make_process(stage=DefenseStage.FINISHED))
+
+        self.assertEqual(result.get_actions(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import csv
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from application import ParameterSweep
+
+
+def small_sweep(max_workers: int = 1, seeds: range = range(3)) -> ParameterSweep:
+    return ParameterSweep(
+        seeds=seeds,
+        student_intelligence=(1, 3),
+        supervisor_intelligence=(2,),
+        supervisor_loyalty=(1, 3),
+        commission_loyalty=(2,),
+        theme_complexity=(1,),
+        policies=("greedy",),
+        max_workers=max_workers,
+    )
+
+
+class ParameterSweepTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.output = Path(self._tmp.name) / "sweep.csv"
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def read_rows(self) -> list[list[str]]:
+        with self.output.open(encoding="utf-8", newline="") as file:
+            return list(csv.reader(file))
+
+    def test_run_writes_one_row_per_point(self) -> None:
+        sweep = small_sweep()
+
+        self.assertEqual(sweep.run(self.output), 4)
+        rows = self.read_rows()
+        self.assertEqual(tuple(rows[0]), ParameterSweep.COLUMNS)
+        self.assertEqual(len(rows), 5)
+        self.assertEqual([row[:2] for row in rows[1:]], [["1", "2"], ["1", "2"], ["3", "2"], ["3", "2"]])
+        self.assertTrue(all(row[8:11] == ["3", "0", "2"] for row in rows[1:]))
+
+    def test_resume_skips_finished_points(self) -> None:
+        sweep = small_sweep()
+        sweep.run(self.output)
+        before = self.output.read_bytes()
+
+        self.assertEqual(sweep.run(self.output), 0)
+        self.assertEqual(self.output.read_bytes(), before)
+
+        # Simulate a run killed in the middle of writing the last row.
+        lines = before.splitlines(keepends=True)
+        self.output.write_bytes(b"".join(lines[:3]) + lines[3][:7])
+        self.assertEqual(sweep.run(self.output), 2)
+        self.assertEqual(self.output.read_bytes(), before)
+
+        self.assertEqual(sweep.run(self.output, resume=False), 4)
+        self.assertEqual(self.output.read_bytes(), before)
+
+    def test_process_pool_matches_inline_run(self) -> None:
+        small_sweep().run(self.output)
+        inline = self.read_rows()
+        small_sweep(max_workers=2).run(self.output, resume=False)
+
+        self.assertEqual(self.read_rows(), inline)
+
+    def test_resume_rejects_incompatible_files(self) -> None:
+        small_sweep().run(self.output)
+        with self.assertRaises(ValueError):
+            small_sweep(seeds=range(5)).run(self.output)
+        # Same seed count, different seeds: the rows would mix two samples.
+        with self.assertRaises(ValueError):
+            small_sweep(seeds=range(100, 103)).run(self.output)
+
+        self.output.write_text("a,b\n", encoding="utf-8")
+        with self.assertRaises(ValueError):
+            small_sweep().run(self.output)
+
+    def test_invalid_grid_is_rejected(self) -> None:
+        cases = [
+            {"seeds": ()},
+            {"seeds": (1,), "student_intelligence": (4,)},
+            {"seeds": (1,), "supervisor_loyalty": ()},
+            {"seeds": (1,), "commission_loyalty": (0,)},
+            {"seeds": (1,), "theme_complexity": (5,)},
+            {"seeds": (1,), "student_stamina": (120,)},
+            {"seeds": (1,), "policies": ("telepathy",)},
+        ]
+        for kwargs in cases:
+            with self.subTest(kwargs=kwargs), self.assertRaises(ValueError):
+                ParameterSweep(**kwargs)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import random
+import sys
+import unittest
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from application import SAVE_CODECS, BinarySaveCodec, ReplaySaveCodec, SessionService
+
+
+def make_payload(seed: object = 5, actions: int = 0) -> dict[str, object]:
+    process = SessionService.create_process("Алиса", 3, seed=5)
+    for _ in range(actions):
+        if process.is_finished():
+            break
+        process.perform_action(process.get_available_actions()[-1])
+    data = process.to_dict()
+    data["seed"] = seed
+    data["revision_passed"] = list(data["revision_passed"])
+    return {"slot": 7, "process": data}
+
+
+class SaveCodecTests(unittest.TestCase):
+    def test_snapshot_codecs_round_trip_payload(self) -> None:
+        for seed in (5, None, -(2 ** 40), 2 ** 70, -(2 ** 63) - 1, "(3, (1, 2, 3), None)"):
+            for actions in (0, 12, 30):
+                payload = make_payload(seed, actions)
+                for codec in (SAVE_CODECS["json"], SAVE_CODECS["binary"]):
+                    with self.subTest(codec=codec.NAME, seed=seed, actions=actions):
+                        self.assertEqual(codec.decode(codec.encode(payload)), payload)
+
+    def test_binary_is_smaller_than_json(self) -> None:
+        payload = make_payload()
+
+        binary = SAVE_CODECS["binary"].encode(payload)
+        text = SAVE_CODECS["json"].encode(payload)
+
+        self.assertLess(len(binary), len(text) // 4)
+
+    def test_binary_rejects_corruption(self) -> None:
+        codec = BinarySaveCodec()
+        data = bytearray(codec.encode(make_payload()))
+
+        flipped = bytearray(data)
+        flipped[-1] ^= 0xFF
+        wrong_magic = b"XXXX" + bytes(data[4:])
+        wrong_version = bytes(data[:4]) + b"\x63\x00" + bytes(data[6:])
+
+        for corrupted in (bytes(flipped), wrong_magic, wrong_version, bytes(data[:20])):
+            with self.assertRaises(ValueError):
+                codec.decode(corrupted)
+
+
+def make_replay_payload(actions: int) -> dict[str, object]:
+    process = SessionService.create_process("Алиса", 2, seed=9)
+    history = []
+    rng = random.Random(actions)
+    for _ in range(actions):
+        if process.is_finished():
+            break
+        action = rng.choice(process.get_available_actions())
+        process.perform_action(action)
+        history.append(action)
+    replay = {"seed": 9, "student_name": "Алиса", "student_intelligence": 2, "actions": history}
+    return {"slot": 4, "process": process.to_dict(), "replay": replay}
+
+
+class ReplaySaveCodecTests(unittest.TestCase):
+    def test_round_trips_with_and_without_checkpoints(self) -> None:
+        for interval in (0, 1, 5, 8):
+            for actions in (0, 7, 30):
+                payload = make_replay_payload(actions)
+                codec = ReplaySaveCodec(checkpoint_interval=interval)
+                with self.subTest(interval=interval, actions=actions):
+                    decoded = codec.decode(codec.encode(payload))
+                    decoded["process"]["revision_passed"] = list(decoded["process"]["revision_passed"])
+                    payload["process"]["revision_passed"] = list(payload["process"]["revision_passed"])
+                    self.assertEqual(decoded, payload)
+
+    def test_replay_save_is_a_few_dozen_bytes(self) -> None:
+        data = ReplaySaveCodec(checkpoint_interval=0).encode(make_replay_payload(30))
+
+        self.assertLess(len(data), 48)
+
+    def test_encode_requires_history_and_integer_seed(self) -> None:
+        payload = make_replay_payload(3)
+        codec = ReplaySaveCodec()
+
+        with self.assertRaises(ValueError):
+            codec.encode({"slot": 1, "process": payload["process"]})
+        payload["replay"]["seed"] = None
+        with self.assertRaises(ValueError):
+            codec.encode(payload)
+        payload["replay"]["seed"] = 2 ** 70
+        with self.assertRaises(ValueError):
+            codec.encode(payload)
+
+    def test_verify_compares_replay_with_snapshot(self) -> None:
+        payload = make_replay_payload(30)
+        codec = ReplaySaveCodec(checkpoint_interval=4)
+        data = codec.encode(payload)
+        tampered = dict(payload["process"], score=payload["process"]["score"] + 1)
+
+        self.assertTrue(codec.verify(data))
+        self.assertTrue(codec.verify(data, payload["process"]))
+        self.assertFalse(codec.verify(data, tampered))
+        self.assertFalse(codec.verify(data[:-1] + bytes([data[-1] ^ 1])))
+
+
+if __name__ == "__main__":
+    unittest.main()
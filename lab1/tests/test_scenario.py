@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import json
+import random
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from application import SessionService, SqliteSlotStorage, load_scenario, parse_scenario, random_policy
+from domain import DefenseProcess, DefenseRules, Scenario
+
+EXAMPLE = Path(__file__).resolve().parents[1] / "scenarios" / "exam_week.toml"
+
+SHORT = {
+    "name": "short",
+    "student": {"stamina": 60},
+    "themes": [{"name": "Compilers", "complexity": 3}],
+    "supervisors": {"names": ["Dr. Orlova"], "intelligence": [2, 2], "loyalty": [3, 3]},
+    "calendar": {
+        "max_day": 20,
+        "defense_days": [18, 19],
+        "revision_windows": [
+            {"opens": 3, "closes": 5},
+            {"opens": 8, "closes": 10},
+            {"opens": 12, "closes": 14},
+        ],
+    },
+    "rules": {"attestation_multiplier": 5},
+    "actions": {"rest": {"stamina": 30, "score": 1}},
+}
+
+
+class ScenarioTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp_dir = Path(self._tmp.name)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def write(self, name: str, data: object) -> Path:
+        path = self.tmp_dir / name
+        path.write_text(json.dumps(data), encoding="utf-8")
+        return path
+
+    def test_scenario_parameterizes_new_sessions(self) -> None:
+        scenario = parse_scenario(SHORT)
+        process = SessionService.create_process("Alice", 2, seed=1, scenario=scenario)
+        status = process.get_status()
+
+        self.assertEqual(status["max_days"], 20)
+        self.assertEqual(status["stamina"], 60)
+        self.assertEqual(status["theme_name"], "Compilers")
+        self.assertEqual(process.to_dict()["supervisor"], {"name": "Dr. Orlova", "intelligence": 2, "loyalty": 3})
+
+        process.perform_action("rest")
+        self.assertEqual((process.get_status()["stamina"], process.get_status()["score"]), (90, 1))
+        self.assertEqual(scenario.get_rules().attestation_multiplier(2), 3)
+
+    def test_scenarios_coexist_with_builtin_rules(self) -> None:
+        custom = SessionService.create_process("Alice", 2, seed=1, scenario=parse_scenario(SHORT))
+        builtin = SessionService.create_process("Alice", 2, seed=1)
+        for _ in range(4):
+            custom.perform_action("rest")
+            builtin.perform_action("rest")
+
+        self.assertEqual(custom.get_status()["stage"], "Revision")
+        self.assertEqual(builtin.get_status()["stage"], "Preparation")
+        self.assertEqual(builtin.get_status()["score"], 36)
+        self.assertIs(builtin.get_scenario(), Scenario.default())
+        self.assertEqual(DefenseRules.get_rule("rest").score, 9)
+
+    def test_sessions_share_the_scenario_by_reference(self) -> None:
+        scenario = parse_scenario(SHORT)
+        first = SessionService.create_process("Alice", 2, seed=1, scenario=scenario)
+        second = SessionService.create_process("Bob", 3, seed=2, scenario=scenario)
+
+        self.assertIs(first.get_scenario(), second.get_scenario())
+        self.assertIs(first.get_calendar(), scenario.get_calendar())
+        self.assertIs(first.fork().get_scenario(), scenario)
+
+    def test_load_is_cached_until_file_changes(self) -> None:
+        path = self.write("short.json", SHORT)
+
+        first = load_scenario(path)
+        self.assertIs(load_scenario(str(path)), first)
+
+        self.write("short.json", dict(SHORT, student={"stamina": 5}))
+        reloaded = load_scenario(path)
+        self.assertIsNot(reloaded, first)
+        self.assertEqual(reloaded.get_student_stamina(), 5)
+
+    def test_example_scenario_loads(self) -> None:
+        scenario = load_scenario(EXAMPLE)
+
+        self.assertEqual(scenario.get_name(), "exam_week")
+        self.assertEqual(scenario.get_calendar().MAX_DAY, 22)
+        self.assertEqual(scenario.get_rules().get_rule("work_thesis").completion.base, 24)
+
+    def test_sessions_with_late_defense_days_finish(self) -> None:
+        scenario = parse_scenario({"name": "late", "calendar": {"max_day": 22, "defense_days": [20, 21]}})
+        for seed in range(200):
+            process = SessionService.create_process("Alice", 2, seed=seed, scenario=scenario)
+            rng = random.Random(seed)
+            for _ in range(100):
+                if process.is_finished():
+                    break
+                process.perform_action(random_policy(process, rng))
+            with self.subTest(seed=seed):
+                self.assertTrue(process.is_finished())
+
+    def test_invalid_scenarios_are_rejected(self) -> None:
+        windows = SHORT["calendar"]["revision_windows"]
+        cases = [
+            dict(SHORT, name=""),
+            dict(SHORT, name="default"),
+            dict(SHORT, extras={}),
+            dict(SHORT, themes=[]),
+            dict(SHORT, student={"stamina": 150}),
+            dict(SHORT, supervisors={"intelligence": [3, 1]}),
+            dict(SHORT, commission={"loyalty": [0, 2]}),
+            dict(SHORT, calendar={"revision_windows": windows[:2]}),
+            dict(SHORT, calendar={"revision_windows": [windows[1], windows[0], windows[2]]}),
+            dict(SHORT, calendar={"defense_days": [30]}),
+            dict(SHORT, calendar={"max_day": 20, "defense_days": [19, 20]}),
+            dict(SHORT, calendar={"max_day": 20, "defense_days": [20]}),
+            dict(SHORT, rules={"unknown": 1}),
+            dict(SHORT, rules={"attestation_quality_step": 0}),
+            dict(SHORT, actions={"sleep": {"stamina": 1}}),
+            dict(SHORT, actions={"rest": {"label": "Nap"}}),
+            dict(SHORT, actions={"rehearse": {"rehearse": 0}}),
+            dict(SHORT, actions={"work_thesis": {"completion": 5}}),
+        ]
+        for data in cases:
+            with self.subTest(data=data), self.assertRaises(ValueError):
+                parse_scenario(data)
+
+        broken = self.tmp_dir / "broken.toml"
+        broken.write_text("name = ", encoding="utf-8")
+        with self.assertRaises(ValueError):
+            load_scenario(broken)
+        with self.assertRaises(FileNotFoundError):
+            load_scenario(self.tmp_dir / "missing.toml")
+
+    def test_service_saves_and_checks_the_scenario(self) -> None:
+        scenario = parse_scenario(SHORT)
+        service = SessionService(self.tmp_dir, scenario=scenario)
+        service.start_new(slot=1, student_name="Alice", student_intelligence=2, seed=1)
+        service.perform_action("rest")
+
+        restored = SessionService(self.tmp_dir, scenario=scenario)
+        self.assertEqual(restored.load(1).get_status(), service.get_status())
+        self.assertIs(restored.get_calendar(), scenario.get_calendar())
+        with self.assertRaises(ValueError):
+            SessionService(self.tmp_dir).load(1)
+        with self.assertRaises(ValueError):
+            DefenseProcess.from_dict(SessionService.create_process("Bob", 2, seed=1).to_dict(), scenario)
+
+    def test_service_rejects_formats_that_cannot_store_a_scenario(self) -> None:
+        scenario = parse_scenario(SHORT)
+        for save_format in ("binary", "replay"):
+            with self.subTest(save_format=save_format), self.assertRaises(ValueError):
+                SessionService(self.tmp_dir, save_format=save_format, scenario=scenario)
+        storage = SqliteSlotStorage(self.tmp_dir / "saves.sqlite3")
+        try:
+            with self.assertRaises(ValueError):
+                SessionService(self.tmp_dir, storage=storage, scenario=scenario)
+            SessionService(self.tmp_dir, storage=storage, scenario=Scenario.default()).close()
+        finally:
+            storage.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
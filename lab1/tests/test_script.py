@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import io
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from application import SessionService
+from interfaces.script import run_actions, run_script
+
+
+def as_json(status: object) -> object:
+    return json.loads(json.dumps(dict(status)))
+
+
+class ScriptModeTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.service = SessionService(Path(self._tmp.name), autosave=False)
+        self.output = io.StringIO()
+
+    def tearDown(self) -> None:
+        self.service.close()
+        self._tmp.cleanup()
+
+    def records(self) -> list[dict[str, object]]:
+        return [json.loads(line) for line in self.output.getvalue().splitlines()]
+
+    def test_run_actions_emits_a_line_per_step(self) -> None:
+        self.service.start_new(slot=1, student_name="Alice", student_intelligence=2, seed=1)
+
+        ok = run_actions(self.service, ["work_thesis\n", "# comment\n", "\n", "rest\n"], self.output)
+
+        self.assertTrue(ok)
+        records = self.records()
+        self.assertEqual([record.get("action") for record in records], ["work_thesis", "rest", None])
+        self.assertEqual(records[1]["status"]["today"], 2)
+        self.assertEqual(records[-1]["steps"], 2)
+        self.assertEqual(records[-1]["status"], as_json(self.service.get_status()))
+
+    def test_unavailable_action_stops_with_error(self) -> None:
+        self.service.start_new(slot=1, student_name="Alice", student_intelligence=2, seed=1)
+
+        ok = run_actions(self.service, ["rest", "defense", "rest"], self.output, emit="final")
+
+        self.assertFalse(ok)
+        records = self.records()
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0]["steps"], 1)
+        self.assertIn("defense", records[0]["error"])
+
+    def test_run_script_runs_scenarios_back_to_back(self) -> None:
+        lines = [
+            json.dumps({"name": "A", "intelligence": 1, "seed": 1, "actions": ["work_thesis"]}),
+            "",
+            json.dumps({"name": "B", "intelligence": 3, "seed": 2, "actions": ["rest", "rest"]}),
+            "not json",
+            json.dumps({"name": "C", "seed": "x"}),
+        ]
+
+        failed = run_script(self.service, lines, self.output, emit="final", slot=4)
+
+        self.assertEqual(failed, 2)
+        records = self.records()
+        self.assertEqual([record["scenario"] for record in records], [1, 3, 4, 5])
+        self.assertEqual(records[0]["status"]["student_name"], "A")
+        self.assertEqual(records[1]["status"]["today"], 2)
+        self.assertIn("error", records[2])
+        self.assertEqual(records[3]["error"], "Seed must be an integer.")
+        self.assertEqual(self.service.load(4).get_status()["student_name"], "B")
+
+    def test_scripted_results_match_interactive_service(self) -> None:
+        actions = ["work_thesis", "rest", "work_thesis", "rest", "work_thesis"]
+        run_script(self.service, [json.dumps({"name": "A", "seed": 9, "actions": actions})], self.output)
+
+        reference = SessionService(Path(self._tmp.name) / "ref")
+        reference.start_new(slot=1, student_name="A", student_intelligence=2, seed=9)
+        for action in actions:
+            reference.perform_action(action)
+        self.assertEqual(self.records()[-1]["status"], as_json(reference.get_status()))
+
+    def test_unknown_emit_mode_is_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            run_script(self.service, [], self.output, emit="all")
+
+
+if __name__ == "__main__":
+    unittest.main()
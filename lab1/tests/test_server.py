@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from application import SessionService
+from interfaces.server import SessionServer
+
+
+class SessionServerTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.saves_dir = Path(self._tmp.name)
+        self.server = SessionServer(self.saves_dir, idle_timeout=0.05)
+        await self.server.start(port=0)
+        host, port = self.server.get_address()[:2]
+        self.reader, self.writer = await asyncio.open_connection(host, port)
+
+    async def asyncTearDown(self) -> None:
+        self.writer.close()
+        await self.writer.wait_closed()
+        await self.server.close()
+        self._tmp.cleanup()
+
+    async def request(self, **payload: object) -> dict[str, object]:
+        self.writer.write(json.dumps(payload).encode("utf-8") + b"\n")
+        await self.writer.drain()
+        return json.loads(await self.reader.readline())
+
+    async def test_session_lifecycle_over_socket(self) -> None:
+        started = await self.request(cmd="start", slot=1, name="Alice", intelligence=2, seed=5, id=7)
+        actions = await self.request(cmd="actions", slot=1)
+        performed = await self.request(cmd="perform", slot=1, action="rest")
+        status = await self.request(cmd="status", slot=1)
+
+        self.assertTrue(started["ok"])
+        self.assertEqual(started["id"], 7)
+        self.assertEqual(started["status"]["student_name"], "Alice")
+        self.assertEqual(actions["actions"], ["work_thesis", "rest", "send_review"])
+        self.assertEqual(performed["status"]["today"], 1)
+        self.assertEqual(status["status"], performed["status"])
+
+    async def test_errors_are_reported_without_closing_connection(self) -> None:
+        responses = [
+            await self.request(cmd="fly", slot=1),
+            await self.request(cmd="status", slot=42),
+            await self.request(cmd="start", slot=1, seed=1),
+            await self.request(cmd="perform", slot=1, action="defense"),
+        ]
+
+        self.assertEqual([response["ok"] for response in responses], [False, False, True, False])
+        self.writer.write(b"not json\n")
+        await self.writer.drain()
+        self.assertFalse(json.loads(await self.reader.readline())["ok"])
+
+    async def test_failed_start_does_not_hide_existing_save(self) -> None:
+        service = SessionService(self.saves_dir)
+        service.start_new(slot=5, student_name="Alice", student_intelligence=2, seed=1)
+        service.perform_action("rest")
+        service.close()
+
+        server = SessionServer(self.saves_dir)
+        try:
+            with self.assertRaises(ValueError):
+                await server.handle_request({"cmd": "start", "slot": 5, "intelligence": 7})
+            self.assertEqual(server.get_session_count(), 0)
+            status = await server.handle_request({"cmd": "status", "slot": 5})
+        finally:
+            await server.close()
+
+        self.assertEqual(status["status"]["today"], 1)
+
+    async def test_idle_sessions_are_evicted_to_disk(self) -> None:
+        await self.request(cmd="start", slot=2, name="Bob", seed=3)
+        await self.request(cmd="perform", slot=2, action="work_thesis")
+
+        await asyncio.sleep(0.2)
+
+        self.assertEqual(self.server.get_session_count(), 0)
+        service = SessionService(self.saves_dir)
+        service.load(2)
+        self.assertEqual(service.get_status()["today"], 1)
+        reloaded = await self.request(cmd="load", slot=2)
+        self.assertEqual(reloaded["status"]["today"], 1)
+
+    async def test_concurrent_clients_on_one_slot_are_serialized(self) -> None:
+        await self.request(cmd="start", slot=3, seed=1)
+
+        results = await asyncio.gather(*(
+            self.server.handle_request({"cmd": "perform", "slot": 3, "action": "rest"})
+            for _ in range(5)
+        ))
+
+        self.assertEqual(sorted(result["status"]["today"] for result in results), [1, 2, 3, 4, 5])
+
+
+if __name__ == "__main__":
+    unittest.main()
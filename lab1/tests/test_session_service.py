@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import os
 import sys
 import tempfile
 import unittest
@@ -91,6 +92,253 @@ class SessionServiceTests(unittest.TestCase):
         self.assertEqual(process_data["today"], 1)
         self.assertEqual(process_data["student"]["stamina"], 100)
 
+    def test_journal_mode_appends_instead_of_rewriting_snapshot(self) -> None:
+        service = SessionService(self.saves_dir, journal=True, snapshot_interval=10)
+        service.start_new(slot=1, student_name="Alice", student_intelligence=2, seed=123)
+
+        service.perform_action("rest")
+        service.perform_action("work_thesis")
+
+        payload = json.loads((self.saves_dir / "slot_1.json").read_text(encoding="utf-8"))
+        self.assertEqual(payload["process"]["today"], 0)
+        journal = (self.saves_dir / "slot_1.journal").read_text(encoding="utf-8")
+        self.assertEqual(len(journal.splitlines()), 2)
+        self.assertTrue(journal.startswith("rest 0 "))
+        service.close()
+
+    def test_load_replays_journal_tail(self) -> None:
+        service = SessionService(self.saves_dir, journal=True, snapshot_interval=10)
+        service.start_new(slot=1, student_name="Alice", student_intelligence=2, seed=123)
+        for action in ("rest", "work_thesis", "work_thesis"):
+            service.perform_action(action)
+        expected = service.get_status()
+
+        restored = SessionService(self.saves_dir, journal=True)
+        restored.load(1)
+
+        self.assertEqual(restored.get_status(), expected)
+        service.close()
+
+    def test_load_ignores_corrupted_journal_tail(self) -> None:
+        service = SessionService(self.saves_dir, journal=True, snapshot_interval=10)
+        service.start_new(slot=1, student_name="Alice", student_intelligence=2, seed=123)
+        service.perform_action("rest")
+        with (self.saves_dir / "slot_1.journal").open("a", encoding="utf-8") as journal:
+            journal.write("work_thesis 1 deadbeef\nwork_th")
+
+        restored = SessionService(self.saves_dir, journal=True)
+        restored.load(1)
+
+        self.assertEqual(restored.get_status()["today"], 1)
+        service.close()
+
+    def test_start_new_discards_journal_of_crashed_session(self) -> None:
+        crashed = SessionService(self.saves_dir, journal=True, snapshot_interval=10)
+        crashed.start_new(slot=1, student_name="Alice", student_intelligence=2, seed=123)
+        for action_code in ("work_thesis", "work_thesis", "rest"):
+            crashed.perform_action(action_code)
+        stale = (self.saves_dir / "slot_1.journal").read_text(encoding="utf-8")
+
+        service = SessionService(self.saves_dir, journal=True, snapshot_interval=10)
+        service.start_new(slot=1, student_name="Bob", student_intelligence=2, seed=7)
+        service.perform_action("rest")
+        service.perform_action("rest")
+        expected = service.get_status()
+
+        restored = SessionService(self.saves_dir, journal=True)
+        restored.load(1)
+        self.assertEqual((restored.get_status()["today"], restored.get_status()["score"]), (2, 18))
+        self.assertEqual(restored.get_status(), expected)
+        restored.close()
+
+        # Lines from another session fail the checksum even if they survive.
+        (self.saves_dir / "slot_1.journal").write_text(stale, encoding="utf-8")
+        restored = SessionService(self.saves_dir, journal=True)
+        restored.load(1)
+        self.assertEqual(restored.get_status()["today"], 2)
+        restored.close()
+        service.close()
+        # Only now release the crashed session's journal handle.
+        crashed.close()
+
+    def test_journal_snapshot_interval_compacts_log(self) -> None:
+        service = SessionService(self.saves_dir, journal=True, snapshot_interval=2)
+        service.start_new(slot=1, student_name="Alice", student_intelligence=2, seed=123)
+
+        service.perform_action("rest")
+        service.perform_action("rest")
+
+        payload = json.loads((self.saves_dir / "slot_1.json").read_text(encoding="utf-8"))
+        self.assertEqual(payload["process"]["today"], 2)
+        self.assertEqual((self.saves_dir / "slot_1.journal").read_text(encoding="utf-8"), "")
+        service.close()
+
+    def test_binary_format_round_trips_session(self) -> None:
+        service = SessionService(self.saves_dir, save_format="binary")
+        service.start_new(slot=1, student_name="Alice", student_intelligence=2, seed=123)
+        service.perform_action("work_thesis")
+
+        restored = SessionService(self.saves_dir)
+        restored.load(1)
+
+        self.assertTrue((self.saves_dir / "slot_1.dps").exists())
+        self.assertFalse((self.saves_dir / "slot_1.json").exists())
+        self.assertEqual(restored.get_status(), service.get_status())
+
+    def test_convert_slot_switches_format(self) -> None:
+        service = SessionService(self.saves_dir)
+        service.start_new(slot=1, student_name="Alice", student_intelligence=2, seed=123)
+        expected = service.get_status()
+
+        path = service.convert_slot(1, "binary")
+
+        self.assertEqual(path, self.saves_dir / "slot_1.dps")
+        self.assertFalse((self.saves_dir / "slot_1.json").exists())
+        restored = SessionService(self.saves_dir, save_format="binary")
+        restored.load(1)
+        self.assertEqual(restored.get_status(), expected)
+
+    def test_saving_in_another_format_replaces_the_old_file(self) -> None:
+        service = SessionService(self.saves_dir)
+        service.start_new(slot=1, student_name="Alice", student_intelligence=2, seed=123)
+        old_json = (self.saves_dir / "slot_1.json").read_bytes()
+
+        binary = SessionService(self.saves_dir, save_format="binary")
+        binary.load(1)
+        binary.perform_action("rest")
+        binary.perform_action("rest")
+
+        self.assertFalse((self.saves_dir / "slot_1.json").exists())
+        restored = SessionService(self.saves_dir)
+        self.assertEqual(restored.load(1).get_today(), 2)
+
+        # Directories written before this fix may hold both files; the newer wins.
+        (self.saves_dir / "slot_1.json").write_bytes(old_json)
+        os.utime(self.saves_dir / "slot_1.json", ns=(0, 0))
+        self.assertEqual(SessionService(self.saves_dir).load(1).get_today(), 2)
+
+    def test_unknown_save_format_raises(self) -> None:
+        with self.assertRaises(ValueError):
+            SessionService(self.saves_dir, save_format="xml")
+
+    def test_replay_format_round_trips_session(self) -> None:
+        service = SessionService(self.saves_dir, save_format="replay")
+        service.start_new(slot=1, student_name="Alice", student_intelligence=2, seed=123)
+        for action in ("work_thesis", "rest", "work_thesis"):
+            service.perform_action(action)
+
+        restored = SessionService(self.saves_dir, save_format="replay")
+        restored.load(1)
+
+        self.assertEqual(restored.get_status(), service.get_status())
+        self.assertEqual(restored.get_action_history(), ["work_thesis", "rest", "work_thesis"])
+        self.assertLess((self.saves_dir / "slot_1.dpr").stat().st_size, 64)
+
+    def test_journal_replay_extends_action_history(self) -> None:
+        service = SessionService(self.saves_dir, journal=True)
+        service.start_new(slot=1, student_name="Alice", student_intelligence=2, seed=123)
+        service.perform_action("rest")
+        service.perform_action("work_thesis")
+
+        restored = SessionService(self.saves_dir)
+        restored.load(1)
+
+        self.assertEqual(restored.get_action_history(), ["rest", "work_thesis"])
+        service.close()
+
+    def test_metrics_are_disabled_by_default(self) -> None:
+        service = SessionService(self.saves_dir)
+
+        self.assertIsNone(service.get_metrics())
+
+    def test_metrics_record_actions_and_io_phases(self) -> None:
+        service = SessionService(self.saves_dir, metrics=True)
+        service.start_new(slot=1, student_name="Alice", student_intelligence=2, seed=123)
+        service.perform_action("rest")
+        service.perform_action("work_thesis")
+        service.get_status()
+        service.load(1)
+
+        metrics = service.get_metrics()
+        self.assertEqual(metrics.get_histogram("action.rest").get_count(), 1)
+        self.assertEqual(metrics.get_histogram("action.work_thesis").get_count(), 1)
+        self.assertEqual(metrics.get_counter("calls.get_status"), 1)
+        for phase in ("save.total", "save.encode", "save.write", "save.replace"):
+            self.assertEqual(metrics.get_histogram(phase).get_count(), 3)
+        for phase in ("load.total", "load.read", "load.decode"):
+            self.assertEqual(metrics.get_histogram(phase).get_count(), 1)
+        self.assertIn("histogram save.encode count=3", metrics.to_text())
+
+    def test_action_history_requires_seeded_session(self) -> None:
+        service = SessionService(self.saves_dir)
+        service.start_new(slot=1, student_name="Alice", student_intelligence=2)
+
+        with self.assertRaises(RuntimeError):
+            service.get_action_history()
+
+    def test_undo_and_redo_restore_state_without_touching_disk(self) -> None:
+        service = SessionService(self.saves_dir)
+        service.start_new(slot=1, student_name="Alice", student_intelligence=2, seed=123)
+        service.perform_action("work_thesis")
+        before = service.get_status()
+        service.perform_action("rest")
+        after = service.get_status()
+        saved = (self.saves_dir / "slot_1.json").read_bytes()
+
+        service.undo()
+        self.assertEqual(service.get_status(), before)
+        service.redo()
+        self.assertEqual(service.get_status(), after)
+        service.undo()
+
+        self.assertEqual((self.saves_dir / "slot_1.json").read_bytes(), saved)
+        self.assertEqual(service.get_action_history(), ["work_thesis"])
+        service.close()
+        payload = json.loads((self.saves_dir / "slot_1.json").read_text(encoding="utf-8"))
+        self.assertEqual(payload["process"]["today"], 1)
+
+    def test_undo_history_is_bounded(self) -> None:
+        service = SessionService(self.saves_dir, history_size=3)
+        service.start_new(slot=1, student_name="Alice", student_intelligence=2, seed=123)
+        for _ in range(5):
+            service.perform_action("rest")
+
+        for _ in range(3):
+            service.undo()
+
+        self.assertFalse(service.can_undo())
+        self.assertEqual(service.get_status()["today"], 2)
+        with self.assertRaises(RuntimeError):
+            service.undo()
+
+    def test_new_action_clears_redo(self) -> None:
+        service = SessionService(self.saves_dir)
+        service.start_new(slot=1, student_name="Alice", student_intelligence=2, seed=123)
+        service.perform_action("rest")
+        service.undo()
+
+        service.perform_action("work_thesis")
+
+        self.assertFalse(service.can_redo())
+        with self.assertRaises(RuntimeError):
+            service.redo()
+
+    def test_undo_in_journal_mode_does_not_replay_undone_actions(self) -> None:
+        service = SessionService(self.saves_dir, journal=True)
+        service.start_new(slot=1, student_name="Alice", student_intelligence=2, seed=123)
+        service.perform_action("rest")
+        service.perform_action("rest")
+        service.undo()
+        service.perform_action("work_thesis")
+        expected = service.get_status()
+
+        restored = SessionService(self.saves_dir)
+        restored.load(1)
+
+        self.assertEqual(restored.get_status(), expected)
+        self.assertEqual(restored.get_action_history(), ["rest", "work_thesis"])
+        service.close()
+
 
 if __name__ == "__main__":
     unittest.main()
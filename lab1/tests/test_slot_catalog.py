@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import json
+import os
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from application import SessionService
+from domain import DefenseStage
+
+
+class SlotCatalogTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.saves_dir = Path(self._tmp.name)
+        service = SessionService(self.saves_dir)
+        for slot, (name, rests) in enumerate((("Alice", 0), ("Bob", 3), ("Carol", 1)), start=1):
+            service.start_new(slot=slot, student_name=name, student_intelligence=2, seed=slot)
+            for _ in range(rests):
+                service.perform_action("rest")
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_list_slots_reports_saved_sessions(self) -> None:
+        slots = SessionService(self.saves_dir).list_slots()
+
+        self.assertEqual([entry["slot"] for entry in slots], [1, 2, 3])
+        self.assertEqual([entry["student_name"] for entry in slots], ["Alice", "Bob", "Carol"])
+        self.assertEqual([entry["today"] for entry in slots], [0, 3, 1])
+        self.assertNotIn("mtime_ns", slots[0])
+
+    def test_query_slots_filters_and_sorts(self) -> None:
+        service = SessionService(self.saves_dir)
+
+        by_day = service.query_slots(min_day=1, sort_by="today", descending=True)
+        preparation = service.query_slots(stage=DefenseStage.PREPARATION, limit=1)
+
+        self.assertEqual([entry["slot"] for entry in by_day], [2, 3])
+        self.assertEqual([entry["slot"] for entry in preparation], [1])
+        with self.assertRaises(ValueError):
+            service.query_slots(sort_by="stamina")
+
+    def test_query_does_not_open_slot_files_when_catalog_is_fresh(self) -> None:
+        service = SessionService(self.saves_dir)
+        slot_path = self.saves_dir / "slot_1.json"
+        original = slot_path.read_bytes()
+        stat = slot_path.stat()
+        # Same size and mtime: only a stale catalog would re-read the file.
+        slot_path.write_bytes(original.replace(b"Alice", b"Zelda"))
+        os.utime(slot_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        self.assertEqual(service.list_slots()[0]["student_name"], "Alice")
+
+    def test_catalog_rebuilds_when_slot_files_change(self) -> None:
+        slot_path = self.saves_dir / "slot_2.json"
+        payload = json.loads(slot_path.read_text(encoding="utf-8"))
+        payload["process"]["student"]["name"] = "Robert"
+        slot_path.write_text(json.dumps(payload), encoding="utf-8")
+        (self.saves_dir / "slot_3.json").unlink()
+
+        slots = SessionService(self.saves_dir).list_slots()
+
+        self.assertEqual([entry["student_name"] for entry in slots], ["Alice", "Robert"])
+
+    def test_long_lived_catalog_sees_other_writers(self) -> None:
+        reader = SessionService(self.saves_dir)
+        # Old enough stamps are trusted, so only a real change forces a rescan.
+        past = time.time_ns() - 10 * 10**9
+        for path in (self.saves_dir, self.saves_dir / "catalog.jsonl"):
+            os.utime(path, ns=(past, past))
+        self.assertEqual([(entry["slot"], entry["today"]) for entry in reader.list_slots()], [(1, 0), (2, 3), (3, 1)])
+
+        writer = SessionService(self.saves_dir)
+        writer.start_new(slot=4, student_name="Dave", student_intelligence=2, seed=4)
+        writer.load(1)
+        writer.perform_action("rest")
+
+        self.assertEqual(
+            [(entry["slot"], entry["today"]) for entry in reader.list_slots()], [(1, 1), (2, 3), (3, 1), (4, 0)])
+
+    def test_catalog_rebuilds_from_scratch_when_missing(self) -> None:
+        (self.saves_dir / "catalog.jsonl").unlink()
+
+        slots = SessionService(self.saves_dir).list_slots()
+
+        self.assertEqual(len(slots), 3)
+        self.assertTrue((self.saves_dir / "catalog.jsonl").exists())
+
+    def test_catalog_is_compacted_as_it_grows(self) -> None:
+        service = SessionService(self.saves_dir)
+        for seed in range(100):
+            service.start_new(slot=1, student_name=f"Alice {seed}", student_intelligence=2, seed=seed)
+
+        lines = (self.saves_dir / "catalog.jsonl").read_text(encoding="utf-8").splitlines()
+        self.assertLessEqual(len(lines), 64)
+        self.assertEqual(SessionService(self.saves_dir).list_slots()[0]["student_name"], "Alice 99")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from application import FileSlotStorage, SessionService, SqliteSlotStorage
+
+
+class SqliteSlotStorageTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.saves_dir = Path(self._tmp.name)
+        self.db_path = self.saves_dir / "slots.db"
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_session_round_trips_through_sqlite(self) -> None:
+        storage = SqliteSlotStorage(self.db_path)
+        service = SessionService(self.saves_dir, storage=storage)
+        service.start_new(slot=1, student_name="Alice", student_intelligence=2, seed=123)
+        service.perform_action("work_thesis")
+        expected = service.get_status()
+        storage.close()
+
+        reopened = SqliteSlotStorage(self.db_path)
+        restored = SessionService(self.saves_dir, storage=reopened)
+        restored.load(1)
+
+        self.assertEqual(restored.get_status(), expected)
+        self.assertFalse(restored.has_save(2))
+        with self.assertRaises(FileNotFoundError):
+            restored.load(2)
+        reopened.close()
+
+    def test_pending_writes_are_visible_before_commit(self) -> None:
+        storage = SqliteSlotStorage(self.db_path, batch_size=1000)
+        service = SessionService(self.saves_dir, storage=storage)
+        service.start_new(slot=3, student_name="Alice", student_intelligence=2, seed=1)
+
+        self.assertTrue(storage.exists(3))
+        self.assertEqual(storage.read(3)["process"]["student"]["name"], "Alice")
+        storage.close()
+
+    def test_query_slots_matches_file_storage(self) -> None:
+        sqlite_storage = SqliteSlotStorage(self.db_path, batch_size=4)
+        file_storage = FileSlotStorage(self.saves_dir / "files")
+        for storage in (sqlite_storage, file_storage):
+            service = SessionService(self.saves_dir, storage=storage)
+            for slot in range(1, 8):
+                service.start_new(slot=slot, student_name=f"S{slot}", student_intelligence=2, seed=slot)
+                for _ in range(slot % 3):
+                    service.perform_action("rest")
+
+        for query in (
+            {},
+            {"min_day": 1, "sort_by": "today", "descending": True},
+            {"max_score": 9, "limit": 3},
+            {"stage": "Preparation", "sort_by": "stage"},
+        ):
+            with self.subTest(query=query):
+                self.assertEqual(sqlite_storage.query_slots(**query), file_storage.query_slots(**query))
+        sqlite_storage.close()
+
+    def test_concurrent_writers(self) -> None:
+        storage = SqliteSlotStorage(self.db_path, pool_size=4, batch_size=16)
+
+        def play(worker: int) -> None:
+            service = SessionService(self.saves_dir, storage=storage)
+            for slot in range(worker * 100 + 1, worker * 100 + 11):
+                service.start_new(slot=slot, student_name=f"W{worker}", student_intelligence=2, seed=slot)
+                service.perform_action("rest")
+
+        threads = [threading.Thread(target=play, args=(worker,)) for worker in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        slots = storage.list_slots()
+        self.assertEqual(len(slots), 80)
+        self.assertTrue(all(entry["today"] == 1 for entry in slots))
+        storage.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+
+# Headless startup imports ~100 ms of modules on a slow single-core runner;
+# pulling rich or the solver stack back in roughly doubles that.
+STARTUP_BUDGET_MS = 300
+
+
+class HeadlessStartupTests(unittest.TestCase):
+    def run_headless(self, saves_dir: str) -> tuple[list[str], list[str]]:
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", str(ROOT_DIR / "headless.py"),
+             "--saves-dir", saves_dir, "--emit", "final"],
+            input=b'{"seed": 1, "actions": ["work_thesis"]}\n',
+            capture_output=True,
+            check=True,
+        )
+        return (
+            result.stdout.decode("utf-8").splitlines(),
+            [line for line in result.stderr.decode("utf-8").splitlines() if line.startswith("import time:")],
+        )
+
+    def test_headless_run_stays_within_import_budget(self) -> None:
+        with tempfile.TemporaryDirectory() as saves_dir:
+            runs = [self.run_headless(saves_dir) for _ in range(3)]
+
+        output, imports = runs[0]
+        self.assertEqual(json.loads(output[-1])["status"]["today"], 1)
+
+        modules = {line.rsplit("|", 1)[1].strip() for line in imports}
+        self.assertFalse([module for module in modules if module.split(".")[0] == "rich"])
+        self.assertNotIn("application.batch_simulator", modules)
+
+        totals = []
+        for _, run_imports in runs:
+            # Only top-level rows; nested imports are indented under their parent.
+            totals.append(sum(
+                int(line.split("|")[1]) for line in run_imports
+                if line.split("|")[1].strip().isdigit() and not line.split("|")[2].startswith("  ")
+            ) / 1000)
+        self.assertLess(statistics.median(totals), STARTUP_BUDGET_MS)
+
+
+if __name__ == "__main__":
+    unittest.main()
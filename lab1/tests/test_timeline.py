@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import io
+import sys
+import unittest
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from domain import DefenseCalendar, DefenseStage
+from interfaces.timeline import Timeline
+
+from rich.console import Console
+
+
+class TimelineTests(unittest.TestCase):
+    def setUp(self) -> None:
+        Timeline.clear_cache()
+        self.console = Console(file=io.StringIO(), force_terminal=True, width=120)
+
+    def render(self, renderable: object) -> str:
+        with self.console.capture() as capture:
+            self.console.print(renderable)
+        return capture.get()
+
+    def test_cached_render_matches_direct_render(self) -> None:
+        for today in range(DefenseCalendar.MAX_DAY + 1):
+            self.assertEqual(self.render(Timeline(today)), self.render(Timeline.build(today)))
+
+    def test_repeated_days_hit_the_cache(self) -> None:
+        self.render(Timeline(3))
+        self.render(Timeline(3))
+        self.render(Timeline(4))
+
+        info = Timeline.cache_info()
+        self.assertEqual(info.misses, 2)
+        self.assertEqual(info.hits, 1)
+
+    def test_cache_is_bounded(self) -> None:
+        for width in (80, 100, 120):
+            console = Console(file=io.StringIO(), force_terminal=True, width=width)
+            for today in range(DefenseCalendar.MAX_DAY + 1):
+                console.print(Timeline(today))
+
+        self.assertEqual(Timeline.cache_info().currsize, Timeline.CACHE_SIZE)
+
+    def test_rejects_day_outside_calendar(self) -> None:
+        with self.assertRaises(ValueError):
+            Timeline(DefenseCalendar.MAX_DAY + 1)
+
+    def test_phase_boundaries_follow_calendar_transitions(self) -> None:
+        for phase in DefenseCalendar.get_phases():
+            if phase.stage == DefenseStage.REVISION:
+                stage = DefenseCalendar.next_stage(phase.start, DefenseStage.PREPARATION, [False] * 3, False)
+                self.assertEqual(stage, DefenseStage.REVISION)
+            if phase.stage == DefenseStage.DEFENSE:
+                stage = DefenseCalendar.next_stage(phase.start, DefenseStage.REHEARSAL, [True] * 3, False)
+                self.assertEqual(stage, DefenseStage.DEFENSE)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import random
+import sys
+import unittest
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is an optional dependency
+    np = None
+
+from application import SessionService
+from domain import DefenseProcess
+
+
+@unittest.skipUnless(np is not None, "numpy is not installed")
+class VectorizedDefenseTests(unittest.TestCase):
+    def setUp(self) -> None:
+        from domain.vectorized import VectorizedDefense
+
+        self.engine_cls = VectorizedDefense
+
+    def _make_processes(self, count: int) -> list[DefenseProcess]:
+        return [
+            SessionService.create_process(
+                student_name=f"Student {seed}",
+                student_intelligence=seed % 3 + 1,
+                seed=seed,
+            )
+            for seed in range(count)
+        ]
+
+    def test_initial_state_matches_scalar(self) -> None:
+        processes = self._make_processes(12)
+        engine = self.engine_cls(processes)
+
+        for idx, process in enumerate(processes):
+            self.assertEqual(engine.to_dict(idx), process.to_dict())
+            self.assertEqual(engine.get_status(idx), process.get_status())
+
+    def test_random_playthroughs_match_scalar_bit_for_bit(self) -> None:
+        processes = self._make_processes(300)
+        engine = self.engine_cls(processes)
+        rng = np.random.default_rng(2024)
+
+        while not engine.all_finished():
+            uniform = rng.random(len(engine))
+            engine.step(engine.pick_actions(uniform))
+            for idx, process in enumerate(processes):
+                if process.is_finished():
+                    continue
+                actions = process.get_available_actions()
+                process.perform_action(actions[int(uniform[idx] * len(actions))])
+
+        for idx, process in enumerate(processes):
+            self.assertEqual(engine.to_dict(idx), process.to_dict())
+
+    def test_every_action_matches_scalar_from_random_states(self) -> None:
+        rng = random.Random(7)
+        for _ in range(60):
+            process = self._make_processes(1)[0]
+            data = process.to_dict()
+            data["today"] = rng.randint(0, 25)
+            data["student"]["stamina"] = rng.randint(0, 100)
+            data["student"]["answer_skill"] = rng.randint(0, 3)
+            data["diploma_project"]["pct_complition"] = rng.choice([0, 34, 67, 100, rng.randint(0, 100)])
+            data["diploma_project"]["quality"] = rng.randint(0, 100)
+            data["presentation"]["pct_complition"] = rng.randint(0, 100)
+            data["revision_passed"] = [rng.random() < 0.5 for _ in range(3)]
+            data["defense_passed"] = rng.random() < 0.3
+
+            for stage in ("PREPARATION", "REVISION", "REHEARSAL", "DEFENSE", "ATTESTATION"):
+                data["stage"] = stage
+                for action in DefenseProcess.from_dict(data).get_available_actions():
+                    with self.subTest(stage=stage, action=action):
+                        scalar = DefenseProcess.from_dict(data)
+                        engine = self.engine_cls([scalar])
+                        scalar.perform_action(action)
+                        engine.step(np.array([self.engine_cls.ACTIONS.index(action)]))
+                        self.assertEqual(engine.to_dict(0), scalar.to_dict())
+
+    def test_step_rejects_unavailable_action(self) -> None:
+        engine = self.engine_cls(self._make_processes(2))
+        with self.assertRaises(ValueError):
+            engine.step(np.array([self.engine_cls.ATTESTATION_ACTION, self.engine_cls.REST]))
+
+
+if __name__ == "__main__":
+    unittest.main()
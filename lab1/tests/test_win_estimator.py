@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from application import BackgroundEstimator, SessionService, WinEstimator, greedy_policy, parse_scenario
+from application.win_estimator import wilson_interval
+
+
+def advance(process, days: int) -> None:
+    for _ in range(days):
+        process.perform_action(greedy_policy(process, None))
+
+
+class WinEstimatorTests(unittest.TestCase):
+    def test_wilson_interval(self) -> None:
+        low, high = wilson_interval(50, 100, 1.96)
+        self.assertAlmostEqual(low, 0.4038, places=4)
+        self.assertAlmostEqual(high, 0.5962, places=4)
+        self.assertEqual(wilson_interval(0, 100, 1.96)[0], 0.0)
+        self.assertEqual(wilson_interval(0, 0, 1.96), (0.0, 1.0))
+
+    def test_estimate_stops_once_interval_is_tight(self) -> None:
+        process = SessionService.create_process("Alice", 2, seed=1)
+        advance(process, 12)
+        before = process.to_dict()
+
+        with WinEstimator(max_workers=1, seed=3, margin=0.05) as estimator:
+            estimate = estimator.estimate(process)
+
+        low, high = estimate.get_interval()
+        self.assertLess(estimate.get_rollouts(), WinEstimator.DEFAULT_MAX_ROLLOUTS)
+        self.assertLessEqual(estimate.get_margin(), 0.05)
+        self.assertTrue(low <= estimate.get_defense_probability() <= high)
+        self.assertTrue(0 < estimate.get_defense_probability() < 1)
+        self.assertGreater(estimate.get_expected_grade(), 0)
+        self.assertEqual((estimate.get_day(), estimate.get_version()), (12, process.get_version()))
+        self.assertEqual(process.to_dict(), before)
+
+    def test_deterministic_policy_settles_after_min_rollouts(self) -> None:
+        process = SessionService.create_process("Alice", 3, seed=1)
+
+        with WinEstimator(policy=greedy_policy, max_workers=1, min_rollouts=100) as estimator:
+            estimate = estimator.estimate(process)
+
+        self.assertEqual(estimate.get_rollouts(), 100)
+        self.assertEqual(estimate.get_defense_probability(), 1.0)
+
+    def test_process_pool_matches_inline_run(self) -> None:
+        process = SessionService.create_process("Alice", 2, seed=5)
+        advance(process, 10)
+        kwargs = {"seed": 7, "max_rollouts": 400, "min_rollouts": 400, "batch_size": 50}
+
+        with WinEstimator(max_workers=1, **kwargs) as inline, WinEstimator(max_workers=2, **kwargs) as pooled:
+            expected = inline.estimate(process)
+            actual = pooled.estimate(process)
+
+        self.assertEqual(
+            (actual.get_defense_probability(), actual.get_expected_grade(), actual.get_rollouts()),
+            (expected.get_defense_probability(), expected.get_expected_grade(), expected.get_rollouts()),
+        )
+
+    def test_scenario_sessions_are_estimated_in_process(self) -> None:
+        scenario = parse_scenario({"name": "short", "student": {"stamina": 60}})
+        process = SessionService.create_process("Alice", 2, seed=1, scenario=scenario)
+
+        with WinEstimator(max_workers=2, max_rollouts=100, min_rollouts=100) as estimator:
+            self.assertEqual(estimator.estimate(process).get_rollouts(), 100)
+
+    def test_invalid_arguments_are_rejected(self) -> None:
+        for kwargs in ({"batch_size": 0}, {"min_rollouts": 0}, {"min_rollouts": 10, "max_rollouts": 5}, {"margin": 0}):
+            with self.subTest(kwargs=kwargs), self.assertRaises(ValueError):
+                WinEstimator(**kwargs)
+        process = SessionService.create_process("Alice", 3, seed=1)
+        while not process.is_finished():
+            process.perform_action(greedy_policy(process, None))
+        with self.assertRaises(ValueError):
+            WinEstimator(max_workers=1).estimate(process)
+
+
+class FailingEstimator(WinEstimator):
+    def estimate(self, process, cancel=None):
+        raise RuntimeError("rollout worker died")
+
+
+class BackgroundEstimatorTests(unittest.TestCase):
+    def test_request_returns_immediately_and_keeps_latest_state(self) -> None:
+        process = SessionService.create_process("Alice", 2, seed=1)
+        background = BackgroundEstimator(WinEstimator(max_workers=1, seed=1))
+        try:
+            background.request(process)
+            advance(process, 12)
+            background.request(process)
+            background.request(process)
+            estimate = background.wait(timeout=30)
+        finally:
+            background.close()
+
+        self.assertIsNotNone(estimate)
+        self.assertEqual(estimate.get_version(), process.get_version())
+        self.assertEqual(estimate.get_day(), 12)
+
+    def test_finished_estimate_is_pushed_to_the_callback(self) -> None:
+        process = SessionService.create_process("Alice", 2, seed=1)
+        done = threading.Event()
+        received = []
+        background = BackgroundEstimator(
+            WinEstimator(max_workers=1, seed=1), on_done=lambda estimate: (received.append(estimate), done.set()))
+        try:
+            background.request(process)
+            self.assertTrue(done.wait(timeout=30))
+        finally:
+            background.close()
+
+        self.assertEqual(received, [background.get_latest()])
+        self.assertEqual(received[0].get_version(), process.get_version())
+
+    def test_worker_errors_are_logged(self) -> None:
+        process = SessionService.create_process("Alice", 2, seed=1)
+        received = []
+        background = BackgroundEstimator(FailingEstimator(max_workers=1), on_done=received.append)
+        try:
+            with self.assertLogs("application.win_estimator", level="WARNING") as logs:
+                background.request(process)
+                background.wait(timeout=30)
+        finally:
+            background.close()
+
+        self.assertIn("rollout worker died", logs.output[0])
+        self.assertEqual(received, [])
+        self.assertIsNone(background.get_latest())
+
+    def test_service_estimates_only_when_enabled(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            service = SessionService(tmp_dir)
+            service.start_new(slot=1, student_name="Alice", student_intelligence=2, seed=1)
+            self.assertIsNone(service.get_estimate())
+            service.close()
+
+            service = SessionService(tmp_dir, estimate=True)
+            service.start_new(slot=1, student_name="Alice", student_intelligence=2, seed=1)
+            service.perform_action("work_thesis")
+            deadline = time.monotonic() + 30
+            estimate = service.get_estimate()
+            while (estimate is None or estimate.get_version() != service.get_version()) and time.monotonic() < deadline:
+                time.sleep(0.01)
+                estimate = service.get_estimate()
+            service.close()
+
+        self.assertEqual(estimate.get_day(), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()